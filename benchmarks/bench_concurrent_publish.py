@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Eşzamanlı yayınlama kıyaslaması
+
+Her biri yerel bir bare remote'a bağlı birden çok sentetik repository
+oluşturur ve publish_repository'yi aynı GitAuto sürecinde JobScheduler
+üzerinden önce sırayla, sonra eşzamanlı çalıştırır. Her remote'un son
+commit'inin yalnızca kendi repository'sinin dosyalarını ve commit mesajını
+içerdiği (karışma olmadığı) doğrulanır. Ağ ve arayüz gerekmez.
+
+Kullanım:
+    python benchmarks/bench_concurrent_publish.py [--repos 4] [--files 500] [--keep]
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_auto_gui import GitAutoGUI, GitRunner, JobScheduler, UIDispatcher
+
+
+def git(*args, cwd=None):
+    """Kurulum ve doğrulama için doğrudan git çağrısı"""
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return result.stdout
+
+
+class _Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class _HeadlessRoot:
+    """root.after çağrılarını yok sayar"""
+
+    def after(self, delay, callback=None, *args):
+        return None
+
+
+class HeadlessGitAuto(GitAutoGUI):
+    """Tk penceresi olmadan çalışan GitAuto; arayüz geri çağrıları kuyrukta kalır"""
+
+    def __init__(self, max_workers=4):
+        # GitAutoGUI.__init__ arayüzü kurar; burada yalnızca yayınlamanın ihtiyaçları hazırlanır
+        self.root = _HeadlessRoot()
+        self.current_directory = os.getcwd()
+        self.logs = []
+        self.git = GitRunner(log=self.log_message)
+        self.dispatcher = UIDispatcher(log=self.log_message)
+        self.scheduler = JobScheduler(max_workers=max_workers, post=self.dispatcher.post,
+                                      log=self.log_message)
+
+    def log_message(self, message):
+        self.logs.append(message)
+
+
+def build_repo(workdir, index):
+    """Bare remote'a ilk commit'i gönderilmiş, yayınlanmayı bekleyen dosyaları olan repository"""
+    repo = os.path.join(workdir, f"repo{index}")
+    remote = os.path.join(workdir, f"remote{index}.git")
+    git("init", "-q", "--bare", "-b", "main", remote)
+    git("init", "-q", "-b", "main", repo)
+    with open(os.path.join(repo, "README.md"), "w", encoding="utf-8") as f:
+        f.write(f"# repo{index}\n")
+    git("add", "README.md", cwd=repo)
+    git("-c", "user.name=bench", "-c", "user.email=bench@example.com",
+        "commit", "-q", "-m", "init", cwd=repo)
+    git("remote", "add", "origin", remote, cwd=repo)
+    git("push", "-q", "origin", "main", cwd=repo)
+    return repo, remote
+
+
+def add_round_files(repo, index, round_name, file_count):
+    """Repository'ye bu tura ait, adı repository'ye özgü dosyalar ekle"""
+    folder = os.path.join(repo, round_name)
+    os.makedirs(folder, exist_ok=True)
+    for number in range(file_count):
+        with open(os.path.join(folder, f"repo{index}_file{number}.txt"), "w", encoding="utf-8") as f:
+            f.write(f"repo{index} {round_name} {number}\n")
+
+
+def settings_for(index, round_name):
+    return {
+        "project_name": f"repo{index}",
+        "github_username": "bench",
+        "commit_message": f"publish repo{index} {round_name}",
+        "target_branch": "main",
+        "readme_choice": "keep",
+    }
+
+
+def publish_all(app, repos, round_name, concurrent):
+    """Tüm repository'leri yayınla; eşzamanlı değilse biri bitmeden diğeri başlamaz"""
+    started = time.perf_counter()
+    jobs = []
+    for index, (repo, _) in enumerate(repos):
+        job = app.run_in_background(app.publish_repository, repo, settings_for(index, round_name),
+                                    key=("publish", repo), repo=repo, mutating=True)
+        jobs.append(job)
+        if not concurrent:
+            wait_for(jobs)
+    wait_for(jobs)
+    return time.perf_counter() - started
+
+
+def wait_for(jobs, timeout=600):
+    deadline = time.monotonic() + timeout
+    while any(job.state in ("queued", "running") for job in jobs):
+        if time.monotonic() > deadline:
+            raise RuntimeError("Yayınlama zaman aşımına uğradı")
+        time.sleep(0.01)
+
+
+def verify(repos, round_name):
+    """Her remote'un son commit'i yalnızca kendi dosyalarını ve mesajını içermeli"""
+    problems = []
+    for index, (_, remote) in enumerate(repos):
+        message = git("--git-dir", remote, "log", "-1", "--format=%s", "main").strip()
+        if message != f"publish repo{index} {round_name}":
+            problems.append(f"remote{index}: beklenmeyen commit mesajı {message!r}")
+        names = git("--git-dir", remote, "ls-tree", "-r", "--name-only", "main").split()
+        foreign = [name for name in names
+                   if name.startswith(("seq/", "par/")) and not os.path.basename(name).startswith(f"repo{index}_")]
+        if foreign:
+            problems.append(f"remote{index}: başka repository dosyaları: {foreign[:3]}")
+        if not any(name.startswith(f"{round_name}/") for name in names):
+            problems.append(f"remote{index}: {round_name} dosyaları yayınlanmamış")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Eşzamanlı yayınlama kıyaslaması")
+    parser.add_argument("--repos", type=int, default=4)
+    parser.add_argument("--files", type=int, default=500, help="tur başına repository dosya sayısı")
+    parser.add_argument("--keep", action="store_true", help="geçici repository'leri silme")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="gitauto-publish-")
+    app = HeadlessGitAuto(max_workers=args.repos)
+    try:
+        repos = [build_repo(workdir, index) for index in range(args.repos)]
+
+        for index, (repo, _) in enumerate(repos):
+            add_round_files(repo, index, "seq", args.files)
+        sequential = publish_all(app, repos, "seq", concurrent=False)
+        problems = verify(repos, "seq")
+
+        for index, (repo, _) in enumerate(repos):
+            add_round_files(repo, index, "par", args.files)
+        concurrent = publish_all(app, repos, "par", concurrent=True)
+        problems += verify(repos, "par")
+
+        errors = [line for line in app.logs if line.startswith("❌")]
+        print(f"{args.repos} repository, tur başına {args.files} dosya\n")
+        print(f"{'mod':<12} {'süre (s)':>10}")
+        print(f"{'sıralı':<12} {sequential:>10.2f}")
+        print(f"{'eşzamanlı':<12} {concurrent:>10.2f}")
+        print(f"\nHızlanma: {sequential / concurrent:.2f}x")
+        print(f"Zamanlayıcı: {app.scheduler.stats()}")
+        for line in errors + problems:
+            print(f"❌ {line}")
+        print("✅ Karışma yok" if not (errors or problems) else "❌ Doğrulama başarısız")
+        return 1 if errors or problems else 0
+    finally:
+        if args.keep:
+            print(f"Repository'ler: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Dosya envanteri bellek kıyaslaması
+
+Sentetik bir klasör ağacı için eski dict tabanlı dosya bilgilerini
+(name/path/size/extension) __slots__ kullanan FileRecord kayıtlarıyla
+tracemalloc üzerinden karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_inventory.py [--files 500000] [--per-dir 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_auto_gui import FileRecord, record_directory
+
+EXTENSIONS = ['.py', '.js', '.ts', '.json', '.md', '.txt', '.css', '.html']
+
+
+def synthetic_tree(total_files, per_dir):
+    """(posix klasör, dosya adı, boyut) üçlüleri üret"""
+    for index in range(total_files):
+        dir_index = index // per_dir
+        rel_dir = f"src/pkg{dir_index % 97}/module{dir_index}"
+        name = f"file_{index}{EXTENSIONS[index % len(EXTENSIONS)]}"
+        yield rel_dir, name, 1000 + index % 4096
+
+
+def build_legacy(tree):
+    """Eski yöntem: her dosya için yolu kopyalayan bir dict"""
+    inventory = []
+    for rel_dir, name, size in tree:
+        rel_path = rel_dir.replace('/', os.sep)
+        inventory.append({
+            "name": name,
+            "path": os.path.join(rel_path, name),
+            "size": size,
+            "extension": os.path.splitext(name)[1]
+        })
+    return inventory
+
+
+def build_records(tree):
+    """Yeni yöntem: klasör yolu paylaşılan FileRecord kayıtları"""
+    inventory = []
+    last_dir = None
+    directory = ''
+    for rel_dir, name, size in tree:
+        if rel_dir != last_dir:
+            last_dir = rel_dir
+            directory = record_directory(rel_dir)
+        inventory.append(FileRecord(directory, name, size))
+    return inventory
+
+
+def measure(builder, total_files, per_dir):
+    """Envanteri kur, süreyi ve canlı bellek kullanımını ölç"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    inventory = builder(synthetic_tree(total_files, per_dir))
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del inventory
+    return elapsed, current, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dosya envanteri bellek kıyaslaması")
+    parser.add_argument("--files", type=int, default=500000)
+    parser.add_argument("--per-dir", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{args.files} dosya, klasör başına {args.per_dir} dosya\n")
+    print(f"{'yöntem':<12} {'süre (s)':>10} {'bellek (MB)':>12} {'tepe (MB)':>10} {'bayt/dosya':>11}")
+    results = {}
+    for label, builder in (("dict", build_legacy), ("FileRecord", build_records)):
+        elapsed, current, peak = measure(builder, args.files, args.per_dir)
+        results[label] = current
+        print(f"{label:<12} {elapsed:>10.2f} {current / 1e6:>12.1f} {peak / 1e6:>10.1f} "
+              f"{current / args.files:>11.0f}")
+
+    print(f"\nBellek oranı: {results['dict'] / results['FileRecord']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
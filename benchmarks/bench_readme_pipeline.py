@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Uçtan uca README boru hattı kıyaslaması
+
+Sentetik projeler (varsayılan 1k, 10k ve 100k dosya) oluşturur ve
+create_ai_readme_worker -> analyze_project_for_ai -> call_gemini_api akışını
+yerel Gemini taklit sunucusuna karşı arayüzsüz çalıştırır. Her aşamanın
+süresini (analiz, istem, üretim, yazma) raporlar; ağ ve API anahtarı
+gerekmez. Varsayılan olarak hız sınırlayıcı devre dışıdır; --default-limiter
+ile uygulamanın varsayılan Gemini hız sınırıyla (GITAUTO_GEMINI_RPM) ölçülür.
+
+Kullanım:
+    python benchmarks/bench_readme_pipeline.py [--sizes 1000,10000,100000]
+        [--latency 0.3] [--sectioned] [--warm] [--default-limiter] [--keep]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Kıyaslama kullanıcının önbelleğini kirletmesin; istenmedikçe hız sınırı ölçümü bozmasın
+# (sınırlayıcı modül yüklenirken kurulduğu için bayrak argparse'tan önce okunur)
+os.environ.setdefault("GITAUTO_CACHE_DIR", tempfile.mkdtemp(prefix="gitauto-bench-cache-"))
+if "--default-limiter" not in sys.argv:
+    os.environ.setdefault("GITAUTO_GEMINI_RPM", "1000000")
+
+from git_auto_gui import GEMINI_RATE_LIMITER, GitAutoGUI, UIDispatcher
+from gemini_stub_server import GeminiStubServer
+
+PY_TEMPLATE = '''"""Modül {index}"""
+import os
+from collections import OrderedDict
+
+MAX_ITEMS_{index} = {index}
+
+
+class Service{index}:
+    """Örnek servis"""
+
+    def run_{index}(self, value):
+        # Değeri işle
+        return OrderedDict(value=value)
+
+
+def helper_{index}(path):
+    return os.path.basename(path)
+'''
+
+JS_TEMPLATE = '''import React from 'react';
+const express = require('express');
+
+export class Widget{index} {{
+  render() {{ return null; }}
+}}
+
+function handler{index}(req, res) {{
+  // İsteği yanıtla
+  res.send('ok');
+}}
+'''
+
+
+def build_synthetic_repo(directory, file_count, per_dir=40):
+    """file_count dosyalı, iç içe klasörlü sentetik proje oluştur"""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "requirements.txt"), "w", encoding="utf-8") as f:
+        f.write("flask>=2.0\nrequests>=2.31.0\npandas\n")
+    with open(os.path.join(directory, "package.json"), "w", encoding="utf-8") as f:
+        f.write('{"name": "bench", "dependencies": {"react": "^18.0.0", "express": "^4.0.0"}}\n')
+
+    for index in range(file_count):
+        folder = os.path.join(directory, f"pkg{index // (per_dir * 20)}", f"mod{index // per_dir}")
+        if index % per_dir == 0:
+            os.makedirs(folder, exist_ok=True)
+        kind = index % 4
+        if kind == 0 or kind == 1:
+            name, content = f"module_{index}.py", PY_TEMPLATE.format(index=index)
+        elif kind == 2:
+            name, content = f"widget_{index}.js", JS_TEMPLATE.format(index=index)
+        else:
+            name, content = f"notes_{index}.md", f"# Not {index}\n\nAçıklama metni.\n"
+        with open(os.path.join(folder, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+class _Var:
+    def __init__(self, value=""):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class _HeadlessRoot:
+    """root.after çağrılarını yok sayar"""
+
+    def after(self, delay, callback=None, *args):
+        return None
+
+
+class HeadlessGitAuto(GitAutoGUI):
+    """Tk penceresi olmadan çalışan, aşama sürelerini ölçen GitAuto"""
+
+    def __init__(self, directory, base_url, project_name="bench"):
+        # GitAutoGUI.__init__ arayüzü kurar; burada yalnızca boru hattının ihtiyaçları hazırlanır
+        self.root = _HeadlessRoot()
+        # Dispatcher başlatılmaz; arayüz geri çağrıları kuyrukta kalır
+        self.dispatcher = UIDispatcher(log=self.log_message)
+        self.current_directory = directory
+        self.project_name = _Var(project_name)
+        self.gemini_base_url = base_url
+        self.logs = []
+        self.timings = {}
+        self.first_token = None
+
+    def log_message(self, message):
+        self.logs.append(message)
+
+    def _timed(self, phase, func, *args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.timings[phase] = self.timings.get(phase, 0.0) + time.perf_counter() - started
+
+    def analyze_project_for_ai(self, repo_dir=None, project_name=None):
+        return self._timed("analiz", super().analyze_project_for_ai, repo_dir, project_name)
+
+    def build_readme_prompt(self, project_analysis, instructions=None):
+        return self._timed("istem", super().build_readme_prompt, project_analysis, instructions)
+
+    def call_gemini_api(self, api_key, project_analysis, force=False, on_text=None, sectioned=False,
+                        cancel_event=None):
+        started = time.perf_counter()
+
+        def first(text):
+            if self.first_token is None:
+                self.first_token = time.perf_counter() - started
+
+        return self._timed("üretim", super().call_gemini_api, api_key, project_analysis,
+                           force=force, on_text=first, sectioned=sectioned, cancel_event=cancel_event)
+
+
+def run_pipeline(directory, base_url, sectioned=False, response_cache=False):
+    """create_ai_readme_worker'ı bir kez çalıştır ve aşama sürelerini döndür"""
+    app = HeadlessGitAuto(directory, base_url)
+    app.response_cache_enabled = response_cache
+    started = time.perf_counter()
+    app.create_ai_readme_worker("bench-key", force=not response_cache, sectioned=sectioned)
+    total = time.perf_counter() - started
+
+    errors = [line for line in app.logs if line.startswith("❌")]
+    if errors:
+        raise RuntimeError(errors[0])
+    timings = dict(app.timings)
+    # İstem oluşturma üretim çağrısının içinde ölçülür; ayrı gösterilir
+    timings["üretim"] = timings.get("üretim", 0.0) - timings.get("istem", 0.0)
+    timings["yazma/diğer"] = total - sum(timings.values())
+    timings["ilk token"] = app.first_token or 0.0
+    timings["toplam"] = total
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uçtan uca README boru hattı kıyaslaması")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="virgülle ayrılmış dosya sayıları")
+    parser.add_argument("--latency", type=float, default=0.3, help="taklit sunucu gecikmesi (sn)")
+    parser.add_argument("--chunk-delay", type=float, default=0.01)
+    parser.add_argument("--sectioned", action="store_true", help="paralel bölüm modunu kullan")
+    parser.add_argument("--warm", action="store_true", help="analiz önbelleği ısındıktan sonra tekrar ölç")
+    parser.add_argument("--default-limiter", action="store_true",
+                        help="varsayılan Gemini hız sınırıyla ölç (ilk üretim dolu kovayla başlar)")
+    parser.add_argument("--keep", action="store_true", help="sentetik projeleri silme")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    workdir = tempfile.mkdtemp(prefix="gitauto-bench-")
+    phases = ["analiz", "istem", "üretim", "ilk token", "yazma/diğer", "toplam"]
+
+    with GeminiStubServer(latency=args.latency, chunk_delay=args.chunk_delay) as server:
+        limiter = (f"{GEMINI_RATE_LIMITER.rate * 60:g}/dk, kova {GEMINI_RATE_LIMITER.capacity:g}"
+                   if args.default_limiter else "kapalı")
+        print(f"Sunucu: {server.base_url}  mod: {'paralel bölüm' if args.sectioned else 'akış'}  "
+              f"hız sınırı: {limiter}\n")
+        print(f"{'dosya':>8} {'tur':<6}" + "".join(f"{phase:>13}" for phase in phases))
+        try:
+            for size in sizes:
+                directory = os.path.join(workdir, f"repo_{size}")
+                started = time.perf_counter()
+                build_synthetic_repo(directory, size)
+                print(f"{size:>8} {'kurulum':<6}{time.perf_counter() - started:>13.2f}")
+
+                runs = ["soğuk", "ılık"] if args.warm else ["soğuk"]
+                for run in runs:
+                    timings = run_pipeline(directory, server.base_url, sectioned=args.sectioned)
+                    print(f"{size:>8} {run:<6}" + "".join(f"{timings[phase]:>13.2f}" for phase in phases))
+                if not args.keep:
+                    shutil.rmtree(directory, ignore_errors=True)
+        finally:
+            if not args.keep:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+        print(f"\nSunucu istatistikleri: {server.stats}")
+        if args.keep:
+            print(f"Sentetik projeler: {workdir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tek geçişli sembol tarayıcısı mikro kıyaslaması
+
+Büyük sentetik Python, JavaScript ve Java dosyalarında yeni tek geçişli
+tarayıcıyı (extract_code_symbols) eski çok geçişli re.findall koduyla karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_scanner.py [--lines 200000] [--repeat 3]
+"""
+
+import argparse
+import gc
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from git_auto_gui import extract_code_symbols
+
+
+def legacy_extract_code_symbols(content, extension):
+    """Eski çok geçişli çıkarım (her sembol türü için ayrı re.findall)"""
+    analysis = {
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "variables": [],
+        "comments": []
+    }
+    
+    if extension == '.py':
+        # Python DETAYLI analizi
+        # Import satırları
+        imports = re.findall(r'^(?:from|import)\s+([\w\s,\.]+)', content, re.MULTILINE)
+        analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'^def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content, re.MULTILINE)
+        analysis["functions"] = functions
+        
+        # Class tanımları
+        classes = re.findall(r'^class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\(|:)', content, re.MULTILINE)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'#\s*(.+)', content)
+        analysis["comments"] = [comment.strip() for comment in comments if len(comment.strip()) > 10]
+        
+    elif extension in ['.js', '.ts', '.jsx', '.tsx']:
+        # JavaScript/TypeScript DETAYLI analizi
+        # Import/require satırları
+        imports = re.findall(r'^(?:import|require|from)\s+([\w\s,\.\{\}]+)', content, re.MULTILINE)
+        analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)|const\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\(|let\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\()', content)
+        # Regex gruplarından fonksiyon adlarını çıkar
+        func_names = []
+        for match in functions:
+            func_names.extend([name for name in match if name])
+        analysis["functions"] = func_names
+        
+        # Class tanımları
+        classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^(?:const|let|var)\s+([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+        
+    elif extension == '.java':
+        # Java DETAYLI analizi
+        # Import satırları
+        imports = re.findall(r'^import\s+([\w\.]+)', content, re.MULTILINE)
+        analysis["imports"] = imports
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'(?:public|private|protected|static)?\s*(?:final)?\s*(?:[a-zA-Z<>\[\]]+)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
+        analysis["functions"] = functions
+        
+        # Class tanımları
+        classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^(?:public|private|protected|static)?\s*(?:final)?\s*(?:[a-zA-Z<>\[\]]+)\s+([A-Z_][A-Z0-9_]*)\s*;', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+        
+    elif extension == '.cpp':
+        # C++ DETAYLI analizi
+        # Include satırları
+        imports = re.findall(r'^#include\s+[<"]([^>"]+)[>"]', content, re.MULTILINE)
+        analysis["imports"] = imports
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'([a-zA-Z_][a-zA-Z0-9_]*)\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{', content)
+        analysis["functions"] = functions
+        
+        # Class tanımları
+        classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\{|:)', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^(?:int|double|float|string|char|bool)\s+([A-Z_][A-Z0-9_]*)\s*;', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+        
+    elif extension == '.php':
+        # PHP DETAYLI analizi
+        # Use satırları
+        imports = re.findall(r'^use\s+([\w\\]+)', content, re.MULTILINE)
+        analysis["imports"] = imports
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
+        analysis["functions"] = functions
+        
+        # Class tanımları
+        classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^\$([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|#\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+            if comment[2]:
+                analysis["comments"].append(comment[2].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+        
+    elif extension == '.go':
+        # Go DETAYLI analizi
+        # Import satırları
+        imports = re.findall(r'^import\s+([\w\s"\.]+)', content, re.MULTILINE)
+        analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'func\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
+        analysis["functions"] = functions
+        
+        # Struct tanımları
+        classes = re.findall(r'type\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+struct', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^var\s+([A-Z_][A-Z0-9_]*)\s*', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+        
+    elif extension == '.rs':
+        # Rust DETAYLI analizi
+        # Use satırları
+        imports = re.findall(r'^use\s+([\w\s:]+)', content, re.MULTILINE)
+        analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
+        
+        # Fonksiyon tanımları
+        functions = re.findall(r'fn\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
+        analysis["functions"] = functions
+        
+        # Struct tanımları
+        classes = re.findall(r'struct\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{', content)
+        analysis["classes"] = classes
+        
+        # Önemli değişkenler
+        variables = re.findall(r'^let\s+([A-Z_][A-Z0-9_]*)\s*:', content, re.MULTILINE)
+        analysis["variables"] = [var for var in variables if len(var) > 2]
+        
+        # Yorumlar
+        comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
+        analysis["comments"] = []
+        for comment in comments:
+            if comment[0]:
+                analysis["comments"].append(comment[0].strip())
+            if comment[1]:
+                analysis["comments"].append(comment[1].strip())
+        analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
+    
+    return analysis
+
+
+SAMPLES = {
+    '.py': [
+        "import os, sys",
+        "from collections import OrderedDict",
+        "MAX_RETRIES = 5",
+        "def handler_{i}(request):",
+        "    # isteği doğrula ve yanıt üret",
+        "    value = request.get('key')  # kısa",
+        "    return value",
+        "class Model{i}(Base):",
+        "    pass",
+    ],
+    '.js': [
+        "import React from 'react'",
+        "const API_URL = 'https://example.com/api';",
+        "const fetchItem{i} = (id) => fetch(API_URL + id);",
+        "// öğeyi önbellekten oku ya da getir",
+        "export function render{i}(props) {{",
+        "  let total = (props.count || 0);",
+        "  return total;",
+        "}}",
+        "class Widget{i} extends Component {{}}",
+        "/* blok yorum: bileşen tanımı */",
+    ],
+    '.java': [
+        "import java.util.List;",
+        "public class Service{i} {{",
+        "    private static final int MAX_SIZE;",
+        "    // servis çağrısını yürüt",
+        "    public List<String> execute{i}(String input) {{",
+        "        return helper(input);",
+        "    }}",
+        "    /* yardımcı metot */",
+        "}}",
+    ],
+}
+
+
+def build_source(extension, lines):
+    """Yaklaşık `lines` satırlık sentetik kaynak üret"""
+    template = SAMPLES[extension]
+    out = []
+    i = 0
+    while len(out) < lines:
+        out.extend(line.format(i=i) for line in template)
+        i += 1
+    return "\n".join(out[:lines]) + "\n"
+
+
+def best_time(func, content, extension, repeat):
+    # timeit gibi ölçüm sırasında GC kapalı; büyük sonuç listeleri aksi halde gürültü katıyor
+    best = None
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = func(content, extension)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tek geçişli tarayıcı kıyaslaması")
+    parser.add_argument("--lines", type=int, default=200000, help="dosya başına satır sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="tekrar sayısı (en iyisi raporlanır)")
+    args = parser.parse_args()
+
+    print(f"{'dil':<6} {'boyut':>9} {'çok geçiş':>11} {'tek geçiş':>11} {'hızlanma':>9}  semboller (eski/yeni)")
+    for extension in SAMPLES:
+        content = build_source(extension, args.lines)
+        old_time, old_result = best_time(legacy_extract_code_symbols, content, extension, args.repeat)
+        new_time, new_result = best_time(extract_code_symbols, content, extension, args.repeat)
+        old_count = sum(len(v) for v in old_result.values())
+        new_count = sum(len(v) for v in new_result.values())
+        size_mb = len(content.encode("utf-8")) / (1024 * 1024)
+        print(f"{extension:<6} {size_mb:>7.1f}MB {old_time:>10.3f}s {new_time:>10.3f}s "
+              f"{old_time / new_time:>8.2f}x  {old_count}/{new_count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Yerel Gemini sunucusu (test ve kıyaslama için)
+
+generateContent ve streamGenerateContent (?alt=sse) uç noktalarını Gemini
+yanıt biçimiyle taklit eder. Gecikme, hata oranı, hız sınırı (429 +
+Retry-After) ve akış parça aralığı ayarlanabilir. GitAuto'yu bu sunucuya
+yönlendirmek için:
+
+    python benchmarks/gemini_stub_server.py --port 8765 --latency 0.5
+    GITAUTO_GEMINI_BASE_URL=http://127.0.0.1:8765/v1 python git_auto_gui.py
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+_PATH_RE = re.compile(r"^/(?P<version>[^/]+)/models/(?P<model>[^/:]+):(?P<method>\w+)$")
+
+
+class GeminiStubServer:
+    """Arka plan thread'inde çalışan Gemini taklit sunucusu
+
+    latency: ilk bayta kadar bekleme (sn)
+    chunk_delay: akışta parçalar arası bekleme (sn)
+    error_rate: rastgele 503 döndürme olasılığı
+    rate_limit_every: her N. istekte 429 + Retry-After (0 = kapalı)
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.0, chunk_delay=0.02,
+                 error_rate=0.0, rate_limit_every=0, retry_after=1, chunk_chars=64,
+                 response_chars=4000, seed=None):
+        self.latency = latency
+        self.chunk_delay = chunk_delay
+        self.error_rate = error_rate
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+        self.chunk_chars = chunk_chars
+        self.response_chars = response_chars
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.stats = {"ok": 0, "errors": 0, "rate_limited": 0, "streamed": 0}
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def make_text(self, prompt):
+        """İstemden türetilen, yaklaşık response_chars uzunluğunda markdown"""
+        match = re.search(r"şu bölümünü yaz: (.+)", prompt)
+        title = match.group(1).strip() if match else "Proje"
+        line = f"- {title} için örnek içerik satırı; istem {len(prompt)} karakter.\n"
+        body = line * max(1, self.response_chars // len(line))
+        return f"## {title}\n\n{body}"
+
+    def _next_outcome(self):
+        with self._lock:
+            self.requests += 1
+            count = self.requests
+            if self.rate_limit_every and count % self.rate_limit_every == 0:
+                self.stats["rate_limited"] += 1
+                return "rate_limited"
+            if self.error_rate and self.random.random() < self.error_rate:
+                self.stats["errors"] += 1
+                return "error"
+            self.stats["ok"] += 1
+            return "ok"
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, payload, headers=None):
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=UTF-8")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _write_chunk(self, data):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+
+            def do_POST(self):
+                url = urlparse(self.path)
+                match = _PATH_RE.match(url.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    payload = json.loads(self.rfile.read(length) or b"{}")
+                    prompt = payload["contents"][0]["parts"][0]["text"]
+                except (ValueError, KeyError, IndexError):
+                    self._send_json(400, {"error": {"code": 400, "message": "Geçersiz istek"}})
+                    return
+                if not match or match.group("method") not in ("generateContent", "streamGenerateContent"):
+                    self._send_json(404, {"error": {"code": 404, "message": "Bilinmeyen uç nokta"}})
+                    return
+
+                outcome = server._next_outcome()
+                if server.latency:
+                    time.sleep(server.latency)
+                if outcome == "rate_limited":
+                    self._send_json(429, {"error": {"code": 429, "message": "Kota aşıldı"}},
+                                    {"Retry-After": str(server.retry_after)})
+                    return
+                if outcome == "error":
+                    self._send_json(503, {"error": {"code": 503, "message": "Geçici hata"}})
+                    return
+
+                text = server.make_text(prompt)
+                if match.group("method") == "generateContent":
+                    self._send_json(200, {"candidates": [{"content": {"parts": [{"text": text}]}}]})
+                    return
+
+                # Sunucu gönderimli olaylar (SSE), chunked aktarımla
+                alt = parse_qs(url.query).get("alt", [""])[0]
+                with server._lock:
+                    server.stats["streamed"] += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream" if alt == "sse" else "application/json")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                for start in range(0, len(text), server.chunk_chars):
+                    piece = text[start:start + server.chunk_chars]
+                    event = {"candidates": [{"content": {"parts": [{"text": piece}]}}]}
+                    self._write_chunk(f"data: {json.dumps(event, ensure_ascii=False)}\r\n\r\n".encode("utf-8"))
+                    if server.chunk_delay:
+                        time.sleep(server.chunk_delay)
+                self.wfile.write(b"0\r\n\r\n")
+                self.wfile.flush()
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Yerel Gemini taklit sunucusu")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.3, help="ilk bayta kadar gecikme (sn)")
+    parser.add_argument("--chunk-delay", type=float, default=0.02, help="akış parçaları arası gecikme (sn)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="503 döndürme olasılığı")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="her N. istekte 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    args = parser.parse_args()
+
+    server = GeminiStubServer(args.host, args.port, latency=args.latency, chunk_delay=args.chunk_delay,
+                              error_rate=args.error_rate, rate_limit_every=args.rate_limit_every,
+                              retry_after=args.retry_after)
+    print(f"🌐 Gemini taklit sunucusu: {server.base_url}")
+    print(f"   GITAUTO_GEMINI_BASE_URL={server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
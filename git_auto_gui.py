@@ -13,8 +13,3277 @@ import sys
 from pathlib import Path
 import threading
 import queue
+import re
+import json
+import itertools
+import mmap
+import multiprocessing
+import hashlib
+import tempfile
+import time
+import random
+import ctypes
+import ctypes.util
+import errno
+import select
+import signal
+import struct
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+
+
+# GitAuto'nun oluşturduğu kapsamlı .gitignore şablonu - hem dosyaya yazılır
+# hem de proje taramasında yerleşik yoksayma listesi olarak kullanılır
+GITAUTO_GITIGNORE_TEMPLATE = """# GitAuto tarafından oluşturuldu - Büyük dosyalar için optimize edildi
+
+# Dependencies
+node_modules/
+npm-debug.log*
+yarn-debug.log*
+yarn-error.log*
+package-lock.json
+yarn.lock
+pnpm-lock.yaml
+
+# Build outputs
+build/
+dist/
+out/
+target/
+*.exe
+*.msi
+*.dmg
+*.app
+*.deb
+*.rpm
+*.pkg
+
+# Large files
+*.zip
+*.tar.gz
+*.rar
+*.7z
+*.iso
+*.dmg
+*.pkg
+*.bin
+*.dat
+*.db
+*.sqlite
+*.sqlite3
+
+# Python
+__pycache__/
+*.pyc
+*.pyo
+*.pyd
+*.so
+*.egg
+*.egg-info/
+*.whl
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+*~
+
+# Logs
+*.log
+logs/
+*.pid
+*.seed
+*.out
+
+# OS
+.DS_Store
+Thumbs.db
+desktop.ini
+*.tmp
+*.temp
+
+# Cache
+.cache/
+*.cache
+tmp/
+temp/
+.tmp/
+
+# Electron specific
+node_modules/electron/
+node_modules/electron-builder/
+node_modules/electron-packager/
+
+# Large media files
+*.mp4
+*.avi
+*.mov
+*.wmv
+*.flv
+*.mkv
+*.webm
+*.mp3
+*.wav
+*.flac
+*.aac
+*.ogg
+
+# Archives
+*.zip
+*.tar
+*.gz
+*.bz2
+*.xz
+*.rar
+*.7z
+*.lzma
+*.lz4
+
+# Database files
+*.db
+*.sqlite
+*.sqlite3
+*.mdb
+*.accdb
+
+# Virtual environments
+venv/
+env/
+.venv/
+.env/
+ENV/
+
+# Backup files
+*.bak
+*.backup
+*.old
+*.orig
+*.save
+"""
+
+
+def _gitignore_pattern_to_regex(pattern):
+    """Tek bir .gitignore kalıbını regex gövdesine çevir"""
+    parts = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 3] == '**/':
+                parts.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                parts.append('.*')
+                i += 2
+                continue
+            parts.append('[^/]*')
+        elif c == '?':
+            parts.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                parts.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end].replace('\\', '\\\\')
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                parts.append(f'[{body}]')
+                i = end + 1
+                continue
+        elif c == '\\' and i + 1 < n:
+            parts.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            parts.append(re.escape(c))
+        i += 1
+    return ''.join(parts)
+
+
+class _IgnoreRuleSet:
+    """Tek bir kaynaktan (.gitignore, info/exclude, yerleşik liste) gelen kurallar"""
+
+    def __init__(self, base, lines):
+        # base: kuralların geçerli olduğu klasör (proje köküne göre, '/' ayraçlı)
+        self.base = base.strip('/')
+        rules = []
+        for raw in lines:
+            line = raw.rstrip('\n').rstrip('\r')
+            if not line.strip() or line.startswith('#'):
+                continue
+            line = line.rstrip(' ')
+            negate = line.startswith('!')
+            if negate:
+                line = line[1:]
+            elif line.startswith('\\!') or line.startswith('\\#'):
+                line = line[1:]
+            dir_only = line.endswith('/')
+            line = line.rstrip('/')
+            if not line:
+                continue
+            anchored = '/' in line
+            line = line.lstrip('/')
+            body = _gitignore_pattern_to_regex(line)
+            if not anchored:
+                body = '(?:.*/)?' + body
+            rules.append((negate, dir_only, body))
+        
+        # Ardışık aynı yönlü kuralları tek regex'te birleştir; "son eşleşen kazanır"
+        # kuralı gruplar sondan başa değerlendirilerek korunur
+        self.segments = []
+        for negate, dir_only, body in rules:
+            if self.segments and self.segments[-1][0] == negate:
+                self.segments[-1][1 if dir_only else 2].append(body)
+            else:
+                self.segments.append((negate, [body] if dir_only else [], [] if dir_only else [body]))
+        self.segments = [
+            (negate,
+             re.compile('(?:%s)$' % '|'.join(dir_bodies)) if dir_bodies else None,
+             re.compile('(?:%s)$' % '|'.join(any_bodies)) if any_bodies else None)
+            for negate, dir_bodies, any_bodies in reversed(self.segments)
+        ]
+
+    def match(self, rel_path, is_dir):
+        """Eşleşme varsa True/False (yoksay/dahil et), yoksa None döndür"""
+        if self.base:
+            if not rel_path.startswith(self.base + '/'):
+                return None
+            rel_path = rel_path[len(self.base) + 1:]
+        for negate, dir_regex, any_regex in self.segments:
+            if any_regex is not None and any_regex.match(rel_path):
+                return not negate
+            if is_dir and dir_regex is not None and dir_regex.match(rel_path):
+                return not negate
+        return None
+
+
+class IgnoreMatcher:
+    """Yerleşik liste, .git/info/exclude ve .gitignore dosyalarını birlikte uygula"""
+
+    def __init__(self, rule_sets=()):
+        # Öncelik sırası düşükten yükseğe (derindeki .gitignore en son)
+        self.rule_sets = tuple(rule_sets)
+
+    @classmethod
+    def for_project(cls, project_dir, include_builtin=True):
+        """Proje kökü için matcher oluştur"""
+        rule_sets = []
+        if include_builtin:
+            rule_sets.append(_IgnoreRuleSet('', GITAUTO_GITIGNORE_TEMPLATE.splitlines()))
+        for source in (os.path.join(project_dir, '.git', 'info', 'exclude'),
+                       os.path.join(project_dir, '.gitignore')):
+            lines = cls._read_lines(source)
+            if lines:
+                rule_sets.append(_IgnoreRuleSet('', lines))
+        return cls(rule_sets)
+
+    @classmethod
+    def builtin(cls):
+        """Yalnızca GitAuto'nun yerleşik yoksayma listesini uygulayan matcher"""
+        return cls([_IgnoreRuleSet('', GITAUTO_GITIGNORE_TEMPLATE.splitlines())])
+
+    @staticmethod
+    def _read_lines(path):
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                return f.read().splitlines()
+        except OSError:
+            return []
+
+    def child(self, rel_dir, gitignore_path):
+        """Alt klasördeki .gitignore ile genişletilmiş yeni matcher döndür"""
+        lines = self._read_lines(gitignore_path)
+        if not lines:
+            return self
+        return IgnoreMatcher(self.rule_sets + (_IgnoreRuleSet(rel_dir, lines),))
+
+    def is_ignored(self, rel_path, is_dir=False):
+        """Proje köküne göre ('/' ayraçlı) yol yoksayılıyor mu?"""
+        for rule_set in reversed(self.rule_sets):
+            result = rule_set.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+
+def walk_project(project_dir, matcher=None, include_builtin=True):
+    """scandir tabanlı, yoksayılan klasörleri budayan proje tarayıcısı
+    
+    os.walk gibi (rel_dir, dirs, files) üçlüleri üretir; dirs listesinden
+    eleman çıkarmak o klasöre hiç inilmemesini sağlar. files, os.DirEntry
+    nesneleridir (boyut bilgisi entry.stat() ile ek sistem çağrısı olmadan alınabilir).
+    rel_dir proje köküne göre '/' ayraçlıdır, kök için '' döner.
+    include_builtin=False ise yalnızca git'in de uygulayacağı kurallar
+    (.gitignore, .git/info/exclude) kullanılır; git add'e girecek dosyaları
+    tarayan işler (büyük dosya kontrolü) bunu kullanmalıdır.
+    """
+    if matcher is None:
+        matcher = IgnoreMatcher.for_project(project_dir, include_builtin=include_builtin)
+    
+    stack = [('', project_dir, matcher)]
+    while stack:
+        rel_dir, abs_dir, dir_matcher = stack.pop()
+        
+        # Kök dışındaki klasörlerde yerel .gitignore kurallarını ekle
+        if rel_dir:
+            local_gitignore = os.path.join(abs_dir, '.gitignore')
+            if os.path.isfile(local_gitignore):
+                dir_matcher = dir_matcher.child(rel_dir, local_gitignore)
+        
+        dirs = []
+        files = []
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if is_dir:
+                        if entry.name == '.git' or dir_matcher.is_ignored(rel_path, True):
+                            continue
+                        dirs.append(entry.name)
+                    elif not dir_matcher.is_ignored(rel_path, False):
+                        files.append(entry)
+        except OSError:
+            continue
+        
+        dirs.sort()
+        files.sort(key=lambda e: e.name)
+        yield rel_dir, dirs, files
+        
+        # Çağıranın budadığı klasörlere inme; sıralı gezinme için ters ekle
+        for name in reversed(dirs):
+            child_rel = f"{rel_dir}/{name}" if rel_dir else name
+            stack.append((child_rel, os.path.join(abs_dir, name), dir_matcher))
+
+
+def _git_environment():
+    """git alt süreçleri için ortam: etkileşimsiz, sabit dil"""
+    env = dict(os.environ)
+    env["GIT_TERMINAL_PROMPT"] = "0"   # kimlik bilgisi sorusunda takılma, hata ver
+    env["LC_ALL"] = "C"                # çıktı ve hata mesajları dil ayarından bağımsız
+    env["LANGUAGE"] = "C"
+    return env
+
+
+class GitResult:
+    """Tek bir git çağrısının sonucu (CompletedProcess ile aynı alanlar + süre)"""
+    
+    __slots__ = ("args", "returncode", "stdout", "stderr", "duration")
+    
+    def __init__(self, args, returncode, stdout, stderr, duration):
+        self.args = args
+        self.returncode = returncode
+        self.stdout = stdout
+        self.stderr = stderr
+        self.duration = duration
+    
+    @property
+    def ok(self):
+        return self.returncode == 0
+    
+    def __repr__(self):
+        return f"GitResult({' '.join(self.args)!r}, {self.returncode}, {self.duration:.3f}s)"
+
+
+_GIT_PROGRESS_RE = re.compile(
+    r"^(?:remote: )?(?P<phase>[A-Z][a-z]+(?: [a-z]+)*):\s+"
+    r"(?:(?P<percent>\d+)% \((?P<done>\d+)/(?P<total>\d+)\)|(?P<count>\d+))"
+    r"(?:, (?P<size>[\d.]+) (?P<size_unit>bytes|KiB|MiB|GiB|TiB)"
+    r"(?: \| (?P<rate>[\d.]+) (?P<rate_unit>bytes|KiB|MiB|GiB|TiB)/s)?)?"
+    r"(?P<finished>, done\.)?")
+_GIT_SIZE_UNITS = {"bytes": 1, "KiB": 1024, "MiB": 1024 ** 2, "GiB": 1024 ** 3, "TiB": 1024 ** 4}
+_OUTPUT_LINE_RE = re.compile(rb"([^\r\n]*)(\r\n|\r|\n)")
+
+
+class GitProgress:
+    """'git ... --progress' satırından ayrıştırılan ilerleme
+    
+    Örn. "Writing objects:  45% (100/222), 1.20 MiB | 512.00 KiB/s". Sayı
+    yüzdesiz gelen aşamalarda (Enumerating objects: 305) percent None olur.
+    """
+    
+    __slots__ = ("phase", "percent", "done", "total", "bytes", "rate", "finished")
+    
+    def __init__(self, phase, percent=None, done=0, total=None, bytes=None, rate=None, finished=False):
+        self.phase = phase
+        self.percent = percent
+        self.done = done
+        self.total = total
+        self.bytes = bytes        # aktarılan bayt (yalnızca Writing/Receiving)
+        self.rate = rate          # bayt/sn
+        self.finished = finished
+    
+    def describe(self):
+        """Durum satırı için kısa metin"""
+        text = f"{self.phase}: "
+        text += f"%{self.percent} ({self.done}/{self.total})" if self.percent is not None else str(self.done)
+        if self.bytes is not None:
+            text += f" · {self.bytes / (1024 * 1024):.1f} MB"
+        if self.rate is not None:
+            text += f" · {self.rate / (1024 * 1024):.2f} MB/sn"
+        return text + (" ✓" if self.finished else "")
+    
+    def __repr__(self):
+        return f"GitProgress({self.describe()!r})"
+
+
+def parse_git_progress(line):
+    """İlerleme satırını GitProgress'e çevir; ilerleme değilse None"""
+    match = _GIT_PROGRESS_RE.match(line)
+    if match is None:
+        return None
+    size, rate = match.group("size"), match.group("rate")
+    if match.group("percent") is not None:
+        percent, done, total = int(match.group("percent")), int(match.group("done")), int(match.group("total"))
+    else:
+        percent, done, total = None, int(match.group("count")), None
+    return GitProgress(
+        match.group("phase"), percent, done, total,
+        bytes=float(size) * _GIT_SIZE_UNITS[match.group("size_unit")] if size else None,
+        rate=float(rate) * _GIT_SIZE_UNITS[match.group("rate_unit")] if rate else None,
+        finished=match.group("finished") is not None)
+
+
+class GitRunner:
+    """Tüm git çağrılarının geçtiği merkezi katman
+    
+    Komutlar kabuk olmadan argv listesiyle ve cwd= ile çalıştırılır (os.chdir
+    kullanılmaz), böylece commit mesajı veya branch adındaki tırnak ve boşluklar
+    sorun çıkarmaz. Ortam etkileşimsizdir, Windows'ta konsol penceresi açılmaz.
+    Her çağrının süresi kaydedilir; yavaş çağrılar log'a yazılır.
+    """
+    
+    def __init__(self, git="git", default_timeout=60, log=None, slow_threshold=5.0, history=200):
+        self.git = git
+        self.default_timeout = default_timeout
+        self.log = log
+        self.slow_threshold = slow_threshold
+        self.env = _git_environment()
+        self.calls = deque(maxlen=history)
+        self.total_calls = 0
+        self.total_time = 0.0
+        self._lock = threading.Lock()
+        self.creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0) if os.name == 'nt' else 0
+        self._version = None
+    
+    def run(self, args, cwd=None, timeout=None, input=None, env=None, binary=False):
+        """git <args> çalıştır ve GitResult döndür
+        
+        git bulunamazsa returncode 127 olan bir sonuç döner; zaman aşımında
+        subprocess.TimeoutExpired yükseltilir.
+        """
+        argv = [self.git] + [str(arg) for arg in args]
+        run_env = self.env if env is None else dict(self.env, **env)
+        started = time.perf_counter()
+        try:
+            completed = subprocess.run(
+                argv, cwd=cwd, input=input, capture_output=True,
+                timeout=timeout or self.default_timeout, env=run_env,
+                creationflags=self.creationflags)
+            returncode, stdout, stderr = completed.returncode, completed.stdout, completed.stderr
+        except OSError as e:
+            returncode, stdout, stderr = 127, b"", str(e).encode("utf-8")
+        finally:
+            duration = time.perf_counter() - started
+            self._record(argv, cwd, duration)
+        
+        if not binary:
+            stdout = stdout.decode("utf-8", errors="replace")
+            stderr = stderr.decode("utf-8", errors="replace")
+        return GitResult(argv[1:], returncode, stdout, stderr, duration)
+    
+    def stream(self, args, cwd=None, timeout=None, env=None, on_line=None, on_progress=None,
+               should_stop=None):
+        """git <args>'ı Popen ile çalıştır, çıktıyı geldikçe ilet ve GitResult döndür
+        
+        stdout/stderr \\r veya \\n ile satırlara bölünür. \\r ile biten (yerinde
+        yenilenen) ilerleme satırları yalnızca on_progress'e GitProgress olarak,
+        tamamlanan satırlar on_line'a (ilerleme içeriyorsa on_progress'e de)
+        gider; geri çağrılar okuyucu thread'lerinden yapılır. Sonuçtaki
+        stdout/stderr yalnızca tamamlanan satırları içerir. timeout burada
+        durma süresidir: bu kadar süre hiç çıktı gelmezse süreç sonlandırılır ve
+        subprocess.TimeoutExpired yükseltilir. should_stop() doğru dönerse süreç
+        sonlandırılır ve başarısız sonuç döner.
+        """
+        argv = [self.git] + [str(arg) for arg in args]
+        run_env = self.env if env is None else dict(self.env, **env)
+        timeout = timeout or self.default_timeout
+        started = time.perf_counter()
+        try:
+            # POSIX'te ayrı süreç grubu: durdurulurken remote yardımcıları (ssh, https) da sonlanır
+            process = subprocess.Popen(argv, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                       stderr=subprocess.PIPE, env=run_env,
+                                       creationflags=self.creationflags,
+                                       start_new_session=os.name != 'nt')
+        except OSError as e:
+            duration = time.perf_counter() - started
+            self._record(argv, cwd, duration)
+            return GitResult(argv[1:], 127, "", str(e), duration)
+        
+        lines = {"stdout": [], "stderr": []}
+        last_output = [time.monotonic()]
+        
+        def emit(name, raw, transient):
+            text = raw.decode("utf-8", errors="replace").rstrip()
+            if not text:
+                return
+            progress = parse_git_progress(text)
+            if progress is not None and on_progress is not None:
+                on_progress(progress)
+            if not transient:
+                lines[name].append(text)
+                if on_line is not None:
+                    on_line(text)
+        
+        def pump(pipe, name):
+            pending = b""
+            # Parça sonundaki '\r' ilerlemesi bildirildi mi (tekrar bildirilmesin)
+            shown = False
+            for chunk in iter(lambda: pipe.read1(65536), b""):
+                last_output[0] = time.monotonic()
+                pending += chunk
+                consumed = 0
+                for match in _OUTPUT_LINE_RE.finditer(pending):
+                    transient = match.group(2) == b"\r"
+                    if transient and match.end() == len(pending):
+                        # '\r\n' parçalar arasında bölünmüş olabilir: satırı sonraki parçaya
+                        # bırak, ilerlemeyi yine de hemen göster
+                        if not shown:
+                            emit(name, match.group(1), True)
+                            shown = True
+                        break
+                    if not (transient and shown and consumed == 0):
+                        emit(name, match.group(1), transient)
+                    shown = False
+                    consumed = match.end()
+                pending = pending[consumed:]
+            if not shown:
+                emit(name, pending, False)
+            pipe.close()
+        
+        readers = [threading.Thread(target=pump, args=(process.stdout, "stdout"), daemon=True),
+                   threading.Thread(target=pump, args=(process.stderr, "stderr"), daemon=True)]
+        for reader in readers:
+            reader.start()
+        try:
+            while True:
+                try:
+                    process.wait(timeout=0.1)
+                    break
+                except subprocess.TimeoutExpired:
+                    pass
+                if should_stop is not None and should_stop():
+                    self._terminate(process)
+                    break
+                if time.monotonic() - last_output[0] > timeout:
+                    self._terminate(process)
+                    raise subprocess.TimeoutExpired(argv, timeout)
+        finally:
+            for reader in readers:
+                reader.join(timeout=5)
+            duration = time.perf_counter() - started
+            self._record(argv, cwd, duration)
+        
+        return GitResult(argv[1:], process.returncode, "\n".join(lines["stdout"]),
+                         "\n".join(lines["stderr"]), duration)
+    
+    @staticmethod
+    def _terminate(process):
+        """Akıştaki git sürecini alt süreçleriyle birlikte sonlandır"""
+        try:
+            if os.name != 'nt':
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError:
+            process.kill()
+        process.wait()
+    
+    def _record(self, argv, cwd, duration):
+        with self._lock:
+            self.calls.append((tuple(argv[1:]), cwd, duration))
+            self.total_calls += 1
+            self.total_time += duration
+        if self.log is not None and duration >= self.slow_threshold:
+            self.log(f"🐢 git {' '.join(argv[1:3])} {duration:.1f} sn sürdü")
+    
+    def version(self):
+        """'git --version' çıktısı (önbellekli); git yoksa None"""
+        if self._version is None:
+            try:
+                result = self.run(["--version"], timeout=10)
+            except subprocess.SubprocessError:
+                return None
+            if not result.ok:
+                return None
+            self._version = result.stdout.strip()
+        return self._version
+    
+    def output(self, args, cwd=None, timeout=None):
+        """Başarılıysa kırpılmış stdout, değilse None"""
+        result = self.run(args, cwd=cwd, timeout=timeout)
+        return result.stdout.strip() if result.ok else None
+    
+    @staticmethod
+    def split_z(data):
+        """-z çıktısını (bayt) NUL ile ayrılmış kayıtlara böl"""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8", errors="surrogateescape")
+        return [item for item in data.split("\0") if item]
+    
+    def run_z(self, args, cwd=None, timeout=None):
+        """-z çıktılı komutu çalıştır ve kayıt listesini döndür (hatada None)"""
+        result = self.run(args, cwd=cwd, timeout=timeout, binary=True)
+        return self.split_z(result.stdout) if result.ok else None
+    
+    def stats(self):
+        """(çağrı sayısı, toplam süre, en yavaş son çağrılar)"""
+        with self._lock:
+            slowest = sorted(self.calls, key=lambda call: -call[2])[:5]
+            return self.total_calls, self.total_time, slowest
+
+
+# Varsayılan git katmanı (GUI kendi örneğini log ile oluşturur)
+GIT = GitRunner()
+
+
+def resolve_git_dir(repo_dir):
+    """Repository'nin .git klasörünü döndür (.git dosyası/worktree desteğiyle), yoksa None"""
+    dot_git = os.path.join(repo_dir, ".git")
+    if os.path.isdir(dot_git):
+        return dot_git
+    try:
+        with open(dot_git, "r", encoding="utf-8") as f:
+            line = f.readline().strip()
+    except OSError:
+        return None
+    if not line.startswith("gitdir:"):
+        return None
+    git_dir = line[len("gitdir:"):].strip()
+    if not os.path.isabs(git_dir):
+        git_dir = os.path.join(repo_dir, git_dir)
+    git_dir = os.path.normpath(git_dir)
+    return git_dir if os.path.isdir(git_dir) else None
+
+
+def resolve_common_dir(git_dir):
+    """Worktree'lerde ref'lerin tutulduğu ortak git klasörü (commondir), yoksa git_dir"""
+    try:
+        with open(os.path.join(git_dir, "commondir"), "r", encoding="utf-8") as f:
+            common = f.readline().strip()
+    except OSError:
+        return git_dir
+    if not common:
+        return git_dir
+    if not os.path.isabs(common):
+        common = os.path.join(git_dir, common)
+    return os.path.normpath(common)
+
+
+class RefState:
+    """Aktif branch, yerel branch'ler ve remote başına branch adları"""
+    
+    __slots__ = ("current", "local", "remotes")
+    
+    def __init__(self, current=None, local=(), remotes=None):
+        self.current = current
+        self.local = sorted(local)
+        self.remotes = remotes or {}
+    
+    def remote_branches(self, remote="origin"):
+        return self.remotes.get(remote, [])
+
+
+class RefReader:
+    """.git/HEAD, gevşek ref'ler ve packed-refs'i alt süreç başlatmadan okur
+    
+    Sonuç, HEAD, packed-refs ve refs/heads, refs/remotes altındaki klasörlerin
+    mtime'ları değişene kadar önbellekte tutulur; dosya ekleme/silme klasör
+    mtime'ını değiştirdiği için yeniden listeleme gerekmez. reftable gibi
+    dosya tabanlı olmayan ref depolarında 'git for-each-ref' kullanılır.
+    """
+    
+    REF_ROOTS = ("refs/heads", "refs/remotes")
+    
+    def __init__(self, runner=None):
+        self.runner = runner or GIT
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.fallbacks = 0
+    
+    @staticmethod
+    def _stamp(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    def read(self, repo_dir):
+        """Repository'nin RefState'ini döndür; git deposu değilse None"""
+        git_dir = resolve_git_dir(repo_dir)
+        if git_dir is None:
+            return None
+        common_dir = resolve_common_dir(git_dir)
+        if os.path.isdir(os.path.join(common_dir, "reftable")):
+            return self._read_with_git(repo_dir)
+        
+        key = os.path.normcase(git_dir)
+        head_stamp = self._stamp(os.path.join(git_dir, "HEAD"))
+        packed_stamp = self._stamp(os.path.join(common_dir, "packed-refs"))
+        with self._lock:
+            cached = self._cache.get(key)
+        if (cached is not None and cached[0] == head_stamp and cached[1] == packed_stamp
+                and all(self._stamp(path) == stamp for path, stamp in cached[2])):
+            return cached[3]
+        
+        dir_stamps = []
+        names = set()
+        for root in self.REF_ROOTS:
+            self._scan_loose(common_dir, root, names, dir_stamps)
+        names.update(self._read_packed(common_dir))
+        state = self._build_state(self._read_head(git_dir), names)
+        
+        with self._lock:
+            self._cache[key] = (head_stamp, packed_stamp, tuple(dir_stamps), state)
+        return state
+    
+    @staticmethod
+    def _build_state(current, names):
+        """Tam ref adlarını yerel ve remote branch'lere ayır"""
+        local = []
+        remotes = {}
+        for name in names:
+            if name.startswith("refs/heads/"):
+                local.append(name[len("refs/heads/"):])
+            elif name.startswith("refs/remotes/"):
+                remote, _, branch = name[len("refs/remotes/"):].partition("/")
+                if branch and branch != "HEAD":
+                    remotes.setdefault(remote, []).append(branch)
+        for branches in remotes.values():
+            branches.sort()
+        return RefState(current, local, remotes)
+    
+    def _scan_loose(self, common_dir, root, names, dir_stamps):
+        """root altındaki gevşek ref adlarını topla, klasör mtime'larını kaydet"""
+        pending = [root]
+        while pending:
+            rel = pending.pop()
+            path = os.path.join(common_dir, *rel.split("/"))
+            dir_stamps.append((path, self._stamp(path)))
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.name.endswith(".lock"):
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(f"{rel}/{entry.name}")
+                        else:
+                            names.add(f"{rel}/{entry.name}")
+            except OSError:
+                continue
+    
+    def _read_packed(self, common_dir):
+        """packed-refs içindeki ref adları (soyulmuş '^' satırları atlanır)"""
+        names = []
+        try:
+            with open(os.path.join(common_dir, "packed-refs"), "r", encoding="utf-8", errors="replace") as f:
+                for line in f:
+                    if line.startswith(("#", "^")):
+                        continue
+                    parts = line.split()
+                    if len(parts) == 2:
+                        names.append(parts[1])
+        except OSError:
+            pass
+        return names
+    
+    @staticmethod
+    def _read_head(git_dir):
+        """HEAD sembolik bir branch'i gösteriyorsa adını döndür (ayrık HEAD'de None)"""
+        try:
+            with open(os.path.join(git_dir, "HEAD"), "r", encoding="utf-8") as f:
+                head = f.readline().strip()
+        except OSError:
+            return None
+        if head.startswith("ref: refs/heads/"):
+            return head[len("ref: refs/heads/"):]
+        return None
+    
+    def _read_with_git(self, repo_dir):
+        """Dosya tabanlı olmayan ref depoları için git üzerinden oku"""
+        self.fallbacks += 1
+        result = self.runner.run(["for-each-ref", "--format=%(refname)", "refs/heads", "refs/remotes"],
+                                 cwd=repo_dir, timeout=10)
+        if not result.ok:
+            return None
+        head = self.runner.run(["symbolic-ref", "-q", "--short", "HEAD"], cwd=repo_dir, timeout=5)
+        current = head.stdout.strip() if head.ok else ""
+        return self._build_state(current or None, result.stdout.splitlines())
+
+
+class RepoSnapshot:
+    """Tek 'git status --porcelain=v2 --branch -z' ve 'git remote -v' ile alınan repository durumu
+    
+    state: "ok", "missing" (.git yok), "invalid" (git hata döndürdü) veya
+    "unreachable" (git çalıştırılamadı / zaman aşımı).
+    """
+    
+    def __init__(self, repo_dir, state="missing", error=""):
+        self.repo_dir = repo_dir
+        self.state = state
+        self.error = error
+        self.branch = None        # detached HEAD'de None
+        self.oid = None           # ilk commit öncesinde None
+        self.upstream = None
+        self.ahead = 0
+        self.behind = 0
+        self.changes = []         # (tür, XY, yol) - tür: 1/2/u/?
+        self.remotes = {}         # ad -> fetch URL
+        self.captured_at = time.monotonic()
+    
+    @property
+    def valid(self):
+        return self.state == "ok"
+    
+    @property
+    def clean(self):
+        return not self.changes
+    
+    @property
+    def has_remote(self):
+        return bool(self.remotes)
+    
+    def remote_url(self, name="origin"):
+        return self.remotes.get(name)
+    
+    def with_changes(self, changes):
+        """Aynı branch/remote bilgisiyle, değişiklik listesi güncellenmiş yeni görüntü"""
+        snapshot = RepoSnapshot(self.repo_dir, self.state, self.error)
+        snapshot.branch, snapshot.oid, snapshot.upstream = self.branch, self.oid, self.upstream
+        snapshot.ahead, snapshot.behind = self.ahead, self.behind
+        snapshot.remotes = self.remotes
+        snapshot.changes = changes
+        return snapshot
+    
+    @classmethod
+    def capture(cls, repo_dir, runner=None, timeout=10):
+        """Repository durumunu iki git çağrısıyla oku"""
+        runner = runner or GIT
+        if not resolve_git_dir(repo_dir):
+            return cls(repo_dir, "missing")
+        try:
+            # Salt okunur sorgu: index'i yeniden yazmak için kilit alma
+            result = runner.run(["status", "--porcelain=v2", "--branch", "-z"], cwd=repo_dir,
+                                timeout=timeout, binary=True, env={"GIT_OPTIONAL_LOCKS": "0"})
+            if not result.ok:
+                return cls(repo_dir, "invalid", result.stderr.decode("utf-8", errors="replace").strip())
+            snapshot = cls(repo_dir, "ok")
+            snapshot._parse_status(runner.split_z(result.stdout))
+            
+            remotes = runner.run(["remote", "-v"], cwd=repo_dir, timeout=timeout)
+            if remotes.ok:
+                for line in remotes.stdout.splitlines():
+                    parts = line.split()
+                    if len(parts) >= 2 and (len(parts) < 3 or parts[2] == "(fetch)"):
+                        snapshot.remotes.setdefault(parts[0], parts[1])
+            return snapshot
+        except subprocess.SubprocessError as e:
+            return cls(repo_dir, "unreachable", str(e))
+    
+    def _parse_status(self, records):
+        records = iter(records)
+        for record in records:
+            if record.startswith("# "):
+                key, _, value = record[2:].partition(" ")
+                if key == "branch.oid":
+                    self.oid = None if value == "(initial)" else value
+                elif key == "branch.head":
+                    self.branch = None if value == "(detached)" else value
+                elif key == "branch.upstream":
+                    self.upstream = value
+                elif key == "branch.ab":
+                    ahead, _, behind = value.partition(" ")
+                    self.ahead, self.behind = int(ahead), -int(behind)
+                continue
+            kind = record[:1]
+            if kind == "1":
+                fields = record.split(" ", 8)
+                self.changes.append(("1", fields[1], fields[8]))
+            elif kind == "2":
+                fields = record.split(" ", 9)
+                self.changes.append(("2", fields[1], fields[9]))
+                next(records, None)  # -z: yeniden adlandırmanın eski yolu ayrı kayıttır
+            elif kind == "u":
+                fields = record.split(" ", 10)
+                self.changes.append(("u", fields[1], fields[10]))
+            elif kind == "?":
+                self.changes.append(("?", "??", record[2:]))
+
+
+class RepoSnapshotCache:
+    """Repository başına RepoSnapshot önbelleği
+    
+    .git/HEAD, index, config, packed-refs ve refs klasörlerinin mtime'ları
+    değişene kadar aynı anlık görüntü döner. Çalışma ağacındaki düzenlemeler
+    bu dosyalara yansımadığı için görüntü en fazla max_age saniye saklanır;
+    RepoWatcher'ın inotify ile canlı izlediği repository'lerde bu süre sınırı
+    uygulanmaz.
+    """
+    
+    # HEAD ve index worktree'ye, diğerleri ortak git klasörüne aittir
+    WORKTREE_FILES = ("HEAD", "index")
+    FINGERPRINT_FILES = ("config", "packed-refs",
+                         "refs", os.path.join("refs", "heads"), os.path.join("refs", "remotes"))
+    
+    def __init__(self, runner=None, max_age=5.0):
+        self.runner = runner or GIT
+        self.max_age = max_age
+        self._snapshots = {}
+        self._live = set()
+        # _lock yalnızca sözlükleri korur; git çağrıları repository başına kilitle yapılır
+        self._lock = threading.Lock()
+        self._capture_locks = {}
+        # Geçersiz kılma sayaçları: tümü için ve repository başına
+        self._epoch = 0
+        self._generations = {}
+        self.captures = 0
+    
+    @staticmethod
+    def _key(repo_dir):
+        return os.path.normcase(os.path.abspath(repo_dir))
+    
+    @classmethod
+    def fingerprint(cls, repo_dir):
+        git_dir = resolve_git_dir(repo_dir)
+        if git_dir is None:
+            return None
+        common_dir = resolve_common_dir(git_dir)
+        paths = [os.path.join(git_dir, name) for name in cls.WORKTREE_FILES]
+        paths += [os.path.join(common_dir, name) for name in cls.FINGERPRINT_FILES]
+        stamps = []
+        for path in paths:
+            try:
+                stamps.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamps.append(0)
+        return git_dir, tuple(stamps)
+    
+    def _cached(self, key, fingerprint):
+        with self._lock:
+            cached = self._snapshots.get(key)
+            if (cached is not None and cached[0] == fingerprint
+                    and (key in self._live or time.monotonic() - cached[1].captured_at < self.max_age)):
+                return cached[1]
+        return None
+    
+    def _capture_lock(self, key):
+        with self._lock:
+            lock = self._capture_locks.get(key)
+            if lock is None:
+                lock = self._capture_locks[key] = threading.Lock()
+            return lock
+    
+    def get(self, repo_dir, force=False):
+        """Geçerli anlık görüntüyü döndür, gerekirse yeniden al
+        
+        git çağrıları ortak kilidin dışında çalışır; farklı repository'ler
+        birbirini beklemez, aynı repository için tek yakalama yapılır.
+        """
+        key = self._key(repo_dir)
+        if not force:
+            snapshot = self._cached(key, self.fingerprint(repo_dir))
+            if snapshot is not None:
+                return snapshot
+        with self._capture_lock(key):
+            if not force:
+                # Beklerken başka bir thread yakalamış olabilir
+                snapshot = self._cached(key, self.fingerprint(repo_dir))
+                if snapshot is not None:
+                    return snapshot
+            with self._lock:
+                generation = (self._epoch, self._generations.get(key, 0))
+            snapshot = RepoSnapshot.capture(repo_dir, self.runner)
+            # Yakalama sırasında git index'i yenilemiş olabilir; sonrası parmak izi saklanır
+            fingerprint = self.fingerprint(repo_dir)
+            with self._lock:
+                self.captures += 1
+                # Yakalama sürerken geçersiz kılındıysa eski olabilecek sonuç saklanmaz
+                if generation == (self._epoch, self._generations.get(key, 0)):
+                    self._snapshots[key] = (fingerprint, snapshot)
+            return snapshot
+    
+    def store(self, repo_dir, snapshot):
+        """Artımlı güncellenmiş görüntüyü önbelleğe koy (RepoStatusModel)"""
+        fingerprint = self.fingerprint(repo_dir)
+        with self._lock:
+            self._snapshots[self._key(repo_dir)] = (fingerprint, snapshot)
+    
+    def set_live(self, repo_dir, live):
+        """Repository canlı izleniyorsa görüntü süre dolduğu için yeniden alınmaz"""
+        with self._lock:
+            if live:
+                self._live.add(self._key(repo_dir))
+            else:
+                self._live.discard(self._key(repo_dir))
+    
+    def invalidate(self, repo_dir=None):
+        with self._lock:
+            if repo_dir is None:
+                self._epoch += 1
+                self._snapshots.clear()
+            else:
+                key = self._key(repo_dir)
+                self._generations[key] = self._generations.get(key, 0) + 1
+                self._snapshots.pop(key, None)
+
+
+class RepoStatusModel:
+    """Dosya olaylarıyla artımlı güncellenen repository durumu
+
+    Tam 'git status' yalnızca ilk yüklemede ve .git meta verisi (HEAD, index,
+    refs, config) değiştiğinde çalışır. Çalışma ağacı olaylarında yalnızca
+    etkilenen yollar pathspec ile sorgulanır ve görüntüdeki kayıtları
+    değiştirilir; sonuç RepoSnapshotCache'e yazılır.
+    """
+
+    def __init__(self, repo_dir, snapshots):
+        self.repo_dir = repo_dir
+        self.snapshots = snapshots
+        self.runner = snapshots.runner
+        self.snapshot = None
+        self.full_refreshes = 0
+        self.path_refreshes = 0
+
+    def refresh(self):
+        """Tam status ile yeniden yükle"""
+        self.snapshot = self.snapshots.get(self.repo_dir, force=True)
+        self.full_refreshes += 1
+        return self.snapshot
+
+    @staticmethod
+    def _covers(spec, path):
+        return path == spec or path.startswith(spec + "/")
+
+    def pathspecs(self, paths):
+        """Olay yollarını git'in tam status'la aynı sonucu vereceği en kısa pathspec listesine indir
+
+        İzlenmeyen klasör tam status'ta tek kayıt ('dir/') olarak görünür; içindeki
+        bir dosya değiştiğinde klasörün kendisi sorgulanır. Üst klasörü de
+        listede olan yollar atılır.
+        """
+        collapsed = [change[2][:-1] for change in self.snapshot.changes
+                     if change[0] == "?" and change[2].endswith("/")]
+        specs = set()
+        for path in paths:
+            path = path.strip("/")
+            for folder in collapsed:
+                if self._covers(folder, path):
+                    path = folder
+                    break
+            specs.add(path)
+        result = []
+        for spec in sorted(specs, key=lambda path: path.split("/")):
+            if not (result and self._covers(result[-1], spec)):
+                result.append(spec)
+        return result
+
+    def has_untracked_parent(self, changes, timeout=10):
+        """İzlenmeyen bir dosyanın üst klasöründe hiç izlenen dosya yoksa True"""
+        parents = {change[2].rsplit("/", 1)[0] for change in changes
+                   if change[0] == "?" and not change[2].endswith("/") and "/" in change[2]}
+        if not parents:
+            return False
+        result = self.runner.run(["ls-files", "-z", "--"] + sorted(parents), cwd=self.repo_dir,
+                                 timeout=timeout, binary=True,
+                                 env={"GIT_OPTIONAL_LOCKS": "0", "GIT_LITERAL_PATHSPECS": "1"})
+        if not result.ok:
+            return True
+        remaining = set(parents)
+        for path in self.runner.split_z(result.stdout):
+            while "/" in path and remaining:
+                path = path.rsplit("/", 1)[0]
+                remaining.discard(path)
+            if not remaining:
+                break
+        return bool(remaining)
+
+    def update_paths(self, paths, timeout=10):
+        """Yalnızca verilen (repository köküne göre '/' ayraçlı) yolların durumunu yenile"""
+        if self.snapshot is None or not self.snapshot.valid:
+            return self.refresh()
+        specs = self.pathspecs(paths)
+        if "" in specs:
+            return self.refresh()
+        result = self.runner.run(["status", "--porcelain=v2", "-z", "--"] + specs, cwd=self.repo_dir,
+                                 timeout=timeout, binary=True,
+                                 env={"GIT_OPTIONAL_LOCKS": "0", "GIT_LITERAL_PATHSPECS": "1"})
+        if not result.ok:
+            return self.refresh()
+        partial = RepoSnapshot(self.repo_dir, "ok")
+        partial._parse_status(self.runner.split_z(result.stdout))
+        if self.has_untracked_parent(partial.changes, timeout):
+            # Dosya pathspec'i yeni klasörde '? dir/file' verir, tam status ise 'dir/'
+            return self.refresh()
+
+        kept = [change for change in self.snapshot.changes
+                if not any(self._covers(spec, change[2].rstrip("/")) for spec in specs)]
+        self.snapshot = self.snapshot.with_changes(kept + partial.changes)
+        self.snapshots.store(self.repo_dir, self.snapshot)
+        self.path_refreshes += 1
+        return self.snapshot
+
+
+def iter_watch_directories(repo_dir, matcher, rel_root=""):
+    """İzlenecek (yoksayılmamış) klasörler; rel_root'tan başlayarak '/' ayraçlı göreli yollar"""
+    stack = [(rel_root, matcher)]
+    while stack:
+        rel_dir, dir_matcher = stack.pop()
+        abs_dir = os.path.join(repo_dir, rel_dir) if rel_dir else repo_dir
+        if rel_dir:
+            local_gitignore = os.path.join(abs_dir, '.gitignore')
+            if os.path.isfile(local_gitignore):
+                dir_matcher = dir_matcher.child(rel_dir, local_gitignore)
+        yield rel_dir
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    try:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                    except OSError:
+                        continue
+                    child = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                    if entry.name != '.git' and not dir_matcher.is_ignored(child, True):
+                        stack.append((child, dir_matcher))
+        except OSError:
+            continue
+
+
+# .git içinde durumu etkileyen dosyalar (kilit ve geçici dosyalar yok sayılır)
+GIT_META_NAMES = frozenset({"HEAD", "index", "packed-refs", "config",
+                            "ORIG_HEAD", "MERGE_HEAD", "CHERRY_PICK_HEAD", "REVERT_HEAD"})
+
+
+def _watched_ref_dirs(common_dir):
+    return [os.path.join(common_dir, "refs", "heads"), os.path.join(common_dir, "refs", "remotes")]
+
+
+class InotifyBackend:
+    """Linux inotify ile klasör izleme (ctypes; ek paket gerekmez)
+
+    Çalışma ağacındaki her klasöre, .git köküne ve refs/heads, refs/remotes
+    altına birer izleme eklenir. wait() select ile bloklar; boşta CPU
+    kullanılmaz. Olaylar (tür, yol, klasör mü) olarak döner; tür "tree",
+    "meta" veya "overflow" (çekirdek kuyruğu taştı, tam yenileme gerekir).
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_MOVE_SELF = 0x00000800
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_ONLYDIR = 0x01000000
+    IN_DONT_FOLLOW = 0x02000000
+    IN_ISDIR = 0x40000000
+
+    # IN_MODIFY yerine IN_CLOSE_WRITE: her write() için değil, dosya kapanınca bir olay
+    WATCH_MASK = (IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE
+                  | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR | IN_DONT_FOLLOW)
+    EVENT_HEADER = struct.Struct("iIII")
+
+    _libc = None
+
+    @classmethod
+    def available(cls):
+        if not sys.platform.startswith("linux"):
+            return False
+        try:
+            cls._load_libc()
+        except (OSError, AttributeError):
+            return False
+        return True
+
+    @classmethod
+    def _load_libc(cls):
+        if cls._libc is None:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+            cls._libc = libc
+        return cls._libc
+
+    def __init__(self, repo_dir, git_dir, matcher):
+        self.repo_dir = repo_dir
+        self.git_dir = git_dir
+        self.matcher = matcher
+        self.libc = self._load_libc()
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            self._raise_errno()
+        self._wake_read, self._wake_write = os.pipe()
+        self._watches = {}    # wd -> (tür, göreli klasör veya mutlak yol)
+        try:
+            for rel_dir in iter_watch_directories(repo_dir, matcher):
+                self._add("tree", rel_dir)
+            common_dir = resolve_common_dir(git_dir)
+            self._add("gitdir", git_dir)
+            if os.path.normcase(common_dir) != os.path.normcase(git_dir):
+                self._add("gitdir", common_dir)
+            for refs_dir in _watched_ref_dirs(common_dir):
+                for current, _, _ in os.walk(refs_dir):
+                    self._add("refs", current)
+        except OSError:
+            self.close()
+            raise
+
+    @property
+    def watch_count(self):
+        return len(self._watches)
+
+    def _raise_errno(self):
+        error = ctypes.get_errno()
+        raise OSError(error, os.strerror(error))
+
+    def _add(self, kind, location):
+        path = os.path.join(self.repo_dir, location) if kind == "tree" else location
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.WATCH_MASK)
+        if wd < 0:
+            error = ctypes.get_errno()
+            if error in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                return  # klasör bu arada silindi veya okunamıyor
+            raise OSError(error, f"inotify_add_watch: {os.strerror(error)}")
+        self._watches[wd] = (kind, location)
+
+    def wait(self, timeout=None):
+        """Olay gelene, wake() çağrılana veya timeout dolana kadar bekle"""
+        try:
+            readable, _, _ = select.select([self.fd, self._wake_read], [], [], timeout)
+        except (OSError, ValueError):
+            return []
+        if self._wake_read in readable:
+            os.read(self._wake_read, 64)
+        if self.fd not in readable:
+            return []
+        events = []
+        while True:
+            try:
+                data = os.read(self.fd, 65536)
+            except BlockingIOError:
+                break
+            if not data:
+                break
+            self._parse(data, events)
+        return events
+
+    def _parse(self, data, events):
+        offset = 0
+        while offset + self.EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = self.EVENT_HEADER.unpack_from(data, offset)
+            offset += self.EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & self.IN_Q_OVERFLOW:
+                events.append(("overflow", "", False))
+                continue
+            watch = self._watches.get(wd)
+            if watch is None:
+                continue
+            if mask & self.IN_IGNORED:
+                del self._watches[wd]
+                continue
+            kind, location = watch
+            is_dir = bool(mask & self.IN_ISDIR)
+            created = mask & (self.IN_CREATE | self.IN_MOVED_TO) and is_dir
+
+            if kind == "tree":
+                if not name:
+                    continue  # klasörün kendisi silindi; üst klasörün olayı yeterli
+                rel_path = f"{location}/{name}" if location else name
+                if rel_path == ".git":
+                    events.append(("meta", rel_path, is_dir))
+                    continue
+                if created and not self.matcher.is_ignored(rel_path, True):
+                    for rel_dir in iter_watch_directories(self.repo_dir, self.matcher, rel_path):
+                        self._add("tree", rel_dir)
+                events.append(("tree", rel_path, is_dir))
+            elif kind == "gitdir":
+                if name in GIT_META_NAMES or mask & (self.IN_DELETE_SELF | self.IN_MOVE_SELF):
+                    events.append(("meta", name, is_dir))
+            else:
+                if created:
+                    for current, _, _ in os.walk(os.path.join(location, name)):
+                        self._add("refs", current)
+                if not name.endswith(".lock"):
+                    events.append(("meta", name, is_dir))
+
+    def wake(self):
+        """Bekleyen wait()'i hemen döndür (başka thread'den)"""
+        try:
+            os.write(self._wake_write, b"x")
+        except OSError:
+            pass
+
+    def close(self):
+        for fd in (self.fd, self._wake_read, self._wake_write):
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._watches.clear()
+
+
+class PollingBackend:
+    """inotify olmayan sistemler için yoklamalı izleme
+
+    .git meta verisi (HEAD, index, config, packed-refs, refs klasörleri) her
+    turda stat'lanır. Çalışma ağacı klasörleri sırayla, tur başına en fazla
+    dirs_per_round klasör taranır ve (mtime, boyut) bir önceki taramayla
+    karşılaştırılır; büyük ağaçlarda tek turda tam tarama yapılmaz.
+    """
+
+    def __init__(self, repo_dir, git_dir, matcher, interval=1.0, dirs_per_round=200):
+        self.repo_dir = repo_dir
+        self.git_dir = git_dir
+        self.common_dir = resolve_common_dir(git_dir)
+        self.matcher = matcher
+        self.interval = interval
+        self.dirs_per_round = dirs_per_round
+        self._stop = threading.Event()
+        self._meta = self._meta_stamps()
+        self._listings = {}
+        self._queue = deque()
+        for rel_dir in iter_watch_directories(repo_dir, matcher):
+            self._track(rel_dir)
+
+    @property
+    def watch_count(self):
+        return len(self._listings)
+
+    def _meta_stamps(self):
+        paths = [os.path.join(self.git_dir, name) for name in GIT_META_NAMES]
+        if os.path.normcase(self.common_dir) != os.path.normcase(self.git_dir):
+            paths += [os.path.join(self.common_dir, name) for name in ("config", "packed-refs")]
+        for refs_dir in _watched_ref_dirs(self.common_dir):
+            paths.extend(current for current, _, _ in os.walk(refs_dir))
+        stamps = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                stamps.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                pass
+        return stamps
+
+    def _list(self, rel_dir):
+        abs_dir = os.path.join(self.repo_dir, rel_dir) if rel_dir else self.repo_dir
+        listing = {}
+        try:
+            with os.scandir(abs_dir) as it:
+                for entry in it:
+                    if entry.name == '.git' and not rel_dir:
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            listing[entry.name] = None
+                        else:
+                            stat = entry.stat(follow_symlinks=False)
+                            listing[entry.name] = (stat.st_mtime_ns, stat.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            return None
+        return listing
+
+    def _track(self, rel_dir):
+        listing = self._list(rel_dir)
+        if listing is not None and rel_dir not in self._listings:
+            self._listings[rel_dir] = listing
+            self._queue.append(rel_dir)
+
+    def wait(self, timeout=None):
+        """Bir tur bekle ve değişiklikleri döndür"""
+        delay = self.interval if timeout is None else min(timeout, self.interval)
+        if self._stop.wait(delay):
+            return []
+        events = []
+        meta = self._meta_stamps()
+        if meta != self._meta:
+            self._meta = meta
+            events.append(("meta", "", False))
+
+        for _ in range(min(self.dirs_per_round, len(self._queue))):
+            rel_dir = self._queue.popleft()
+            old = self._listings.get(rel_dir)
+            if old is None:
+                continue
+            new = self._list(rel_dir)
+            if new is None:
+                # Klasör silindi; üst klasörün taraması da bildirir
+                del self._listings[rel_dir]
+                events.append(("tree", rel_dir, True))
+                continue
+            self._listings[rel_dir] = new
+            self._queue.append(rel_dir)
+            for name in old.keys() | new.keys():
+                before, after = old.get(name, False), new.get(name, False)
+                if before == after:
+                    continue
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                is_dir = before is None or after is None
+                if after is None and before is not None and not self.matcher.is_ignored(rel_path, True):
+                    for child in iter_watch_directories(self.repo_dir, self.matcher, rel_path):
+                        self._track(child)
+                events.append(("tree", rel_path, is_dir))
+        return events
+
+    def wake(self):
+        self._stop.set()
+
+    def close(self):
+        self._stop.set()
+
+
+class RepoWatcher:
+    """Repository'yi izleyip RepoStatusModel'i artımlı günceller
+
+    Linux'ta InotifyBackend, diğer sistemlerde (veya izleme sınırı aşılırsa)
+    PollingBackend kullanılır. Olaylar debounce saniye sessizlik olana kadar,
+    en fazla max_delay saniye biriktirilir. .git meta verisi değiştiyse tam,
+    yalnızca çalışma ağacı değiştiyse yol sınırlı status çalışır. is_busy()
+    doğruyken (ör. yayınlama sürerken) yenileme ertelenir. Görüntü
+    değiştiğinde on_change(snapshot) watcher thread'inden çağrılır.
+    """
+
+    MAX_PATHS = 256   # daha fazla yol değiştiyse tek tam status daha ucuz
+
+    def __init__(self, repo_dir, snapshots, on_change, debounce=0.3, max_delay=2.0,
+                 poll_interval=1.0, is_busy=None, log=None, backend=None):
+        self.repo_dir = repo_dir
+        self.snapshots = snapshots
+        self.model = RepoStatusModel(repo_dir, snapshots)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.is_busy = is_busy
+        self.log = log
+        self.backend_name = backend   # None = otomatik seçim
+        self.backend = None
+        self.events = 0
+        self._stopped = threading.Event()
+        self._thread = None
+        self._signature = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stopped.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True, name="gitauto-watcher")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """İzlemeyi durdur (herhangi bir thread'den; beklemez)"""
+        self._stopped.set()
+        if self.backend is not None:
+            self.backend.wake()
+
+    def _log(self, message):
+        if self.log:
+            self.log(message)
+
+    def _create_backend(self, git_dir, matcher):
+        if self.backend_name != "poll" and InotifyBackend.available():
+            try:
+                return InotifyBackend(self.repo_dir, git_dir, matcher)
+            except OSError as e:
+                self._log(f"⚠️ inotify kullanılamadı ({e}), yoklamalı izlemeye geçiliyor")
+        return PollingBackend(self.repo_dir, git_dir, matcher, interval=self.poll_interval)
+
+    def _run(self):
+        git_dir = resolve_git_dir(self.repo_dir)
+        if git_dir is None:
+            return
+        # Yalnızca git'in kendi yoksayma kuralları: GitAuto listesi izlenen dosyaları gizleyebilir
+        matcher = IgnoreMatcher.for_project(self.repo_dir, include_builtin=False)
+        try:
+            self.backend = self._create_backend(git_dir, matcher)
+            if self._stopped.is_set():
+                return
+            # Yoklama değişiklikleri ancak turlar sonra görür; süre sınırı yalnızca inotify ile kalkar
+            if isinstance(self.backend, InotifyBackend):
+                self.snapshots.set_live(self.repo_dir, True)
+            # İzleme kurulurken oluşan değişiklikleri kaçırmamak için bir tam status
+            self._publish(self.model.refresh())
+            self._loop(matcher)
+        except Exception as e:
+            self._log(f"⚠️ Repository izleme durdu: {e}")
+        finally:
+            self.snapshots.set_live(self.repo_dir, False)
+            if self.backend is not None:
+                self.backend.close()
+
+    def _loop(self, matcher):
+        pending = set()
+        full = False
+        first = last = None
+        while not self._stopped.is_set():
+            if first is None:
+                timeout = None
+            else:
+                timeout = max(0.0, min(last + self.debounce, first + self.max_delay) - time.monotonic())
+            events = self.backend.wait(timeout)
+            if self._stopped.is_set():
+                break
+            now = time.monotonic()
+            for kind, path, is_dir in events:
+                if kind == "tree":
+                    if matcher.is_ignored(path, is_dir):
+                        continue
+                    pending.add(path)
+                else:
+                    full = True
+                self.events += 1
+                last = now
+                if first is None:
+                    first = now
+            if first is None or (now < last + self.debounce and now < first + self.max_delay):
+                continue
+            if self.is_busy is not None and self.is_busy():
+                # Repository'yi değiştiren iş sürüyor; bitince tek tam status
+                full = True
+                first = last = now
+                continue
+
+            try:
+                if full or len(pending) > self.MAX_PATHS:
+                    snapshot = self.model.refresh()
+                else:
+                    snapshot = self.model.update_paths(pending)
+            except (OSError, subprocess.SubprocessError) as e:
+                self._log(f"⚠️ Canlı durum güncellenemedi: {e}")
+                snapshot = None
+            pending = set()
+            full = False
+            first = last = None
+            if snapshot is not None:
+                self._publish(snapshot)
+
+    def _publish(self, snapshot):
+        """Görüntü önceki bildirilenden farklıysa on_change'e ilet"""
+        signature = (snapshot.state, snapshot.branch, snapshot.oid, snapshot.upstream,
+                     snapshot.ahead, snapshot.behind, tuple(sorted(snapshot.changes)))
+        if signature != self._signature:
+            self._signature = signature
+            self.on_change(snapshot)
+
+
+def list_git_files(project_dir, timeout=60, runner=None):
+    """git ls-files ile izlenen ve yoksayılmamış izlenmeyen dosyaları listele
+    
+    Yollar proje köküne göre '/' ayraçlıdır. git yoksa veya klasör bir git
+    deposu değilse None döner.
+    """
+    try:
+        paths = (runner or GIT).run_z(["ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                                      cwd=project_dir, timeout=timeout)
+    except subprocess.SubprocessError:
+        return None
+    if paths is None:
+        return None
+    # Birleşme çakışmasındaki dosyalar birden fazla kez listelenebilir
+    return list(dict.fromkeys(paths))
+
+
+def walk_git_files(project_dir, paths, matcher=None):
+    """git'ten gelen yol listesini walk_project ile aynı biçimde gez
+    
+    Dosya sistemi taranmaz; yalnızca listede dosyası olan klasörler için bir
+    scandir yapılır ve boyutlar DirEntry'den alınır (Windows'ta ek sistem
+    çağrısı gerektirmez). dirs listesinden çıkarılan klasörlere inilmez.
+    matcher verilmezse liste git'in kurallarıyla zaten süzülmüş kabul edilir.
+    """
+    if matcher is None:
+        matcher = IgnoreMatcher()
+    
+    files_by_dir = {}
+    children = {}
+    for path in paths:
+        rel_dir, _, name = path.rpartition('/')
+        files_by_dir.setdefault(rel_dir, set()).add(name)
+        # Üst klasör zincirini kaydet
+        while rel_dir:
+            parent, _, child = rel_dir.rpartition('/')
+            siblings = children.setdefault(parent, set())
+            if child in siblings:
+                break
+            siblings.add(child)
+            rel_dir = parent
+    
+    stack = ['']
+    while stack:
+        rel_dir = stack.pop()
+        abs_dir = os.path.join(project_dir, *rel_dir.split('/')) if rel_dir else project_dir
+        
+        dirs = []
+        for name in sorted(children.get(rel_dir, ())):
+            child_rel = f"{rel_dir}/{name}" if rel_dir else name
+            if not matcher.is_ignored(child_rel, True):
+                dirs.append(name)
+        
+        files = []
+        names = files_by_dir.get(rel_dir)
+        if names:
+            try:
+                with os.scandir(abs_dir) as it:
+                    for entry in it:
+                        if entry.name not in names:
+                            continue
+                        try:
+                            # Alt modüller (gitlink) klasör olarak görünür, atlanır
+                            if entry.is_dir(follow_symlinks=False):
+                                continue
+                        except OSError:
+                            continue
+                        rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                        if not matcher.is_ignored(rel_path, False):
+                            files.append(entry)
+            except OSError:
+                pass
+        
+        files.sort(key=lambda e: e.name)
+        yield rel_dir, dirs, files
+        
+        for name in reversed(dirs):
+            stack.append(f"{rel_dir}/{name}" if rel_dir else name)
+
+
+def iter_project_files(project_dir, include_builtin=True):
+    """Proje dosya envanteri: git deposu varsa git index'i, yoksa budayan tarayıcı
+    
+    include_builtin=True GitAuto'nun yerleşik yoksayma listesini de uygular
+    (README/analiz envanteri); False ise git'in yayınlayacağı dosyaların tamamı döner.
+    """
+    if os.path.exists(os.path.join(project_dir, '.git')):
+        paths = list_git_files(project_dir)
+        if paths is not None:
+            matcher = IgnoreMatcher.builtin() if include_builtin else IgnoreMatcher()
+            return walk_git_files(project_dir, paths, matcher)
+    return walk_project(project_dir, include_builtin=include_builtin)
+
+
+class FileRecord:
+    """Proje envanterindeki tek dosya - dict yerine __slots__ ile kompakt kayıt
+    
+    Klasör yolu aynı klasördeki tüm kayıtlarca paylaşılır ve uzantılar intern
+    edilir; tam yol saklanmaz, gerektiğinde üretilir. Analiz, büyük dosya
+    tespiti ve klasör listeleme aynı kaydı kullanır.
+    """
+    
+    __slots__ = ("directory", "name", "size", "extension")
+    
+    def __init__(self, directory, name, size):
+        # directory: proje köküne göre (os.sep ayraçlı) klasör, kök için ''
+        self.directory = directory
+        self.name = name
+        self.size = size
+        self.extension = sys.intern(os.path.splitext(name)[1])
+    
+    @property
+    def path(self):
+        """Proje köküne göre dosya yolu"""
+        return os.path.join(self.directory, self.name) if self.directory else self.name
+    
+    def __repr__(self):
+        return f"FileRecord({self.path!r}, {self.size})"
+
+
+def record_directory(rel_dir):
+    """Tarayıcıdan gelen '/' ayraçlı klasörü kayıtlarda paylaşılan biçime çevir"""
+    return sys.intern(rel_dir.replace('/', os.sep)) if rel_dir else ''
+
+
+def get_cache_dir(*parts):
+    """GitAuto'nun kullanıcıya özel önbellek klasörünü döndür (gerekirse oluştur)"""
+    base = os.environ.get("GITAUTO_CACHE_DIR")
+    if not base:
+        if os.name == 'nt':
+            base = os.path.join(os.environ.get("LOCALAPPDATA") or os.path.expanduser("~"), "GitAuto", "Cache")
+        else:
+            base = os.path.join(os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "gitauto")
+    path = os.path.join(base, *parts)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _replace_atomic(path, write, mode=None):
+    """write(f) ile geçici dosyaya yaz ve tek adımda hedefin yerine koy"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            write(f)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _write_json_atomic(path, data):
+    """JSON'u geçici dosyaya yazıp tek adımda yerine koy"""
+    _replace_atomic(path, lambda f: json.dump(data, f, ensure_ascii=False, separators=(",", ":")))
+
+
+def write_text_atomic(path, text):
+    """Metin dosyasını atomik yaz; yarım kalan yazma eski dosyayı bozmaz
+    
+    mkstemp 0600 izinle oluşturduğu için mevcut dosyanın izinleri korunur,
+    yeni dosyada umask'a göre normal izin verilir.
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o777
+    except OSError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+    _replace_atomic(path, lambda f: f.write(text), mode=mode)
+
+
+class AnalysisCache:
+    """Dosya parmak izine göre anahtarlanmış kalıcı analiz önbelleği
+    
+    Her girdi yol, boyut, mtime ve içerik özetini saklar. Boyut ve mtime
+    aynıysa sonuç yalnızca bir stat ile kullanılır; mtime değişip boyut aynı
+    kaldıysa içerik özeti karşılaştırılır. Taramada görülmeyen (silinmiş)
+    dosyaların girdileri atılır, kapasite aşılınca en eski kullanılanlar silinir.
+    """
+    
+    # Çıkarım mantığı değiştiğinde artırılır; eski önbellek yok sayılır
+    VERSION = 4
+    
+    def __init__(self, project_dir, max_entries=100000, cache_dir=None):
+        self.project_dir = os.path.abspath(project_dir)
+        self.max_entries = max_entries
+        key = hashlib.sha1(os.path.normcase(self.project_dir).encode("utf-8")).hexdigest()
+        self.path = os.path.join(cache_dir or get_cache_dir("analysis"), f"{key}.json")
+        self.entries = {}
+        self.clock = 0
+        self.hits = 0
+        self.misses = 0
+        self.seen = set()
+        self.dirty = False
+        self._load()
+    
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.VERSION or data.get("project") != self.project_dir:
+            return
+        self.entries = data.get("entries", {})
+        self.clock = data.get("clock", 0)
+    
+    @staticmethod
+    def digest(data):
+        """Ham dosya içeriğinin özeti"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+    
+    def lookup(self, kind, rel_path, size, mtime_ns, abs_path=None):
+        """Geçerli sonuç varsa döndür, yoksa None"""
+        self.seen.add(rel_path)
+        entry = self.entries.get(rel_path)
+        if entry is None or entry["kind"] != kind or entry["size"] != size:
+            self.misses += 1
+            return None
+        if entry["mtime_ns"] != mtime_ns:
+            # Dosyaya dokunulmuş ama içerik aynı olabilir (checkout, kopyalama)
+            if abs_path is None:
+                self.misses += 1
+                return None
+            try:
+                if file_digest(abs_path) != entry["hash"]:
+                    self.misses += 1
+                    return None
+            except OSError:
+                self.misses += 1
+                return None
+            entry["mtime_ns"] = mtime_ns
+        self.clock += 1
+        entry["used"] = self.clock
+        self.dirty = True
+        self.hits += 1
+        return entry["result"]
+    
+    def store(self, kind, rel_path, size, mtime_ns, content_hash, result):
+        """Yeni analiz sonucunu kaydet"""
+        self.seen.add(rel_path)
+        self.clock += 1
+        self.entries[rel_path] = {
+            "kind": kind,
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "hash": content_hash,
+            "result": result,
+            "used": self.clock,
+        }
+        self.dirty = True
+    
+    def save(self):
+        """Silinmiş dosyaları ve LRU fazlasını at, önbelleği diske yaz"""
+        stale = [path for path in self.entries if path not in self.seen]
+        for path in stale:
+            del self.entries[path]
+        if len(self.entries) > self.max_entries:
+            ordered = sorted(self.entries.items(), key=lambda item: item[1]["used"])
+            for path, _ in ordered[:len(self.entries) - self.max_entries]:
+                del self.entries[path]
+        if not (self.dirty or stale):
+            return
+        _write_json_atomic(self.path, {
+            "version": self.VERSION,
+            "project": self.project_dir,
+            "clock": self.clock,
+            "entries": self.entries,
+        })
+        self.dirty = False
+
+
+class ResponseCache:
+    """Model, uç nokta ve istem metninin özetiyle anahtarlanan yanıt önbelleği
+    
+    Her yanıt ayrı bir dosyada tutulur; dosyanın mtime değeri son kullanım
+    zamanıdır. Süresi (TTL) dolan girdiler okunurken silinir, girdi sayısı
+    veya toplam boyut sınırı aşılınca en eski kullanılanlar atılır.
+    """
+    
+    def __init__(self, ttl=7 * 24 * 3600, max_entries=200, max_bytes=50 * 1024 * 1024,
+                 cache_dir=None):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.directory = cache_dir or get_cache_dir("responses")
+        os.makedirs(self.directory, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(model, endpoint, prompt):
+        """İsteği benzersiz tanımlayan içerik özeti"""
+        return hashlib.sha256("\0".join((model, endpoint, prompt)).encode("utf-8")).hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+    
+    def get(self, key):
+        """Geçerli yanıt varsa metnini döndür, yoksa None"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)  # LRU için son kullanım zamanı
+        except OSError:
+            pass
+        self.hits += 1
+        return entry.get("text")
+    
+    def put(self, key, text, model=""):
+        """Yanıtı kaydet ve sınırları aşan eski girdileri at"""
+        _write_json_atomic(self._path(key), {"created": time.time(), "model": model, "text": text})
+        self._evict()
+    
+    def _evict(self):
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort(reverse=True)
+        total = 0
+        for index, (_, size, path) in enumerate(entries):
+            total += size
+            if index >= self.max_entries or total > self.max_bytes:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+
+# Tek geçişli sembol tarayıcıları - her dil için tüm sembol türleri tek bir
+# derlenmiş regex'te adlandırılmış gruplarla birleştirilir ve içerik bir kez taranır.
+# Satır başı gerektiren kalıplar '^' yerine '\n' ile başlar; böylece her dal
+# sabit bir karakterle başlar ve regex motoru hızlı ön-ek taramasını kullanabilir.
+# İlk satır için kalıpların '\n' içermeyen ayrı bir sürümü kullanılır.
+_NAME = r'[a-zA-Z_][a-zA-Z0-9_]*'
+_CONST = r'[A-Z_][A-Z0-9_]*'
+_C_STYLE_COMMENTS = [
+    (False, r'//[ \t]*(?P<comment>[^\n]+)'),
+    (False, r'/\*\s*(?P<block_comment>[\s\S]+?)\*/'),
+]
+
+# uzantı -> [(satır_başı_mı, kalıp), ...]
+_SCANNER_SPECS = {
+    '.py': [
+        (True, r'(?:from|import)[ \t]+(?P<import>[\w \t,\.]+)'),
+        (True, rf'def[ \t]+(?P<function>{_NAME})[ \t]*\('),
+        (True, rf'class[ \t]+(?P<class>{_NAME})[ \t]*(?:\(|:)'),
+        (True, rf'(?P<variable>{_CONST})[ \t]*='),
+        (False, r'#[ \t]*(?P<comment>[^\n]+)'),
+    ],
+    '.js': _C_STYLE_COMMENTS + [
+        (True, r'(?:import|require|from)[ \t]+(?P<import>[\w \t,\.\{\}]+)'),
+        (False, rf'function[ \t]+(?P<function>{_NAME})'),
+        # const/let/var ayrı dallar: ortak '(?:const|let|var)' dalı sabit bir
+        # karakterle başlamadığından ön-ek taramasını tüm kalıp için kapatıyordu
+        (False, rf'const[ \t]+(?P<const>{_NAME})[ \t]*=[ \t]*(?P<const_call>\()?'),
+        (False, rf'let[ \t]+(?P<let>{_NAME})[ \t]*=[ \t]*(?P<let_call>\()?'),
+        (False, rf'var[ \t]+(?P<var>{_NAME})[ \t]*=[ \t]*(?P<var_call>\()?'),
+        (False, rf'class[ \t]+(?P<class>{_NAME})[ \t]*(?:extends|implements|\{{)'),
+    ],
+    '.java': _C_STYLE_COMMENTS + [
+        (True, r'import[ \t]+(?P<import>[\w\.]+)'),
+        (True, rf'[ \t]*(?:(?:public|private|protected|static|final)[ \t]+)*[a-zA-Z<>\[\]]+[ \t]+(?P<variable>{_CONST})[ \t]*;'),
+        (False, rf'class[ \t]+(?P<class>{_NAME})[ \t]*(?:extends|implements|\{{)'),
+        (False, rf'[a-zA-Z<>\[\]]+[ \t]+(?P<function>{_NAME})[ \t]*\('),
+    ],
+    '.cpp': _C_STYLE_COMMENTS + [
+        (True, r'#include[ \t]+[<"](?P<import>[^>"\n]+)[>"]'),
+        (True, rf'(?:int|double|float|string|char|bool)[ \t]+(?P<variable>{_CONST})[ \t]*;'),
+        (False, rf'class[ \t]+(?P<class>{_NAME})[ \t]*(?:\{{|:)'),
+        (False, rf'(?P<function>{_NAME})[ \t]+{_NAME}[ \t]*\([^)]*\)\s*\{{'),
+    ],
+    '.php': _C_STYLE_COMMENTS + [
+        (False, r'#[ \t]*(?P<hash_comment>[^\n]+)'),
+        (True, r'use[ \t]+(?P<import>[\w\\]+)'),
+        (False, rf'function[ \t]+(?P<function>{_NAME})[ \t]*\('),
+        (False, rf'class[ \t]+(?P<class>{_NAME})[ \t]*(?:extends|implements|\{{)'),
+        (True, rf'\$(?P<variable>{_CONST})[ \t]*='),
+    ],
+    '.go': _C_STYLE_COMMENTS + [
+        (True, r'import[ \t]+(?P<import>[\w \t"\.]+)'),
+        (False, rf'func[ \t]+(?P<function>{_NAME})[ \t]*\('),
+        (False, rf'type[ \t]+(?P<class>{_NAME})[ \t]+struct'),
+        (True, rf'var[ \t]+(?P<variable>{_CONST})'),
+    ],
+    '.rs': _C_STYLE_COMMENTS + [
+        (True, r'use[ \t]+(?P<import>[\w \t:]+)'),
+        (False, rf'fn[ \t]+(?P<function>{_NAME})[ \t]*\('),
+        (False, rf'struct[ \t]+(?P<class>{_NAME})[ \t]*\{{'),
+        (True, rf'let[ \t]+(?P<variable>{_CONST})[ \t]*:'),
+    ],
+}
+for _ext in ('.ts', '.jsx', '.tsx'):
+    _SCANNER_SPECS[_ext] = _SCANNER_SPECS['.js']
+
+_CONST_RE = re.compile(_CONST)
+
+# JS/TS bildirim grubu -> (ad grubu, fonksiyon sayılır mı)
+_DECL_GROUPS = {
+    'const': ('const', False),
+    'const_call': ('const', True),
+    'let': ('let', False),
+    'let_call': ('let', True),
+    'var': ('var', False),
+    'var_call': ('var', False),
+}
+
+
+def _compile_scanner(spec, first_line=False, as_bytes=False):
+    """Dil tanımından birleşik regex derle (büyük dosyalar için bayt sürümü de)"""
+    alternatives = []
+    for line_start, body in spec:
+        if line_start and not first_line:
+            body = r'\n' + body
+        alternatives.append(f'(?:{body})')
+    pattern = '|'.join(alternatives)
+    return re.compile(pattern.encode('ascii') if as_bytes else pattern)
+
+
+# uzantı -> (ana tarayıcı, ilk satır tarayıcısı)
+LANGUAGE_SCANNERS = {
+    extension: (_compile_scanner(spec), _compile_scanner(spec, first_line=True))
+    for extension, spec in _SCANNER_SPECS.items()
+}
+
+# mmap üzerinde çözümlemeden taramak için bayt düzeyinde aynı kalıplar
+LANGUAGE_BYTE_SCANNERS = {
+    extension: (_compile_scanner(spec, as_bytes=True), _compile_scanner(spec, first_line=True, as_bytes=True))
+    for extension, spec in _SCANNER_SPECS.items()
+}
+
+# Adlandırılmış grup -> sonuç listesi
+_SYMBOL_GROUPS = {
+    'import': 'imports',
+    'function': 'functions',
+    'class': 'classes',
+    'variable': 'variables',
+    'comment': 'comments',
+    'block_comment': 'comments',
+    'hash_comment': 'comments',
+}
+
+# Sonuç türü -> kabul için aşılması gereken uzunluk (diğerleri boş olmamalı)
+_MIN_SYMBOL_LENGTHS = {
+    'comments': 10,
+    'variables': 2,
+}
+
+# Bellek sınırlı okuma: bu boyutun altındaki dosyalar tamamen okunur, üstündekiler
+# mmap ile yalnızca baş ve son pencereleri bayt düzeyinde taranır
+FULL_READ_LIMIT = 2 * 1024 * 1024
+LARGE_FILE_HEAD_BYTES = 1024 * 1024
+LARGE_FILE_TAIL_BYTES = 256 * 1024
+
+
+def _new_symbol_analysis():
+    return {
+        "imports": [],
+        "functions": [],
+        "classes": [],
+        "variables": [],
+        "comments": []
+    }
+
+
+def _scan_symbols(analysis, buffer, scanners, pos=0, endpos=None, first_line=True):
+    """Tampondaki [pos, endpos) aralığını tek geçişte tara (str, bytes veya mmap)"""
+    scanner, first_line_scanner = scanners
+    if endpos is None:
+        endpos = len(buffer)
+    is_bytes = not isinstance(buffer, str)
+    newline = b'\n' if is_bytes else '\n'
+    
+    # İlk satırda '\n' öneki olmadığından satır başı kalıpları ayrıca denenir
+    first = first_line_scanner.match(buffer, pos, endpos) if first_line else None
+    matches = scanner.finditer(buffer, first.end() if first else pos, endpos)
+    if first:
+        matches = itertools.chain((first,), matches)
+    
+    # grup -> (hedef liste, kabul için aşılması gereken uzunluk)
+    targets = {group: (analysis[kind], _MIN_SYMBOL_LENGTHS.get(kind, 0)) for group, kind in _SYMBOL_GROUPS.items()}
+    variables = analysis["variables"]
+    functions = analysis["functions"]
+    
+    for match in matches:
+        group = match.lastgroup
+        decl = _DECL_GROUPS.get(group)
+        if decl:
+            # JS/TS: const/let/var bildirimi hem fonksiyon hem sabit olabilir
+            name_group, is_function = decl
+            name = match.group(name_group)
+            if is_bytes:
+                name = name.decode('ascii')
+            if is_function:
+                functions.append(name)
+            if len(name) > 2:
+                start = match.start()
+                if (start == 0 or buffer[start - 1:start] == newline) and _CONST_RE.fullmatch(name):
+                    variables.append(name)
+            continue
+        
+        value = match.group(group)
+        if is_bytes:
+            value = value.decode('utf-8', errors='ignore')
+        value = value.strip()
+        target, min_length = targets[group]
+        if len(value) > min_length:
+            target.append(value)
+    
+    return analysis
+
+
+def extract_code_symbols(content, extension):
+    """Kaynak metinden import, fonksiyon, class, değişken ve yorumları tek geçişte çıkar
+    
+    Modül seviyesinde tutulur ki süreç havuzundaki işçilere gönderilebilsin.
+    """
+    analysis = _new_symbol_analysis()
+    scanners = LANGUAGE_SCANNERS.get(extension)
+    if scanners is None:
+        return analysis
+    return _scan_symbols(analysis, content, scanners)
+
+
+def _large_file_windows(buffer, size):
+    """Büyük dosyada taranacak baş ve son pencereleri satır sınırına hizalı döndür"""
+    head_end = buffer.rfind(b'\n', 0, LARGE_FILE_HEAD_BYTES)
+    if head_end == -1:
+        head_end = LARGE_FILE_HEAD_BYTES
+    windows = [(0, head_end, True)]
+    tail_start = max(head_end, size - LARGE_FILE_TAIL_BYTES)
+    newline = buffer.find(b'\n', tail_start)
+    if newline != -1:
+        windows.append((newline, size, False))
+    return windows
+
+
+# Analize değmeyen dosyaların sınıflandırılması (ikili, minify, üretilmiş, vendored)
+CLASSIFIER_SNIFF_BYTES = 8192
+
+_VENDORED_DIRS = {
+    'vendor', 'vendors', 'third_party', 'third-party', 'thirdparty', 'external', 'externals',
+    'bower_components', 'jspm_packages', 'site-packages', 'dist-packages',
+}
+_GENERATED_DIRS = {'generated', '__generated__', 'gen-src', 'codegen'}
+_MINIFIED_SUFFIXES = ('.min.js', '.min.mjs', '.min.css', '-min.js', '.bundle.js', '.chunk.js', '.packed.js')
+_GENERATED_SUFFIXES = (
+    '_pb2.py', '_pb2_grpc.py', '.pb.go', '.pb.cc', '.pb.h', '.pb.ts', '_pb.js', '_grpc_pb.js',
+    '.g.dart', '.freezed.dart', '.g.cs', '.designer.cs', '.generated.cs', '.generated.ts',
+    '.generated.js', '_generated.go', '.gen.go',
+)
+_GENERATED_MARKERS = (b'@generated', b'do not edit', b'auto-generated', b'autogenerated',
+                      b'code generated by', b'generated by the protocol buffer')
+
+
+def classify_source_path(rel_path):
+    """Yalnızca yol kurallarıyla sınıflandır; atlanacaksa nedeni, yoksa None döndür"""
+    parts = rel_path.replace('\\', '/').lower().split('/')
+    name = parts[-1]
+    if name.endswith(_MINIFIED_SUFFIXES):
+        return "minified"
+    if name.endswith(_GENERATED_SUFFIXES):
+        return "generated"
+    for part in parts[:-1]:
+        if part in _VENDORED_DIRS:
+            return "vendored"
+        if part in _GENERATED_DIRS:
+            return "generated"
+    return None
+
+
+def classify_source_head(head):
+    """Dosyanın ilk baytlarına bakarak sınıflandır (NUL, üretici işareti, satır uzunluğu)"""
+    if b'\x00' in head:
+        return "binary"
+    if any(marker in head[:1024].lower() for marker in _GENERATED_MARKERS):
+        return "generated"
+    if len(head) >= 1024:
+        lines = head.split(b'\n')
+        # Son satır örnekleme sınırında kesilmiş olabilir, hesaba katılmaz
+        complete = lines[:-1] or lines
+        longest = max(len(line) for line in complete)
+        average = sum(len(line) for line in complete) / len(complete)
+        if longest > 1000 or average > 200:
+            return "minified"
+    return None
+
+
+def classify_source_file(rel_path, head):
+    """Yol ve baş içerik kurallarını birlikte uygula"""
+    return classify_source_path(rel_path) or classify_source_head(head)
+
+
+def extract_code_symbols_from_file(file_path, extension):
+    """Dosyayı bellek bütçesiyle analiz et; (sonuç, içerik_özeti) döndür
+    
+    FULL_READ_LIMIT altındaki dosyalar tamamen okunur. Daha büyük dosyalar
+    (ör. üretilmiş/minify edilmiş paketler) mmap ile açılır ve yalnızca baş ve
+    son pencereleri bayt kalıplarıyla taranır; içerik hiçbir zaman tamamen
+    çözümlenmez, böylece bellek kullanımı dosya boyutundan bağımsız kalır.
+    İkili, minify edilmiş veya üretilmiş dosyalar için {"skipped": neden} döner.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= FULL_READ_LIMIT:
+            data = f.read()
+            reason = classify_source_head(data[:CLASSIFIER_SNIFF_BYTES])
+            if reason:
+                return {"skipped": reason}, AnalysisCache.digest(data)
+            return extract_code_symbols(decode_source(data), extension), AnalysisCache.digest(data)
+        
+        analysis = _new_symbol_analysis()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            reason = classify_source_head(mm[:CLASSIFIER_SNIFF_BYTES])
+            if reason:
+                return {"skipped": reason}, _large_file_digest(mm, size)
+            scanners = LANGUAGE_BYTE_SCANNERS.get(extension)
+            if scanners is not None:
+                for start, end, first_line in _large_file_windows(mm, size):
+                    _scan_symbols(analysis, mm, scanners, start, end, first_line)
+            return analysis, _large_file_digest(mm, size)
+
+
+def _large_file_digest(buffer, size):
+    """Büyük dosyalar için boyut + baş + son pencereden oluşan kısmi özet"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(size).encode('ascii'))
+    digest.update(buffer[:LARGE_FILE_HEAD_BYTES])
+    digest.update(buffer[max(0, size - LARGE_FILE_TAIL_BYTES):size])
+    return digest.hexdigest()
+
+
+def file_digest(file_path):
+    """Önbellek karşılaştırması için dosya içerik özeti (büyük dosyalarda kısmi)"""
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= FULL_READ_LIMIT:
+            return AnalysisCache.digest(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _large_file_digest(mm, size)
+
+
+# Paralel analiz ayarları - ortam değişkenleriyle değiştirilebilir
+DEFAULT_ANALYSIS_WORKERS = int(os.environ.get("GITAUTO_ANALYSIS_WORKERS", "0")) or None
+DEFAULT_ANALYSIS_CHUNK_SIZE = int(os.environ.get("GITAUTO_ANALYSIS_CHUNK_SIZE", "32"))
+DEFAULT_ANALYSIS_IO_WORKERS = 4
+
+
+def decode_source(data):
+    """Ham baytları metin moduyla aynı şekilde (UTF-8, satır sonları normalize) çöz"""
+    return data.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _read_source_chunk(chunk, root=None):
+    """Okuma aşaması: (dosya_yolu, uzantı) listesini (içerik, uzantı, özet, yol) listesine çevir
+    
+    root verilirse yollar ona göredir ve tam yol ancak okurken üretilir.
+    Büyük dosyalar burada okunmaz; işçi süreç onları mmap ile tarar.
+    """
+    contents = []
+    for file_path, extension in chunk:
+        if root:
+            file_path = os.path.join(root, file_path)
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > FULL_READ_LIMIT:
+                    contents.append((None, extension, None, file_path))
+                    continue
+                data = f.read()
+            reason = classify_source_head(data[:CLASSIFIER_SNIFF_BYTES])
+            if reason:
+                # Atlanan dosyanın içeriği işçi sürece gönderilmez
+                contents.append(({"skipped": reason}, extension, AnalysisCache.digest(data), None))
+            else:
+                contents.append((decode_source(data), extension, AnalysisCache.digest(data), None))
+        except OSError:
+            contents.append((None, extension, None, None))
+    return contents
+
+
+def _extract_symbols_chunk(contents):
+    """Çıkarım aşaması: süreç havuzunda bir parça dosyayı analiz et"""
+    results = []
+    for content, extension, content_hash, large_file_path in contents:
+        try:
+            if large_file_path is not None:
+                result, content_hash = extract_code_symbols_from_file(large_file_path, extension)
+            elif isinstance(content, dict):
+                result = content
+            else:
+                result = extract_code_symbols(content, extension) if content is not None else {}
+        except Exception:
+            result = {}
+        results.append((result, content_hash))
+    return results
+
+
+def analyze_code_files(jobs, max_workers=None, chunk_size=DEFAULT_ANALYSIS_CHUNK_SIZE,
+                       io_workers=DEFAULT_ANALYSIS_IO_WORKERS, root=None):
+    """(dosya_yolu, uzantı) işlerini aşamalı boru hattında analiz et (yollar root'a göre olabilir)
+    
+    Thread havuzu dosya içeriklerini önceden okur, süreç havuzu sembol
+    çıkarımını tüm çekirdeklere dağıtır; (sonuç, içerik_özeti) çiftleri giriş
+    sırasıyla üretilir.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return
+    
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = max(1, chunk_size)
+    
+    # Küçük projelerde süreç havuzunu başlatma maliyetine değmez
+    if max_workers <= 1 or len(jobs) <= chunk_size:
+        for result in _extract_symbols_chunk(_read_source_chunk(jobs, root)):
+            yield result
+        return
+    
+    try:
+        # fork yerine spawn: havuz çok thread'li Tk sürecinin bir iş thread'inden açılır ve
+        # fork edilen çocuk devralınan (logging, bellek ayırıcı vb.) kilitlerde takılabilir
+        process_pool = ProcessPoolExecutor(max_workers=max_workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+    except (OSError, NotImplementedError, ImportError):
+        # Süreç havuzu kullanılamıyorsa (ör. kısıtlı ortam) seri çalış
+        for result in _extract_symbols_chunk(_read_source_chunk(jobs, root)):
+            yield result
+        return
+    
+    chunks = iter([jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)])
+    max_in_flight = max_workers * 2
+    
+    with ThreadPoolExecutor(max_workers=io_workers) as reader, process_pool:
+        # Her eleman [okuma_future, çıkarım_future] - deque sırası çıktı sırasıdır
+        stages = deque()
+        
+        def fill():
+            while len(stages) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    return
+                stages.append([reader.submit(_read_source_chunk, chunk, root), None])
+        
+        def submit_ready():
+            for stage in stages:
+                if stage[1] is None and stage[0].done():
+                    stage[1] = process_pool.submit(_extract_symbols_chunk, stage[0].result())
+        
+        fill()
+        while stages:
+            submit_ready()
+            # Sıralı birleştirici: her zaman en eski parçayı bekle
+            head = stages[0]
+            if head[1] is None:
+                head[1] = process_pool.submit(_extract_symbols_chunk, head[0].result())
+            results = head[1].result()
+            stages.popleft()
+            fill()
+            for result in results:
+                yield result
+
+
+# Gemini isteminde her bölümden gönderilebilecek en fazla öğe sayısı; sembol
+# toplayıcılarının K değeri de buradan gelir. Gerçekte kaç öğe gönderileceğine
+# PromptBuilder token bütçesine göre karar verir.
+PROMPT_SECTION_LIMITS = {
+    "dependencies": 60,
+    "main_files": 40,
+    "folders": 60,
+    "imports": 80,
+    "functions": 60,
+    "classes": 40,
+    "variables": 30,
+    "comments": 15,
+}
+
+# İstem token bütçesi ve tek öğe için en fazla karakter sayısı
+PROMPT_TOKEN_BUDGET = int(os.environ.get("GITAUTO_PROMPT_TOKENS", "4000"))
+PROMPT_ITEM_MAX_CHARS = 160
+
+
+def estimate_tokens(text):
+    """Kaba token tahmini (~4 karakter = 1 token)"""
+    return (len(text) + 3) // 4
+
+
+class PromptBuilder:
+    """Token bütçesine göre bölüm bölüm doldurulan istem oluşturucu
+    
+    Sabit metinler her zaman eklenir. Liste bölümleri öncelik sırasıyla
+    (küçük sayı önce) kalan bütçe yettiği kadar doldurulur, ancak istemde
+    eklendikleri sırayla yer alır. Öğeler tekilleştirilir ve uzun olanlar
+    kısaltılır.
+    """
+    
+    def __init__(self, budget=PROMPT_TOKEN_BUDGET, item_max_chars=PROMPT_ITEM_MAX_CHARS):
+        self.budget = budget
+        self.item_max_chars = item_max_chars
+        self.parts = []
+        self.token_estimate = 0
+        # Bölüm etiketi -> (gönderilen, aday) öğe sayısı
+        self.section_counts = {}
+    
+    def add_text(self, text):
+        """Bütçeden bağımsız, her zaman eklenen metin"""
+        self.parts.append(text)
+        return self
+    
+    def add_section(self, label, items, priority, limit=None):
+        """'label: a, b, c' satırı olarak eklenecek liste bölümü"""
+        self.parts.append({"label": label, "items": self._clean(items, limit),
+                           "priority": priority, "chosen": []})
+        return self
+    
+    def _clean(self, items, limit):
+        seen = set()
+        cleaned = []
+        for item in items:
+            item = " ".join(str(item).split())
+            if len(item) > self.item_max_chars:
+                item = item[:self.item_max_chars - 1] + "…"
+            if not item or item in seen:
+                continue
+            seen.add(item)
+            cleaned.append(item)
+            if limit is not None and len(cleaned) >= limit:
+                break
+        return cleaned
+    
+    def build(self):
+        """İstemi oluştur; token_estimate ve section_counts güncellenir"""
+        sections = [part for part in self.parts if isinstance(part, dict)]
+        used = sum(estimate_tokens(part) for part in self.parts if isinstance(part, str))
+        used += sum(estimate_tokens(f"{section['label']}: \n") for section in sections)
+        
+        for section in sorted(sections, key=lambda section: section["priority"]):
+            for item in section["items"]:
+                cost = estimate_tokens(item + ", ")
+                if used + cost > self.budget:
+                    break
+                section["chosen"].append(item)
+                used += cost
+        
+        lines = []
+        for part in self.parts:
+            if isinstance(part, str):
+                lines.append(part)
+            else:
+                lines.append(f"{part['label']}: {', '.join(part['chosen'])}\n")
+                self.section_counts[part["label"]] = (len(part["chosen"]), len(part["items"]))
+        prompt = "".join(lines)
+        self.token_estimate = estimate_tokens(prompt)
+        return prompt
+
+
+class TopKCollector:
+    """Sabit bellekli, tekrarları sayan en sık K öğe toplayıcısı
+    
+    En fazla 2 * capacity farklı öğe tutulur; sınır aşılınca sayısı en düşük
+    olanlar atılır (kayıplı sayım). Böylece bellek proje boyutundan bağımsız
+    kalır ve sonuç tarama sırasına değil tüm projedeki sıklığa göre oluşur.
+    """
+    
+    def __init__(self, k, capacity=None):
+        self.k = k
+        self.capacity = max(capacity or k * 8, k)
+        self.counts = {}
+        self.total = 0
+    
+    def update(self, items):
+        counts = self.counts
+        for item in items:
+            counts[item] = counts.get(item, 0) + 1
+            self.total += 1
+        if len(counts) > 2 * self.capacity:
+            self._prune()
+    
+    def _prune(self):
+        # Sıralama kararlıdır: eşit sayılarda ilk görülen öğe korunur
+        kept = sorted(self.counts.items(), key=lambda item: -item[1])[:self.capacity]
+        self.counts = dict(kept)
+    
+    def most_common(self, k=None):
+        """En sık k öğeyi (varsayılan K) sıklık sırasıyla döndür"""
+        ordered = sorted(self.counts.items(), key=lambda item: -item[1])
+        return [item for item, _ in ordered[:k or self.k]]
+
+
+# Proje amacı göstergeleri; teknoloji/bağımlılık adlarında alt dize olarak aranır
+PURPOSE_INDICATORS = {
+    "web": ["flask", "django", "express", "react", "vue", "angular", "html", "css", "web"],
+    "api": ["api", "rest", "graphql", "endpoint", "controller", "route"],
+    "desktop": ["tkinter", "pyqt", "wx", "electron", "javafx", "swing"],
+    "mobile": ["react-native", "flutter", "kotlin", "swift", "mobile"],
+    "data": ["pandas", "numpy", "matplotlib", "scikit", "tensorflow", "pytorch", "data"],
+    "game": ["pygame", "unity", "unreal", "game", "sprite", "collision"],
+    "cli": ["click", "argparse", "typer", "command", "cli", "terminal"],
+    "library": ["setup.py", "pyproject.toml", "lib", "module", "package"]
+}
+
+
+class PurposeIndex:
+    """Amaç göstergeleri için bir kez kurulan indeks
+    
+    Göstergeler tekilleştirilip her birinin bağlı olduğu amaçlar önceden
+    eşlenir. Tarama sırasında teknoloji adları tek bir metinde birleştirilir ve
+    her gösterge bu metinde bir kez (C tarafında) aranır; böylece maliyet
+    amaç x gösterge x bağımlılık Python döngüsü yerine gösterge sayısı kadar
+    alt dize aramasıdır. Skor, eski yöntemle aynı şekilde her amaç için
+    eşleşen farklı gösterge sayısıdır.
+    """
+    
+    def __init__(self, indicators):
+        self.purposes = list(indicators)
+        # Gösterge -> bağlı olduğu amaçlar (aynı gösterge birden çok amaçta olabilir)
+        self.indicator_purposes = {}
+        for purpose, words in indicators.items():
+            for word in words:
+                self.indicator_purposes.setdefault(word, []).append(purpose)
+        self.totals = {purpose: len(words) for purpose, words in indicators.items()}
+    
+    def matches(self, technologies):
+        """Teknoloji adlarında geçen göstergelerin listesini döndür"""
+        # Göstergeler satır sonu içermediği için adlar arası yanlış eşleşme olmaz
+        text = "\n".join({tech.lower() for tech in technologies})
+        return [word for word in self.indicator_purposes if word in text]
+    
+    def score(self, technologies):
+        """Amaç başına {"score", "confidence"} sözlüğü döndür"""
+        scores = dict.fromkeys(self.purposes, 0)
+        for word in self.matches(technologies):
+            for purpose in self.indicator_purposes[word]:
+                scores[purpose] += 1
+        return {
+            purpose: {"score": score, "confidence": round(score / self.totals[purpose], 3)}
+            for purpose, score in scores.items()
+        }
+
+
+PURPOSE_INDEX = PurposeIndex(PURPOSE_INDICATORS)
+
+
+
+# Gemini API ayarları; GITAUTO_GEMINI_BASE_URL ile yerel bir test sunucusuna yönlendirilebilir
+GEMINI_BASE_URL = os.environ.get("GITAUTO_GEMINI_BASE_URL",
+                                 "https://generativelanguage.googleapis.com/v1")
+GEMINI_MODEL = "gemini-1.5-flash"
+GEMINI_CONNECT_TIMEOUT = 10
+GEMINI_READ_TIMEOUT = 120
+
+# Hız sınırı (dakikada istek; 0 = sınırsız) ve tekrar deneme ayarları
+GEMINI_REQUESTS_PER_MINUTE = float(os.environ.get("GITAUTO_GEMINI_RPM", "15"))
+GEMINI_MAX_RETRIES = int(os.environ.get("GITAUTO_GEMINI_MAX_RETRIES", "4"))
+GEMINI_RETRY_BUDGET = 120  # tek çağrıda beklemelere harcanabilecek en fazla süre (sn)
+GEMINI_BACKOFF_BASE = 1.0
+GEMINI_BACKOFF_CAP = 30.0
+
+# Tekrar denemeye değer HTTP durumları
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class GeminiCancelled(Exception):
+    """Gemini isteği kullanıcı tarafından iptal edildi"""
+
+
+class GeminiHTTPError(Exception):
+    """Gemini'den 200 dışı yanıt"""
+    
+    def __init__(self, status, body, retry_after=None):
+        super().__init__(f"API hatası: {status} - {body}")
+        self.status = status
+        self.retry_after = retry_after
+    
+    @property
+    def retryable(self):
+        return self.status in RETRYABLE_STATUSES
+
+
+def parse_retry_after(value):
+    """Retry-After başlığını saniyeye çevir (saniye veya HTTP tarihi)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        when = parsedate_to_datetime(value)
+        return max(0.0, when.timestamp() - time.time())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class TokenBucket:
+    """Thread güvenli jeton kovası hız sınırlayıcısı
+    
+    Saniyede rate jeton dolar, en fazla capacity jeton birikir. acquire()
+    jeton alınana kadar bekler ve beklenen süreyi döndürür. rate <= 0
+    (ör. GITAUTO_GEMINI_RPM=0) sınırsız demektir.
+    """
+    
+    def __init__(self, rate, capacity=1):
+        self.rate = rate if rate > 0 else None
+        self.capacity = max(1.0, float(capacity))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def _take(self):
+        """Jeton varsa al ve 0, yoksa gereken bekleme süresini döndür"""
+        if self.rate is None:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+    
+    def acquire(self, cancel_event=None):
+        """Bir jeton al ve beklenen süreyi döndür; cancel_event kurulursa None döner"""
+        waited = 0.0
+        while True:
+            delay = self._take()
+            if delay <= 0:
+                return waited
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    return None
+            else:
+                time.sleep(delay)
+            waited += delay
+
+
+
+class GeminiClient:
+    """Bağlantı havuzlu, zaman aşımı sınırlı Gemini HTTP istemcisi
+    
+    Tek bir requests.Session üzerinden keep-alive bağlantılar yeniden
+    kullanılır; bağlantı ve okuma için ayrı zaman aşımları uygulanır, böylece
+    takılan bir TLS el sıkışması thread'i sonsuza dek bekletmez. İstekler
+    isteğe bağlı bir iptal olayı (threading.Event) alır; cancel(olay) yalnızca
+    o olayla başlatılan istekleri, cancel() ise hepsini hemen sonlandırır.
+    base_url değiştirilerek yerel bir sunucu Gemini yerine kullanılabilir.
+    
+    Her deneme süreç genelindeki jeton kovasından geçer; 429/5xx ve ağ
+    hataları Retry-After'a uyan, jitter'lı üstel geri çekilmeyle deneme
+    sayısı ve toplam bekleme bütçesi dolana kadar tekrarlanır.
+    """
+    
+    def __init__(self, api_key, model=GEMINI_MODEL, base_url=None,
+                 connect_timeout=GEMINI_CONNECT_TIMEOUT, read_timeout=GEMINI_READ_TIMEOUT,
+                 pool_size=4, session=None, rate_limiter=None,
+                 max_retries=GEMINI_MAX_RETRIES, retry_budget=GEMINI_RETRY_BUDGET, log=None):
+        import requests
+        
+        self.api_key = api_key
+        self.model = model
+        self.base_url = (base_url or GEMINI_BASE_URL).rstrip("/")
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = session or self._create_session(pool_size)
+        self.rate_limiter = rate_limiter or GEMINI_RATE_LIMITER
+        self.max_retries = max_retries
+        self.retry_budget = retry_budget
+        self.log = log
+        # Ağ kaynaklı geçici hatalar da tekrar denenir
+        self._transient_errors = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        self._executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="gemini")
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+        # açık yanıt -> başlatan isteğin iptal olayı
+        self._responses = {}
+    
+    @staticmethod
+    def _create_session(pool_size):
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({
+            "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        })
+        return session
+    
+    def endpoint(self, method):
+        """Model için tam API adresini döndür (ör. generateContent)"""
+        return f"{self.base_url}/models/{self.model}:{method}"
+    
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+    
+    def cancel(self, cancel_event=None):
+        """İstekleri iptal et (herhangi bir thread'den çağrılabilir)
+        
+        cancel_event verilirse yalnızca o olayla başlatılan istekler, yoksa
+        istemcinin tüm süren ve sıradaki istekleri durur.
+        """
+        (cancel_event or self._cancelled).set()
+        with self._lock:
+            responses = [response for response, event in self._responses.items()
+                         if cancel_event is None or event is cancel_event]
+        for response in responses:
+            try:
+                response.close()
+            except Exception:
+                pass
+    
+    def close(self):
+        self.cancel()
+        self._executor.shutdown(wait=False)
+        self.session.close()
+    
+    def _check_cancelled(self, cancel_event=None):
+        if self._cancelled.is_set() or (cancel_event is not None and cancel_event.is_set()):
+            raise GeminiCancelled("İstek iptal edildi")
+    
+    def post(self, method, payload, params=None, cancel_event=None):
+        """İsteği gönder ve (durum kodu, gövde metni) döndür"""
+        return self.request(method, payload, lambda response: self._read_body(response, cancel_event),
+                            params, cancel_event)
+    
+    def request(self, method, payload, read, params=None, cancel_event=None):
+        """İsteği gönder ve yanıtı read(response) ile işle
+        
+        İstek havuzdaki bir thread'de yürür; çağıran taraf yanıtı beklerken
+        iptali izler ve cancel() geldiğinde bağlantı kurulumu veya başlık
+        beklenirken bile hemen GeminiCancelled ile döner.
+        """
+        self._check_cancelled(cancel_event)
+        query = {"key": self.api_key}
+        query.update(params or {})
+        future = self._executor.submit(self._send, self.endpoint(method), payload, query, read, cancel_event)
+        done = threading.Event()
+        future.add_done_callback(lambda _: done.set())
+        while not done.wait(0.1):
+            self._check_cancelled(cancel_event)
+        self._check_cancelled(cancel_event)
+        return future.result()
+    
+    def _send(self, url, payload, query, read, cancel_event=None):
+        response = self.session.post(url, json=payload, params=query,
+                                     timeout=self.timeout, stream=True)
+        with self._lock:
+            self._responses[response] = cancel_event
+        try:
+            return read(response)
+        finally:
+            with self._lock:
+                self._responses.pop(response, None)
+            response.close()
+    
+    def _log(self, message):
+        if self.log is not None:
+            self.log(message)
+    
+    def backoff_delay(self, attempt, retry_after=None):
+        """attempt. denemeden sonraki bekleme (full jitter, Retry-After alt sınırdır)"""
+        ceiling = min(GEMINI_BACKOFF_CAP, GEMINI_BACKOFF_BASE * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+    
+    def call_with_retries(self, method, attempt_fn, can_retry=None, cancel_event=None):
+        """attempt_fn()'i hız sınırı ve tekrar denemelerle çalıştır
+        
+        can_retry() False dönerse (ör. akışta metin gönderilmeye başlandıysa)
+        hata tekrar denenmeden iletilir.
+        """
+        spent = 0.0
+        attempts = self.max_retries + 1
+        wait_event = cancel_event or self._cancelled
+        for attempt in range(1, attempts + 1):
+            waited = self.rate_limiter.acquire(wait_event)
+            if waited is None:
+                self._check_cancelled(cancel_event)
+            if waited:
+                self._log(f"🚦 Hız sınırı: {waited:.2f} sn beklendi")
+            started = time.perf_counter()
+            try:
+                result = attempt_fn()
+            except GeminiHTTPError as e:
+                error, retryable, retry_after = e, e.retryable, e.retry_after
+                reason = str(e.status)
+            except self._transient_errors as e:
+                error, retryable, retry_after = e, True, None
+                reason = type(e).__name__
+            else:
+                self._log(f"🌐 {method} deneme {attempt}/{attempts}: "
+                          f"başarılı ({time.perf_counter() - started:.2f} sn)")
+                return result
+            
+            self._log(f"⚠️ {method} deneme {attempt}/{attempts}: {reason} "
+                      f"({time.perf_counter() - started:.2f} sn)")
+            self._check_cancelled(cancel_event)
+            if not retryable or attempt == attempts or (can_retry is not None and not can_retry()):
+                raise error
+            delay = self.backoff_delay(attempt, retry_after)
+            if spent + delay > self.retry_budget:
+                self._log("⛔ Tekrar deneme bütçesi doldu")
+                raise error
+            spent += delay
+            self._log(f"⏳ {delay:.1f} sn sonra tekrar denenecek")
+            if wait_event.wait(delay):
+                self._check_cancelled(cancel_event)
+    
+    def _read_body(self, response, cancel_event=None):
+        chunks = []
+        for chunk in response.iter_content(chunk_size=16384):
+            self._check_cancelled(cancel_event)
+            chunks.append(chunk)
+        body = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
+        return response.status_code, body
+    
+    @staticmethod
+    def _candidate_text(result):
+        """Yanıt nesnesindeki ilk adayın metnini döndür (yoksa None)"""
+        candidates = result.get('candidates') or []
+        if not candidates:
+            return None
+        parts = candidates[0].get('content', {}).get('parts') or []
+        return "".join(part.get('text', '') for part in parts)
+    
+    def generate(self, prompt, cancel_event=None):
+        """Tek istemle içerik üret ve metni döndür"""
+        payload = {"contents": [{"parts": [{"text": prompt}]}]}
+        
+        def read(response):
+            status, body = self._read_body(response, cancel_event)
+            if status != 200:
+                raise GeminiHTTPError(status, body, parse_retry_after(response.headers.get("Retry-After")))
+            return body
+        
+        body = self.call_with_retries(
+            "generateContent", lambda: self.request("generateContent", payload, read, cancel_event=cancel_event),
+            cancel_event=cancel_event)
+        text = self._candidate_text(json.loads(body))
+        if text is None:
+            raise Exception("API yanıtında içerik bulunamadı")
+        return text
+    
+    def stream(self, prompt, on_text=None, cancel_event=None):
+        """streamGenerateContent (SSE) ile üret; her parça on_text(metin) ile bildirilir
+        
+        Tam metni döndürür. on_text istek thread'inden çağrılır.
+        """
+        payload = {"contents": [{"parts": [{"text": prompt}]}]}
+        
+        def read(response):
+            if response.status_code != 200:
+                _, body = self._read_body(response, cancel_event)
+                raise GeminiHTTPError(response.status_code, body,
+                                      parse_retry_after(response.headers.get("Retry-After")))
+            pieces = []
+            data_lines = []
+            # Olaylar boş satırla ayrılır; bir olay birden çok "data:" satırı içerebilir
+            for line in itertools.chain(response.iter_lines(decode_unicode=False), [b""]):
+                self._check_cancelled(cancel_event)
+                if line.startswith(b"data:"):
+                    data_lines.append(line[5:].strip())
+                    continue
+                if line.strip() or not data_lines:
+                    continue
+                event = b"\n".join(data_lines).decode("utf-8", errors="replace")
+                data_lines = []
+                text = self._candidate_text(json.loads(event))
+                if text:
+                    pieces.append(text)
+                    emitted.append(True)
+                    if on_text is not None:
+                        on_text(text)
+            return "".join(pieces)
+        
+        # Metin gönderilmeye başlandıktan sonra tekrar denemek önizlemeyi çoğaltır
+        emitted = []
+        text = self.call_with_retries(
+            "streamGenerateContent",
+            lambda: self.request("streamGenerateContent", payload, read, params={"alt": "sse"},
+                                 cancel_event=cancel_event),
+            can_retry=lambda: not emitted, cancel_event=cancel_event)
+        if not text:
+            raise Exception("API yanıtında içerik bulunamadı")
+        return text
+
+
+# README isteminin talimat bölümü (analiz bölümlerinden sonra eklenir)
+README_PROMPT_INSTRUCTIONS = """Bu DETAYLI kod analizi sonucunda, proje için PROFESYONEL ve KAPSAMLI bir README.md oluştur.
+
+README şunları içersin:
+1. 🎯 Proje başlığı ve detaylı açıklaması (proje amacına ve kod analizinden çıkan bilgileri göre)
+2. 🛠️ Teknoloji stack'i ve kullanılan kütüphaneler (import'lardan çıkar)
+3. 📋 Özellikler listesi (fonksiyon ve class'lardan çıkar)
+4. 🚀 Kurulum talimatları (dependencies'e göre)
+5. 💡 Kullanım örnekleri (ana fonksiyonlardan)
+6. 📁 Klasör yapısı ve dosya organizasyonu
+7. 🔧 Konfigürasyon seçenekleri
+
+README'yi sadece markdown formatında döndür, ek açıklama ekleme.
+README profesyonel, açık ve anlaşılır olsun.
+Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
+"""
+
+
+# Paralel modda ayrı isteklerle oluşturulan README bölümleri (başlık, içerik talimatı)
+README_SECTIONS = [
+    ("🎯 Proje başlığı ve açıklama",
+     "Proje adıyla '# ' başlığı ve proje amacına ve kod analizine göre detaylı açıklama"),
+    ("🛠️ Teknoloji stack'i", "Kullanılan teknolojiler ve kütüphaneler (import'lardan çıkar)"),
+    ("📋 Özellikler", "Özellikler listesi (fonksiyon ve class'lardan çıkar)"),
+    ("🚀 Kurulum", "Kurulum talimatları (dependencies'e göre)"),
+    ("💡 Kullanım", "Kullanım örnekleri (ana fonksiyonlardan)"),
+    ("📁 Klasör yapısı", "Klasör yapısı ve dosya organizasyonu"),
+    ("🔧 Konfigürasyon", "Konfigürasyon seçenekleri"),
+]
+
+# Süreç genelinde paylaşılan Gemini hız sınırlayıcısı. Kova bir README'nin tüm
+# bölümlerini beklemeden karşılar (dakikalık sınırı aşmadan); ardışık
+# üretimler yine GEMINI_REQUESTS_PER_MINUTE hızına iner.
+GEMINI_RATE_LIMITER = TokenBucket(GEMINI_REQUESTS_PER_MINUTE / 60.0,
+                                  capacity=min(len(README_SECTIONS), max(1, GEMINI_REQUESTS_PER_MINUTE)))
+
+README_SECTION_PROMPT = """Bu kod analizine göre proje README.md dosyasının YALNIZCA şu bölümünü yaz: {title}
+İçerik: {detail}
+
+Bölümü '## ' başlığıyla başlat (proje başlığı bölümü hariç), başka bölüm ekleme.
+Sadece markdown döndür, ek açıklama ekleme. Kod analizinden çıkan gerçek proje yapısını yansıt.
+"""
+
+
+class UIDispatcher:
+    """Worker thread'lerden gelen arayüz güncellemelerini Tk ana thread'ine taşır
+    
+    post() ile gönderilen geri çağrılar tek bir kuyrukta toplanır ve yalnızca
+    root.after ile periyodik çalışan pump() tarafından ana thread'de
+    çağrılır. Böylece worker'lar widget'lara dokunmaz, ana döngü de git'i
+    beklemez.
+    """
+    
+    def __init__(self, interval=50, budget=0.05, log=None):
+        self.interval = interval
+        self.budget = budget
+        self.log = log
+        self._callbacks = queue.Queue()
+        self._root = None
+    
+    def start(self, root):
+        """Ana thread'de geri çağrı kuyruğunu boşaltmaya başla"""
+        self._root = root
+        root.after(self.interval, self.pump)
+    
+    def post(self, callback, *args):
+        """callback(*args)'ı ana thread'de çalıştırılmak üzere kuyruğa koy (thread güvenli)"""
+        self._callbacks.put((callback, args))
+    
+    def pump(self):
+        """Bekleyen geri çağrıları çalıştır (ana thread, süre bütçesiyle sınırlı)"""
+        deadline = time.monotonic() + self.budget
+        while time.monotonic() < deadline:
+            try:
+                callback, args = self._callbacks.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except Exception as e:
+                if self.log:
+                    self.log(f"⚠️ Arayüz güncelleme hatası: {e}")
+        if self._root is not None:
+            self._root.after(self.interval, self.pump)
+
+
+class JobCancelled(Exception):
+    """İş, iptal isteği üzerine güvenli bir noktada durduruldu"""
+
+
+class Job:
+    """JobScheduler'daki tek iş; cancel() işbirlikçi iptal ister"""
+    
+    __slots__ = ("key", "func", "args", "repo", "mutating", "priority", "seq",
+                 "callbacks", "state", "submitted_at", "started_at", "_cancel")
+    
+    def __init__(self, key, func, args, repo, mutating, priority, seq):
+        self.key = key
+        self.func = func
+        self.args = args
+        self.repo = repo
+        self.mutating = mutating
+        self.priority = priority
+        self.seq = seq
+        self.callbacks = []       # (on_done, on_error)
+        self.state = "queued"     # queued, running, done, failed, cancelled
+        self.submitted_at = time.monotonic()
+        self.started_at = None
+        self._cancel = threading.Event()
+    
+    @property
+    def name(self):
+        return getattr(self.func, "__name__", repr(self.func))
+    
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+    
+    def cancel(self):
+        self._cancel.set()
+
+
+class JobScheduler:
+    """Repository bazlı arka plan iş zamanlayıcısı
+    
+    Aynı repository'yi değiştiren (mutating) işler sırayla, salt okunur
+    sorgular eşzamanlı çalışır. Aynı anahtarla kuyrukta veya çalışmakta olan
+    bir iş varsa yeni istek ona bağlanır. Küçük priority değeri önce çalışır
+    (arayüz sorguları bakım işlerinden önce). İptal işbirlikçidir: çalışan iş
+    check_cancelled() çağırdığı noktada JobCancelled ile durur. Sonuçlar
+    post ile (ör. UIDispatcher.post) ana thread'e iletilir.
+    """
+    
+    PRIORITY_UI = 0
+    PRIORITY_USER = 10
+    PRIORITY_MAINTENANCE = 20
+    
+    def __init__(self, max_workers=4, post=None, log=None, slow_wait=2.0, history=200):
+        self.max_workers = max_workers
+        self.post = post or (lambda callback, *args: callback(*args))
+        self.log = log
+        self.slow_wait = slow_wait
+        self._cond = threading.Condition()
+        self._queue = []
+        self._running = []
+        self._inflight = {}       # key -> Job (kuyrukta veya çalışıyor)
+        self._busy_repos = set()  # mutating işi çalışan repository'ler
+        self._workers = []
+        self._idle = 0
+        self._local = threading.local()
+        self._seq = itertools.count()
+        self._waits = deque(maxlen=history)
+        self.max_depth = 0
+        self.counters = {"submitted": 0, "coalesced": 0, "completed": 0, "failed": 0, "cancelled": 0}
+    
+    @staticmethod
+    def repo_key(repo):
+        return os.path.normcase(os.path.abspath(repo)) if repo else None
+    
+    def submit(self, func, *args, key=None, repo=None, mutating=False, priority=PRIORITY_USER,
+               on_done=None, on_error=None):
+        """İşi kuyruğa ekle; aynı anahtarlı iş sürüyorsa ona bağlan ve onu döndür"""
+        with self._cond:
+            if key is not None:
+                job = self._inflight.get(key)
+                if job is not None and not job.cancelled:
+                    job.callbacks.append((on_done, on_error))
+                    self.counters["coalesced"] += 1
+                    if self.log:
+                        self.log(f"⏳ {job.name} zaten {'çalışıyor' if job.state == 'running' else 'sırada'}; "
+                                 "aynı istek yeniden başlatılmadı")
+                    return job
+            job = Job(key, func, args, self.repo_key(repo), mutating, priority, next(self._seq))
+            job.callbacks.append((on_done, on_error))
+            self._queue.append(job)
+            if key is not None:
+                self._inflight[key] = job
+            self.counters["submitted"] += 1
+            self.max_depth = max(self.max_depth, len(self._queue))
+            if self._idle < len(self._queue) and len(self._workers) < self.max_workers:
+                thread = threading.Thread(target=self._work, daemon=True,
+                                          name=f"gitauto-worker-{len(self._workers) + 1}")
+                self._workers.append(thread)
+                thread.start()
+            self._cond.notify_all()
+        return job
+    
+    def _next_runnable(self):
+        """En öncelikli, repository kilidine takılmayan kuyruktaki iş"""
+        best = None
+        for job in self._queue:
+            if job.mutating and job.repo in self._busy_repos:
+                continue
+            if best is None or (job.priority, job.seq) < (best.priority, best.seq):
+                best = job
+        return best
+    
+    def _work(self):
+        while True:
+            with self._cond:
+                self._idle += 1
+                job = self._next_runnable()
+                while job is None:
+                    self._cond.wait()
+                    job = self._next_runnable()
+                self._idle -= 1
+                self._queue.remove(job)
+                self._running.append(job)
+                if job.mutating:
+                    self._busy_repos.add(job.repo)
+                job.state = "running"
+                job.started_at = time.monotonic()
+                wait = job.started_at - job.submitted_at
+                self._waits.append(wait)
+            
+            if self.log and wait >= self.slow_wait:
+                self.log(f"⏳ {job.name} kuyrukta {wait:.1f} sn bekledi")
+            
+            self._local.job = job
+            result = error = None
+            try:
+                if job.cancelled:
+                    raise JobCancelled()
+                result = job.func(*job.args)
+            except Exception as e:
+                error = e
+            finally:
+                self._local.job = None
+                with self._cond:
+                    self._running.remove(job)
+                    if job.mutating:
+                        self._busy_repos.discard(job.repo)
+                    if job.key is not None and self._inflight.get(job.key) is job:
+                        del self._inflight[job.key]
+                    self._cond.notify_all()
+            self._finish(job, result, error)
+    
+    def _finish(self, job, result=None, error=None):
+        """Sonucu veya hatayı işin tüm geri çağrılarına ilet"""
+        with self._cond:
+            if isinstance(error, JobCancelled):
+                job.state = "cancelled"
+            elif error is not None:
+                job.state = "failed"
+            else:
+                job.state = "done"
+            self.counters["completed" if job.state == "done" else job.state] += 1
+            callbacks = list(job.callbacks)
+        
+        for on_done, on_error in callbacks:
+            if error is None:
+                if on_done is not None:
+                    self.post(on_done, result)
+            elif on_error is not None:
+                self.post(on_error, error)
+        if error is not None and job.state == "failed" and self.log and not any(cb[1] for cb in callbacks):
+            self.log(f"❌ Arka plan işlemi hatası ({job.name}): {error}")
+    
+    def is_busy(self, repo):
+        """Repository'de değiştiren (mutating) bir iş çalışıyor mu"""
+        with self._cond:
+            return self.repo_key(repo) in self._busy_repos
+    
+    def current_job(self):
+        """Bu thread'de çalışan iş (worker dışında None)"""
+        return getattr(self._local, "job", None)
+    
+    def check_cancelled(self):
+        """Çalışan işin iptali istendiyse JobCancelled fırlat (güvenli durma noktaları için)"""
+        job = self.current_job()
+        if job is not None and job.cancelled:
+            raise JobCancelled()
+    
+    @staticmethod
+    def key_matches(job_key, key):
+        """Anahtar tam eşleşiyor veya key (tuple) anahtarın baş kısmı mı"""
+        if job_key == key:
+            return True
+        return (isinstance(job_key, tuple) and isinstance(key, tuple)
+                and job_key[:len(key)] == key)
+    
+    def find(self, key):
+        """key ile eşleşen (kuyrukta veya çalışan) ilk iş, yoksa None"""
+        with self._cond:
+            for job in self._running + self._queue:
+                if not job.cancelled and self.key_matches(job.key, key):
+                    return job
+        return None
+    
+    def cancel(self, key=None, repo=None, mutating=None, priority=None):
+        """Eşleşen işleri iptal et; kuyruktakiler hiç çalışmaz, çalışanlar işbirlikçi durur
+        
+        key tam anahtar veya anahtarın baş kısmı olabilir (ör. ("ai-readme",)).
+        """
+        repo = self.repo_key(repo)
+        dropped = []
+        with self._cond:
+            for job in self._queue + self._running:
+                if key is not None and not self.key_matches(job.key, key):
+                    continue
+                if repo is not None and job.repo != repo:
+                    continue
+                if mutating is not None and job.mutating != mutating:
+                    continue
+                if priority is not None and job.priority != priority:
+                    continue
+                job.cancel()
+                if job.state == "queued":
+                    self._queue.remove(job)
+                    if job.key is not None and self._inflight.get(job.key) is job:
+                        del self._inflight[job.key]
+                    dropped.append(job)
+        for job in dropped:
+            self._finish(job, error=JobCancelled())
+        return len(dropped)
+    
+    def cancel_all(self):
+        return self.cancel()
+    
+    def stats(self):
+        """Kuyruk derinliği, çalışan iş sayısı, bekleme süreleri ve sayaçlar"""
+        with self._cond:
+            waits = list(self._waits)
+            stats = dict(self.counters)
+            stats.update({
+                "queued": len(self._queue),
+                "running": len(self._running),
+                "workers": len(self._workers),
+                "max_depth": self.max_depth,
+                "avg_wait": sum(waits) / len(waits) if waits else 0.0,
+                "max_wait": max(waits) if waits else 0.0,
+            })
+        return stats
+
 
 class GitAutoGUI:
+    # Kod analizi boru hattı ayarları (None = tüm çekirdekler)
+    analysis_workers = DEFAULT_ANALYSIS_WORKERS
+    analysis_chunk_size = DEFAULT_ANALYSIS_CHUNK_SIZE
+    
+    # Kalıcı analiz önbelleği ayarları
+    analysis_cache_enabled = True
+    analysis_cache_max_entries = 100000
+    
+    # Git komut katmanı; __init__ log bağlantılı kendi örneğini oluşturur
+    git = GIT
+    
+    # Repository durum anlık görüntüleri ve ref okuyucu (ilk kullanımda oluşturulur)
+    repo_snapshots = None
+    ref_reader = None
+    
+    # Seçili repository'yi izleyip durum etiketlerini canlı güncelle
+    live_status_enabled = True
+    repo_watcher = None
+    
+    # Log penceresine bir güncellemede eklenecek en fazla satır
+    log_batch_lines = 500
+    
+    # Gemini istemcisi (None = GEMINI_BASE_URL); bağlantılar çağrılar arasında korunur
+    gemini_base_url = None
+    gemini_client = None
+    # Geçerli AI README işinin iptal olayı; önizleme yalnızca bu işin çıktısını gösterir
+    ai_readme_cancel = None
+    
+    # README istemi için token bütçesi
+    prompt_token_budget = PROMPT_TOKEN_BUDGET
+    
+    # Paralel bölüm modu: eşzamanlı istek sayısı ve bölüm başına tur sayısı
+    readme_section_workers = 4
+    readme_section_attempts = 2
+    
+    # Oluşturulan README yanıtları için içerik adresli önbellek
+    response_cache_enabled = True
+    response_cache_ttl = 7 * 24 * 3600
+    response_cache = None
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🚀 GitAuto - Adım Adım Git Repository Yönetimi")
@@ -43,6 +3312,14 @@ class GitAutoGUI:
         # Log mesajları için queue
         self.log_queue = queue.Queue()
         
+        # Tüm git çağrıları bu katmandan geçer (yavaş çağrılar log'a yazılır)
+        self.git = GitRunner(log=self.log_message)
+        
+        # Git işleri zamanlayıcıda arka planda çalışır, sonuçlar ana thread'e dispatcher ile döner
+        self.dispatcher = UIDispatcher(log=self.log_message)
+        self.dispatcher.start(self.root)
+        self.scheduler = JobScheduler(post=self.dispatcher.post, log=self.log_message)
+        
         # Arayüz oluştur
         self.create_widgets()
         
@@ -370,36 +3647,46 @@ class GitAutoGUI:
         # Repository durumunu kontrol et ve butonları güncelle
         self.update_readme_repo_status()
 
+    def readme_status_widgets_exist(self):
+        """README adımındaki repository durum widget'ları ekranda mı"""
+        # Widget'ların mevcut olup olmadığını kontrol et
+        if not hasattr(self, 'repo_status_readme_label') or not hasattr(self, 'connect_button_readme'):
+            return False  # Widget'lar henüz oluşturulmamışsa çık
+        
+        # Widget'ların gerçekten mevcut olup olmadığını kontrol et
+        try:
+            return bool(self.repo_status_readme_label.winfo_exists() and self.connect_button_readme.winfo_exists())
+        except tk.TclError:
+            return False  # Widget referans hatası durumunda çık
+
     def update_readme_repo_status(self):
-        """README adımında repository durumunu güncelle"""
+        """README adımında repository durumunu arka planda kontrol et ve güncelle"""
+        if not self.readme_status_widgets_exist():
+            return
+        self.run_in_background(self.get_repo_snapshot, False, self.current_directory,
+                               key=("readme-status", self.current_directory),
+                               priority=JobScheduler.PRIORITY_UI,
+                               on_done=self.apply_readme_repo_status,
+                               on_error=lambda e: self.apply_readme_repo_status(None, e))
+
+    def apply_readme_repo_status(self, snapshot, error=None):
+        """README adımındaki repository durumunu anlık görüntüye göre güncelle (ana thread)"""
         try:
-            # Widget'ların mevcut olup olmadığını kontrol et
-            if not hasattr(self, 'repo_status_readme_label') or not hasattr(self, 'connect_button_readme'):
-                return  # Widget'lar henüz oluşturulmamışsa çık
-            
-            # Widget'ların gerçekten mevcut olup olmadığını kontrol et
-            try:
-                if not self.repo_status_readme_label.winfo_exists() or not self.connect_button_readme.winfo_exists():
-                    return  # Widget'lar artık mevcut değilse çık
-            except tk.TclError:
-                return  # Widget referans hatası durumunda çık
+            if not self.readme_status_widgets_exist():
+                return
+            if error is not None:
+                raise error
+            if not self.is_current_snapshot(snapshot):
+                return
             
-            # Repository durumunu gerçek zamanlı kontrol et
-            git_dir = os.path.join(self.current_directory, ".git")
-            repo_exists = os.path.exists(git_dir) and os.path.isdir(git_dir)
+            # Repository durumunu ortak anlık görüntüden oku
+            repo_exists = snapshot.valid
             
             # Eğer .git klasörü varsa ama repository bozuksa
-            if repo_exists:
-                try:
-                    # Git status komutu ile repository sağlığını kontrol et
-                    result = subprocess.run("git status", shell=True, capture_output=True, 
-                                          text=True, cwd=self.current_directory, timeout=5)
-                    if result.returncode != 0:
-                        repo_exists = False
-                        self.log_message("⚠️ README: Git repository bozuk veya geçersiz")
-                except:
-                    repo_exists = False
-                    self.log_message("⚠️ README: Git repository erişilemez durumda")
+            if snapshot.state == "invalid":
+                self.log_message("⚠️ README: Git repository bozuk veya geçersiz")
+            elif snapshot.state == "unreachable":
+                self.log_message("⚠️ README: Git repository erişilemez durumda")
             
             if repo_exists:
                 # Repository varsa
@@ -513,8 +3800,11 @@ class GitAutoGUI:
         
         # Git kurulum kontrolü
         git_check_btn = ttk.Button(status_frame, text="🔍 Git Durumunu Kontrol Et", 
-                                  command=self.check_git_status, style="Accent.TButton")
+                                  command=lambda: self.check_git_status(force=True), style="Accent.TButton")
         git_check_btn.grid(row=2, column=0, columnspan=2, pady=(15, 0))
+        
+        # Etiketleri hemen doldur (izlenen repository'de önbellekten, git çalıştırmadan)
+        self.check_git_status()
 
     def show_ai_readme_step(self):
         """Adım 3: AI README Oluşturucu"""
@@ -531,14 +3821,37 @@ class GitAutoGUI:
         api_key_entry.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 15))
         
         # AI README oluştur butonu
-        ai_button = ttk.Button(ai_frame, text="🤖 AI ile README Oluştur", 
+        ai_buttons = ttk.Frame(ai_frame)
+        ai_buttons.grid(row=2, column=0, pady=(0, 15))
+        
+        ai_button = ttk.Button(ai_buttons, text="🤖 AI ile README Oluştur", 
                                command=self.create_ai_readme, style="Primary.TButton")
-        ai_button.grid(row=2, column=0, pady=(0, 15))
+        ai_button.pack(side=tk.LEFT, padx=(0, 10))
+        
+        # Süren isteği iptal et
+        cancel_button = ttk.Button(ai_buttons, text="⛔ İptal", 
+                                   command=self.cancel_ai_readme, style="Secondary.TButton")
+        cancel_button.pack(side=tk.LEFT)
+        
+        ai_options = ttk.Frame(ai_frame)
+        ai_options.grid(row=3, column=0, pady=(0, 15))
+        
+        # Önbellekteki yanıtı yok say ve modeli yeniden çağır
+        self.force_regenerate = tk.BooleanVar(value=False)
+        force_check = ttk.Checkbutton(ai_options, text="🔄 Önbelleği yok say, yeniden oluştur",
+                                      variable=self.force_regenerate)
+        force_check.pack(side=tk.LEFT, padx=(0, 15))
+        
+        # README bölümlerini eşzamanlı isteklerle oluştur
+        self.parallel_sections = tk.BooleanVar(value=False)
+        parallel_check = ttk.Checkbutton(ai_options, text="⚡ Bölümleri paralel oluştur",
+                                         variable=self.parallel_sections)
+        parallel_check.pack(side=tk.LEFT)
         
         # Geri dönüş butonu
         back_btn = ttk.Button(ai_frame, text="⬅️ README Yönetimine Dön", 
                              command=lambda: self.show_step(1), style="Secondary.TButton")
-        back_btn.grid(row=3, column=0, pady=(15, 0))
+        back_btn.grid(row=4, column=0, pady=(15, 0))
         
         # Bilgi etiketi
         info_label = ttk.Label(ai_frame, 
@@ -546,7 +3859,7 @@ class GitAutoGUI:
                               font=("Segoe UI", 10),
                               foreground="#64748b",
                               justify="center")
-        info_label.grid(row=4, column=0, pady=(15, 0))
+        info_label.grid(row=5, column=0, pady=(15, 0))
 
     def show_repository_step(self):
         """Adım 6: Repository işlemleri"""
@@ -577,8 +3890,12 @@ class GitAutoGUI:
         """Sonraki adıma geç"""
         # Adım 1 (Proje Bilgileri) bitince repository kontrolü yap
         if self.current_step == 0:  # Proje Bilgileri adımından sonra
-            self.check_repository_status()
-            self.refresh_ui_after_repo_check()
+            def check_repository():
+                snapshot = self.get_repo_snapshot()
+                self.check_repository_status(snapshot)
+                self.refresh_ui_after_repo_check(snapshot)
+            self.run_in_background(check_repository, key=("repo-check", self.current_directory),
+                                   priority=JobScheduler.PRIORITY_UI)
         
         # README adımından sonra repository kontrolü yap
         elif self.current_step == 1:  # README adımından sonra
@@ -642,31 +3959,71 @@ class GitAutoGUI:
             # AI README oluşturma işlemini başlat
             self.log_message("🤖 AI README oluşturma başlatılıyor...")
             
-            # Thread'de çalıştır
-            threading.Thread(target=self.create_ai_readme_worker, args=(api_key,), daemon=True).start()
+            # Arka planda çalıştır (aynı istekle çift tıklama ikinci bir iş başlatmaz)
+            force = self.force_regenerate.get() if hasattr(self, 'force_regenerate') else False
+            sectioned = self.parallel_sections.get() if hasattr(self, 'parallel_sections') else False
+            repo_dir = self.current_directory
+            project_name = self.project_name.get().strip()
+            key = ("ai-readme", repo_dir, project_name, force, sectioned)
+            
+            # Gemini istemcisi ve önizleme penceresi paylaşılır; farklı bir istek sürerken yenisi başlamaz
+            running = self.scheduler.find(("ai-readme",))
+            if running is not None and running.key != key:
+                self.log_message(f"⚠️ {running.key[1]} için AI README oluşturuluyor; yeni istek başlatılmadı")
+                messagebox.showwarning("Uyarı", "Başka bir AI README isteği sürüyor.\n"
+                                       f"📁 {running.key[1]}\n\n"
+                                       "Bitmesini bekleyin veya iptal edip tekrar deneyin.")
+                return
+            
+            # Her iş kendi iptal olayını taşır; aynı istek sürüyorsa o iş birleştirilir ve olayı korunur
+            cancel_event = threading.Event()
+            if running is None:
+                self.ai_readme_cancel = cancel_event
+            self.run_in_background(self.create_ai_readme_worker, api_key, force, sectioned,
+                                   repo_dir, project_name, cancel_event, key=key, repo=repo_dir)
             
         except Exception as e:
             error_msg = str(e)
             self.log_message(f"❌ AI README oluşturma hatası: {error_msg}")
             messagebox.showerror("Hata", f"AI README oluşturma hatası:\n{error_msg}")
 
-    def create_ai_readme_worker(self, api_key):
-        """AI README oluşturma işlemi - arka planda çalışır"""
+    def create_ai_readme_worker(self, api_key, force=False, sectioned=False, repo_dir=None, project_name=None,
+                                cancel_event=None):
+        """AI README oluşturma işlemi - arka planda çalışır
+        
+        cancel_event bu işe özeldir: iptal yalnızca bu işin isteklerini durdurur,
+        önizleme de yalnızca geçerli işin (ai_readme_cancel) çıktısını gösterir.
+        """
+        repo_dir = repo_dir or self.current_directory
+        if cancel_event is None:
+            cancel_event = self.ai_readme_cancel = threading.Event()
         try:
             self.log_message("🔍 Proje dosyaları analiz ediliyor...")
             
             # Proje analizi yap
-            project_analysis = self.analyze_project_for_ai()
+            project_analysis = self.analyze_project_for_ai(repo_dir, project_name)
+            
+            # Analiz sırasında basılan iptal de geçerli olur
+            if cancel_event.is_set():
+                raise GeminiCancelled("İstek iptal edildi")
             
             self.log_message("🤖 Gemini AI'ya gönderiliyor...")
             
+            # Canlı önizleme - parçalar geldikçe ana thread'de eklenir
+            self.post_to_ui(self.start_stream_preview, cancel_event)
+            
+            def on_text(text):
+                self.post_to_ui(self.append_stream_preview, text, cancel_event)
+            
             # Gemini API çağrısı
-            readme_content = self.call_gemini_api(api_key, project_analysis)
+            readme_content = self.call_gemini_api(api_key, project_analysis, force=force,
+                                                  on_text=on_text, sectioned=sectioned,
+                                                  cancel_event=cancel_event)
             
             if readme_content:
                 # Mevcut README varsa yedekle
-                readme_path = os.path.join(self.current_directory, "README.md")
-                backup_path = os.path.join(self.current_directory, "README.md.backup")
+                readme_path = os.path.join(repo_dir, "README.md")
+                backup_path = os.path.join(repo_dir, "README.md.backup")
                 
                 if os.path.exists(readme_path):
                     # Mevcut README'yi yedekle
@@ -674,15 +4031,15 @@ class GitAutoGUI:
                     shutil.copy2(readme_path, backup_path)
                     self.log_message("💾 Mevcut README.md yedeklendi (README.md.backup)")
                 
-                # Yeni AI README oluştur
-                with open(readme_path, "w", encoding="utf-8") as f:
-                    f.write(readme_content)
+                # Yeni AI README oluştur - akış tamamlanınca atomik olarak yazılır
+                write_text_atomic(readme_path, readme_content)
                 
                 self.log_message("✅ AI README başarıyla oluşturuldu!")
+                self.post_to_ui(self.finish_stream_preview, "✅ README.md oluşturuldu", cancel_event)
                 
                 # Başarı mesajı göster
                 backup_info = "\n💾 Mevcut README yedeklendi (README.md.backup)" if os.path.exists(backup_path) else ""
-                self.root.after(0, lambda: messagebox.showinfo(
+                self.post_to_ui(lambda: messagebox.showinfo(
                     "Başarılı! 🎉",
                     "🤖 AI README başarıyla oluşturuldu!\n\n"
                     "📝 README.md dosyası proje klasörüne kaydedildi." + backup_info + "\n"
@@ -690,25 +4047,33 @@ class GitAutoGUI:
                 ))
                 
                 # README adımına git
-                self.root.after(0, lambda: self.show_step(1))
+                self.post_to_ui(lambda: self.show_step(1))
             else:
                 raise Exception("Gemini API'den yanıt alınamadı")
                 
+        except GeminiCancelled:
+            self.log_message("⛔ AI README oluşturma iptal edildi")
+            self.post_to_ui(self.finish_stream_preview, "⛔ README oluşturma iptal edildi", cancel_event)
         except Exception as e:
             error_msg = str(e)
             self.log_message(f"❌ AI README oluşturma hatası: {error_msg}")
-            self.root.after(0, lambda msg=error_msg: messagebox.showerror("Hata", f"AI README oluşturma hatası:\n{msg}"))
+            self.post_to_ui(self.finish_stream_preview, "❌ README oluşturulamadı", cancel_event)
+            self.post_to_ui(lambda msg=error_msg: messagebox.showerror("Hata", f"AI README oluşturma hatası:\n{msg}"))
 
-    def analyze_project_for_ai(self):
+    def analyze_project_for_ai(self, repo_dir=None, project_name=None):
         """Proje dosyalarını AI analizi için hazırla - DETAYLI ANALİZ"""
+        repo_dir = repo_dir or self.current_directory
+        if project_name is None:
+            project_name = self.project_name.get().strip()
         try:
             analysis = {
-                "project_name": self.project_name.get().strip(),
+                "project_name": project_name,
                 "files": [],
                 "folders": [],
                 "technologies": [],
                 "config_files": [],
                 "main_files": [],
+                "skipped_files": {},
                 "code_analysis": {
                     "imports": [],
                     "functions": [],
@@ -716,67 +4081,146 @@ class GitAutoGUI:
                     "dependencies": [],
                     "variables": [],
                     "comments": [],
-                    "project_purpose": ""
+                    "project_purpose": "",
+                    "purpose_scores": {}
                 }
             }
             
             self.log_message("🔍 Proje dosyaları detaylı analiz ediliyor...")
             
-            # Dosya ve klasörleri tara
-            for root, dirs, files in os.walk(self.current_directory):
-                # .git klasörünü atla
-                if '.git' in root:
-                    continue
-                    
+            # Analiz edilecek kod dosyaları (file_info, mtime_ns); tam yol saklanmaz
+            code_files = []
+            
+            # Atlanan dosya sayıları (neden -> adet)
+            skipped = analysis["skipped_files"]
+            
+            # Değişmemiş dosyaların sonuçları kalıcı önbellekten gelir
+            cache = None
+            if self.analysis_cache_enabled:
+                try:
+                    cache = AnalysisCache(repo_dir, max_entries=self.analysis_cache_max_entries)
+                except OSError as e:
+                    self.log_message(f"⚠️ Analiz önbelleği açılamadı: {e}")
+            
+            # Dosya envanteri: git deposunda git index'i, değilse budayan tarayıcı
+            for rel_dir, dirs, files in iter_project_files(repo_dir):
                 # Klasör yapısı
-                rel_path = os.path.relpath(root, self.current_directory)
-                if rel_path != '.':
-                    analysis["folders"].append(rel_path)
+                directory = record_directory(rel_dir)
+                if directory:
+                    analysis["folders"].append(directory)
                 
                 # Dosyaları analiz et
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    rel_file_path = os.path.join(rel_path, file)
+                for entry in files:
+                    file = entry.name
+                    file_path = entry.path
                     
-                    # Dosya bilgisi
-                    file_info = {
-                        "name": file,
-                        "path": rel_file_path,
-                        "size": os.path.getsize(file_path),
-                        "extension": os.path.splitext(file)[1]
-                    }
+                    try:
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue
+                    
+                    # Dosya bilgisi (kompakt kayıt; config/main listeleri aynı nesneyi paylaşır)
+                    file_info = FileRecord(directory, file, file_stat.st_size)
+                    rel_file_path = file_info.path
                     
                     # Teknoloji tespiti
                     if file in ['package.json', 'requirements.txt', 'pom.xml', 'build.gradle', 'Cargo.toml', 'go.mod', 'composer.json', 'Gemfile']:
                         analysis["config_files"].append(file_info)
                         analysis["technologies"].append(self.detect_technology_from_config(file))
-                        # Konfigürasyon dosyası içeriğini analiz et
-                        config_analysis = self.analyze_config_file(file_path, file)
+                        # Konfigürasyon dosyası içeriğini analiz et (önbellekte yoksa)
+                        config_analysis = None
+                        if cache:
+                            config_analysis = cache.lookup("config", rel_file_path, file_stat.st_size,
+                                                           file_stat.st_mtime_ns, file_path)
+                        if config_analysis is None:
+                            config_analysis = self.analyze_config_file(file_path, file)
+                            if cache:
+                                try:
+                                    content_hash = file_digest(file_path)
+                                    cache.store("config", rel_file_path, file_stat.st_size,
+                                                file_stat.st_mtime_ns, content_hash, config_analysis)
+                                except OSError:
+                                    pass
                         if config_analysis:
                             analysis["code_analysis"]["dependencies"].extend(config_analysis)
-                    elif file_info["extension"] in ['.py', '.js', '.ts', '.java', '.cpp', '.cs', '.php', '.rb', '.go', '.rs', '.vue', '.jsx', '.tsx']:
-                        analysis["main_files"].append(file_info)
-                        analysis["technologies"].append(self.detect_technology_from_extension(file_info["extension"]))
+                    elif file_info.extension in ['.py', '.js', '.ts', '.java', '.cpp', '.cs', '.php', '.rb', '.go', '.rs', '.vue', '.jsx', '.tsx']:
+                        # Minify/vendored/üretilmiş dosyalar yoldan anlaşılıyorsa hiç okunmaz
+                        skip_reason = classify_source_path(f"{rel_dir}/{file}" if rel_dir else file)
+                        if skip_reason:
+                            skipped[skip_reason] = skipped.get(skip_reason, 0) + 1
+                            analysis["files"].append(file_info)
+                            continue
+                        analysis["technologies"].append(self.detect_technology_from_extension(file_info.extension))
                         
-                        # Kod dosyası içeriğini DETAYLI analiz et
-                        self.log_message(f"📖 Analiz ediliyor: {rel_file_path}")
-                        code_analysis = self.analyze_code_file_detailed(file_path, file_info["extension"])
-                        if code_analysis:
-                            analysis["code_analysis"]["imports"].extend(code_analysis.get("imports", []))
-                            analysis["code_analysis"]["functions"].extend(code_analysis.get("functions", []))
-                            analysis["code_analysis"]["classes"].extend(code_analysis.get("classes", []))
-                            analysis["code_analysis"]["variables"].extend(code_analysis.get("variables", []))
-                            analysis["code_analysis"]["comments"].extend(code_analysis.get("comments", []))
+                        # Kod dosyası içeriği boru hattında DETAYLI analiz edilecek
+                        code_files.append((file_info, file_stat.st_mtime_ns))
                     
                     analysis["files"].append(file_info)
             
+            # Sembol listeleri sabit bellekli top-K toplayıcılarda birleştirilir
+            collectors = {kind: TopKCollector(PROMPT_SECTION_LIMITS[kind])
+                          for kind in ("imports", "functions", "classes", "variables", "comments")}
+            # Dosya başına yalnızca atlanma nedeni tutulur (tam sonuç değil)
+            skip_reasons = [None] * len(code_files)
+            
+            def merge(index, code_analysis):
+                skip_reason = code_analysis.get("skipped") if code_analysis else None
+                if skip_reason:
+                    skip_reasons[index] = skip_reason
+                    skipped[skip_reason] = skipped.get(skip_reason, 0) + 1
+                elif code_analysis:
+                    for kind, collector in collectors.items():
+                        collector.update(code_analysis.get(kind, ()))
+            
+            # Önbellekte geçerli sonucu olan dosyalar yeniden okunmaz
+            pending = []
+            for index, (file_info, mtime_ns) in enumerate(code_files):
+                cached = None
+                if cache:
+                    cached = cache.lookup("code", file_info.path, file_info.size, mtime_ns,
+                                          os.path.join(repo_dir, file_info.path))
+                if cached is None:
+                    pending.append(index)
+                else:
+                    merge(index, cached)
+            
+            # Kalan kod dosyalarını paralel boru hattında analiz et
+            self.log_message(f"⚙️ {len(pending)} kod dosyası paralel analiz ediliyor...")
+            # İşler proje köküne göre yollarla gider; tam yol okuma anında üretilir
+            jobs = [(code_files[index][0].path, code_files[index][0].extension) for index in pending]
+            results = analyze_code_files(jobs, max_workers=self.analysis_workers,
+                                         chunk_size=self.analysis_chunk_size, root=repo_dir)
+            for index, (code_analysis, content_hash) in zip(pending, results):
+                file_info, mtime_ns = code_files[index]
+                self.log_message(f"📖 Analiz edildi: {file_info.path}")
+                merge(index, code_analysis)
+                if cache and content_hash:
+                    cache.store("code", file_info.path, file_info.size, mtime_ns,
+                                content_hash, code_analysis)
+            
+            if cache:
+                self.log_message(f"🗃️ Analiz önbelleği: {cache.hits} isabet, {cache.misses} yeni analiz")
+                try:
+                    cache.save()
+                except OSError as e:
+                    self.log_message(f"⚠️ Analiz önbelleği kaydedilemedi: {e}")
+            
+            # Atlanmayan kod dosyaları tarama sırasıyla ana dosyalardır
+            analysis["main_files"] = [file_info for (file_info, mtime_ns), skip_reason
+                                      in zip(code_files, skip_reasons) if not skip_reason]
+            for kind, collector in collectors.items():
+                analysis["code_analysis"][kind] = collector.most_common()
+            
             # Teknolojileri benzersiz yap
             analysis["technologies"] = list(set(analysis["technologies"]))
             
             # Proje amacını tespit et
             analysis["code_analysis"]["project_purpose"] = self.detect_project_purpose(analysis)
             
-            self.log_message(f"✅ Analiz tamamlandı: {len(analysis['main_files'])} kod dosyası, {len(analysis['code_analysis']['imports'])} import bulundu")
+            self.log_message(f"✅ Analiz tamamlandı: {len(analysis['main_files'])} kod dosyası, {collectors['imports'].total} import bulundu")
+            if skipped:
+                details = ", ".join(f"{reason}: {count}" for reason, count in sorted(skipped.items()))
+                self.log_message(f"⏭️ {sum(skipped.values())} dosya analiz dışı bırakıldı ({details})")
             
             return analysis
             
@@ -890,116 +4334,13 @@ class GitAutoGUI:
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
+            symbols = extract_code_symbols(content, extension)
             analysis = {
-                "imports": [],
-                "functions": [],
-                "classes": []
+                "imports": symbols["imports"],
+                "functions": symbols["functions"],
+                "classes": symbols["classes"]
             }
             
-            import re
-            
-            if extension == '.py':
-                # Python analizi
-                # Import satırları
-                imports = re.findall(r'^(?:from|import)\s+([\w\s,\.]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'^def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content, re.MULTILINE)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'^class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\(|:)', content, re.MULTILINE)
-                analysis["classes"] = classes
-                
-            elif extension in ['.js', '.ts', '.jsx', '.tsx']:
-                # JavaScript/TypeScript analizi
-                # Import/require satırları
-                imports = re.findall(r'^(?:import|require|from)\s+([\w\s,\.\{\}]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)|const\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\(|let\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\()', content)
-                # Regex gruplarından fonksiyon adlarını çıkar
-                func_names = []
-                for match in functions:
-                    func_names.extend([name for name in match if name])
-                analysis["functions"] = func_names
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-            elif extension == '.java':
-                # Java analizi
-                # Import satırları
-                imports = re.findall(r'^import\s+([\w\.]+)', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'(?:public|private|protected|static)?\s*(?:final)?\s*(?:[a-zA-Z<>\[\]]+)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-            elif extension == '.cpp':
-                # C++ analizi
-                # Include satırları
-                imports = re.findall(r'^#include\s+[<"]([^>"]+)[>"]', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'([a-zA-Z_][a-zA-Z0-9_]*)\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\{|:)', content)
-                analysis["classes"] = classes
-                
-            elif extension == '.php':
-                # PHP analizi
-                # Use satırları
-                imports = re.findall(r'^use\s+([\w\\]+)', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-            elif extension == '.go':
-                # Go analizi
-                # Import satırları
-                imports = re.findall(r'^import\s+([\w\s"\.]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'func\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Struct tanımları
-                classes = re.findall(r'type\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+struct', content)
-                analysis["classes"] = classes
-                
-            elif extension == '.rs':
-                # Rust analizi
-                # Use satırları
-                imports = re.findall(r'^use\s+([\w\s:]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'fn\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Struct tanımları
-                classes = re.findall(r'struct\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{', content)
-                analysis["classes"] = classes
-            
             return analysis
             
         except Exception as e:
@@ -1008,216 +4349,8 @@ class GitAutoGUI:
     def analyze_code_file_detailed(self, file_path, extension):
         """Kod dosyasının içeriğini DETAYLI analiz et - Gerçek dosya okuma"""
         try:
-            # Dosyayı UTF-8 ile oku
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-            
-            analysis = {
-                "imports": [],
-                "functions": [],
-                "classes": [],
-                "variables": [],
-                "comments": []
-            }
-            
-            import re
-            
-            if extension == '.py':
-                # Python DETAYLI analizi
-                # Import satırları
-                imports = re.findall(r'^(?:from|import)\s+([\w\s,\.]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'^def\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content, re.MULTILINE)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'^class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\(|:)', content, re.MULTILINE)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'#\s*(.+)', content)
-                analysis["comments"] = [comment.strip() for comment in comments if len(comment.strip()) > 10]
-                
-            elif extension in ['.js', '.ts', '.jsx', '.tsx']:
-                # JavaScript/TypeScript DETAYLI analizi
-                # Import/require satırları
-                imports = re.findall(r'^(?:import|require|from)\s+([\w\s,\.\{\}]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'(?:function\s+([a-zA-Z_][a-zA-Z0-9_]*)|const\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\(|let\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*=\s*\()', content)
-                # Regex gruplarından fonksiyon adlarını çıkar
-                func_names = []
-                for match in functions:
-                    func_names.extend([name for name in match if name])
-                analysis["functions"] = func_names
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^(?:const|let|var)\s+([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-                
-            elif extension == '.java':
-                # Java DETAYLI analizi
-                # Import satırları
-                imports = re.findall(r'^import\s+([\w\.]+)', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'(?:public|private|protected|static)?\s*(?:final)?\s*(?:[a-zA-Z<>\[\]]+)\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^(?:public|private|protected|static)?\s*(?:final)?\s*(?:[a-zA-Z<>\[\]]+)\s+([A-Z_][A-Z0-9_]*)\s*;', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-                
-            elif extension == '.cpp':
-                # C++ DETAYLI analizi
-                # Include satırları
-                imports = re.findall(r'^#include\s+[<"]([^>"]+)[>"]', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'([a-zA-Z_][a-zA-Z0-9_]*)\s+[a-zA-Z_][a-zA-Z0-9_]*\s*\([^)]*\)\s*\{', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:\{|:)', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^(?:int|double|float|string|char|bool)\s+([A-Z_][A-Z0-9_]*)\s*;', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-                
-            elif extension == '.php':
-                # PHP DETAYLI analizi
-                # Use satırları
-                imports = re.findall(r'^use\s+([\w\\]+)', content, re.MULTILINE)
-                analysis["imports"] = imports
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'function\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Class tanımları
-                classes = re.findall(r'class\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*(?:extends|implements|\{)', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^\$([A-Z_][A-Z0-9_]*)\s*=', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|#\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                    if comment[2]:
-                        analysis["comments"].append(comment[2].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-                
-            elif extension == '.go':
-                # Go DETAYLI analizi
-                # Import satırları
-                imports = re.findall(r'^import\s+([\w\s"\.]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'func\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Struct tanımları
-                classes = re.findall(r'type\s+([a-zA-Z_][a-zA-Z0-9_]*)\s+struct', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^var\s+([A-Z_][A-Z0-9_]*)\s*', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-                
-            elif extension == '.rs':
-                # Rust DETAYLI analizi
-                # Use satırları
-                imports = re.findall(r'^use\s+([\w\s:]+)', content, re.MULTILINE)
-                analysis["imports"] = [imp.strip() for imp in imports if imp.strip()]
-                
-                # Fonksiyon tanımları
-                functions = re.findall(r'fn\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\(', content)
-                analysis["functions"] = functions
-                
-                # Struct tanımları
-                classes = re.findall(r'struct\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*\{', content)
-                analysis["classes"] = classes
-                
-                # Önemli değişkenler
-                variables = re.findall(r'^let\s+([A-Z_][A-Z0-9_]*)\s*:', content, re.MULTILINE)
-                analysis["variables"] = [var for var in variables if len(var) > 2]
-                
-                # Yorumlar
-                comments = re.findall(r'//\s*(.+)|/\*\s*(.+?)\*/', content, re.DOTALL)
-                analysis["comments"] = []
-                for comment in comments:
-                    if comment[0]:
-                        analysis["comments"].append(comment[0].strip())
-                    if comment[1]:
-                        analysis["comments"].append(comment[1].strip())
-                analysis["comments"] = [comment for comment in analysis["comments"] if len(comment) > 10]
-            
+            # Dosyayı bellek bütçesiyle oku (büyük dosyalar mmap ile taranır)
+            analysis, _ = extract_code_symbols_from_file(file_path, extension)
             return analysis
             
         except Exception as e:
@@ -1237,33 +4370,20 @@ class GitAutoGUI:
             self.log_message(f"⚠️ README silme hatası: {e}")
 
     def detect_project_purpose(self, analysis):
-        """Proje amacını tespit et"""
+        """Proje amacını tespit et (skorlar code_analysis["purpose_scores"] içine yazılır)"""
         try:
-            purpose_indicators = {
-                "web": ["flask", "django", "express", "react", "vue", "angular", "html", "css", "web"],
-                "api": ["api", "rest", "graphql", "endpoint", "controller", "route"],
-                "desktop": ["tkinter", "pyqt", "wx", "electron", "javafx", "swing"],
-                "mobile": ["react-native", "flutter", "kotlin", "swift", "mobile"],
-                "data": ["pandas", "numpy", "matplotlib", "scikit", "tensorflow", "pytorch", "data"],
-                "game": ["pygame", "unity", "unreal", "game", "sprite", "collision"],
-                "cli": ["click", "argparse", "typer", "command", "cli", "terminal"],
-                "library": ["setup.py", "pyproject.toml", "lib", "module", "package"]
-            }
-            
             # Teknoloji ve dependency'leri birleştir
             all_techs = analysis["technologies"] + analysis["code_analysis"]["dependencies"]
-            all_techs = [tech.lower() for tech in all_techs]
             
-            # Amaç skorları
-            scores = {}
-            for purpose, indicators in purpose_indicators.items():
-                score = sum(1 for indicator in indicators if any(indicator in tech for tech in all_techs))
-                scores[purpose] = score
+            # Amaç skorları - ters indeks: teknoloji adlarında geçen her gösterge,
+            # önceden eşlenmiş amaçlarına sözlük aramasıyla puan ekler
+            scores = PURPOSE_INDEX.score(all_techs)
+            analysis["code_analysis"]["purpose_scores"] = scores
             
             # En yüksek skorlu amacı döndür
             if scores:
-                best_purpose = max(scores, key=scores.get)
-                if scores[best_purpose] > 0:
+                best_purpose = max(scores, key=lambda purpose: scores[purpose]["score"])
+                if scores[best_purpose]["score"] > 0:
                     return best_purpose
             
             return "general"
@@ -1271,86 +4391,208 @@ class GitAutoGUI:
         except Exception as e:
             return "general"
 
-    def call_gemini_api(self, api_key, project_analysis):
-        """Gemini API'yi çağır ve README oluştur"""
+    def call_gemini_api(self, api_key, project_analysis, force=False, on_text=None, sectioned=False,
+                        cancel_event=None):
+        """Gemini API'yi çağır ve README oluştur
+        
+        Yanıt akış (SSE) olarak alınır; her parça on_text(metin) ile bildirilir.
+        force=True önbelleği atlar. sectioned=True README bölümlerini ayrı,
+        eşzamanlı isteklerle oluşturur. cancel_event kurulunca istekler durur.
+        """
         try:
-            import requests
-            
-            # Gemini API endpoint - güncel model adı ve API versiyonu
-            url = "https://generativelanguage.googleapis.com/v1/models/gemini-1.5-flash:generateContent"
-            
-            # Proje analizi metni - DETAYLI ANALİZ
-            analysis_text = f"""
+            client = self.get_gemini_client(api_key)
+            
+            if sectioned:
+                return self.generate_readme_sections(client, project_analysis, force, on_text, cancel_event)
+            
+            # Proje analizi metni - DETAYLI ANALİZ (token bütçeli)
+            analysis_text = self.build_readme_prompt(project_analysis)
+            
+            # Aynı model, uç nokta ve istem için önbellekteki yanıtı kullan
+            endpoint = client.endpoint('streamGenerateContent')
+            cache = self.get_response_cache()
+            cache_key = ResponseCache.key(client.model, endpoint, analysis_text)
+            if cache is not None and not force:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    self.log_message(f"🗃️ README yanıt önbelleğinden alındı "
+                                     f"(isabet: {cache.hits}, ıskalama: {cache.misses})")
+                    if on_text is not None:
+                        on_text(cached)
+                    return cached
+                self.log_message(f"🗃️ Yanıt önbelleğinde yok (isabet: {cache.hits}, ıskalama: {cache.misses})")
+            elif force:
+                self.log_message("🔄 Önbellek atlandı - README yeniden oluşturuluyor")
+            
+            self.log_message(f"🌐 Gemini isteği (akış): {endpoint}")
+            started = time.perf_counter()
+            first_token = []
+            
+            def handle_text(text):
+                if not first_token:
+                    first_token.append(time.perf_counter() - started)
+                    self.log_message(f"⚡ İlk yanıt {first_token[0]:.2f} sn içinde geldi")
+                if on_text is not None:
+                    on_text(text)
+            
+            content = client.stream(analysis_text, handle_text, cancel_event)
+            self.log_message(f"✅ Akış tamamlandı: {len(content)} karakter, "
+                             f"{time.perf_counter() - started:.2f} sn")
+            
+            if cache is not None:
+                try:
+                    cache.put(cache_key, content, model=client.model)
+                except OSError as e:
+                    self.log_message(f"⚠️ Yanıt önbelleğe yazılamadı: {e}")
+            return content
+                
+        except GeminiCancelled:
+            raise
+        except Exception as e:
+            raise Exception(f"Gemini API hatası: {e}")
+
+    def generate_readme_sections(self, client, project_analysis, force=False, on_text=None, cancel_event=None):
+        """README bölümlerini sınırlı eşzamanlılıkla ayrı ayrı oluştur ve sırayla birleştir
+        
+        Her bölüm aynı analiz bağlamını ve yalnızca o bölüme ait talimatı
+        içerir. Başarısız bölümler tur sonunda tek tek yeniden denenir. Biten
+        bölümler sıraları geldikçe on_text ile bildirilir.
+        """
+        context = self.build_readme_prompt(project_analysis, instructions="")
+        prompts = [context + README_SECTION_PROMPT.format(title=title, detail=detail)
+                   for title, detail in README_SECTIONS]
+        endpoint = client.endpoint('generateContent')
+        cache = self.get_response_cache()
+        
+        def generate(index):
+            prompt = prompts[index]
+            cache_key = ResponseCache.key(client.model, endpoint, prompt)
+            if cache is not None and not force:
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return cached
+            text = client.generate(prompt, cancel_event)
+            if cache is not None:
+                try:
+                    cache.put(cache_key, text, model=client.model)
+                except OSError:
+                    pass
+            return text
+        
+        started = time.perf_counter()
+        results = [None] * len(prompts)
+        errors = {}
+        emitted = 0
+        pending = list(range(len(prompts)))
+        workers = max(1, self.readme_section_workers)
+        self.log_message(f"⚡ {len(prompts)} README bölümü en fazla {workers} eşzamanlı istekle oluşturuluyor")
+        
+        for round_number in range(1, self.readme_section_attempts + 1):
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                futures = {pool.submit(generate, index): index for index in pending}
+                for future in as_completed(futures):
+                    index = futures[future]
+                    title = README_SECTIONS[index][0]
+                    try:
+                        results[index] = future.result().strip()
+                        self.log_message(f"✅ Bölüm hazır: {title}")
+                    except GeminiCancelled:
+                        raise
+                    except Exception as e:
+                        errors[index] = e
+                        self.log_message(f"⚠️ Bölüm oluşturulamadı: {title} - {e}")
+                    # Sıradaki bölümler hazırsa önizlemeye sırayla ekle
+                    while emitted < len(results) and results[emitted] is not None:
+                        if on_text is not None:
+                            on_text(results[emitted] + "\n\n")
+                        emitted += 1
+            
+            pending = [index for index, result in enumerate(results) if result is None]
+            if not pending:
+                break
+            if round_number < self.readme_section_attempts:
+                self.log_message(f"🔁 {len(pending)} bölüm yeniden deneniyor...")
+        
+        if pending:
+            raise Exception(f"{len(pending)} README bölümü oluşturulamadı: {errors[pending[0]]}")
+        
+        if cache is not None:
+            self.log_message(f"🗃️ Yanıt önbelleği (isabet: {cache.hits}, ıskalama: {cache.misses})")
+        self.log_message(f"✅ {len(results)} bölüm {time.perf_counter() - started:.2f} sn içinde oluşturuldu")
+        return "\n\n".join(results) + "\n"
+
+    def build_readme_prompt(self, project_analysis, instructions=None):
+        """Proje analizinden token bütçeli README istemini oluştur"""
+        code = project_analysis['code_analysis']
+        builder = PromptBuilder(budget=self.prompt_token_budget)
+        builder.add_text(f"""
 Proje: {project_analysis['project_name']}
 
 🔍 TEKNOLOJİ ANALİZİ:
 Teknolojiler: {', '.join(project_analysis['technologies'])}
-Proje Amacı: {project_analysis['code_analysis']['project_purpose']}
+Proje Amacı: {code['project_purpose']}
 
 📦 BAĞIMLILIKLAR:
-Konfigürasyon Dosyaları: {[f['name'] for f in project_analysis['config_files']]}
-Dependencies: {', '.join(project_analysis['code_analysis']['dependencies'][:20])}
-
-📁 DOSYA YAPISI:
-Ana Dosyalar: {[f['name'] for f in project_analysis['main_files'][:15]]}
-Klasör Yapısı: {project_analysis['folders'][:25]}
-
-💻 DETAYLI KOD ANALİZİ:
-Import/Use Satırları: {', '.join(project_analysis['code_analysis']['imports'][:30])}
-Fonksiyonlar: {', '.join(project_analysis['code_analysis']['functions'][:20])}
-Class/Struct'lar: {', '.join(project_analysis['code_analysis']['classes'][:15])}
-Önemli Değişkenler: {', '.join(project_analysis['code_analysis']['variables'][:10])}
-Kod Yorumları: {', '.join(project_analysis['code_analysis']['comments'][:5])}
+""")
+        # Öncelik: bağımlılıklar ve yapı > sınıf/fonksiyonlar > import'lar > ayrıntılar
+        builder.add_section("Konfigürasyon Dosyaları", [f.name for f in project_analysis['config_files']], 0)
+        builder.add_section("Dependencies", code['dependencies'], 1, PROMPT_SECTION_LIMITS['dependencies'])
+        builder.add_text("\n📁 DOSYA YAPISI:\n")
+        builder.add_section("Ana Dosyalar", [f.name for f in project_analysis['main_files']], 2,
+                            PROMPT_SECTION_LIMITS['main_files'])
+        builder.add_section("Klasör Yapısı", project_analysis['folders'], 5, PROMPT_SECTION_LIMITS['folders'])
+        builder.add_text("\n💻 DETAYLI KOD ANALİZİ:\n")
+        builder.add_section("Import/Use Satırları", code['imports'], 6, PROMPT_SECTION_LIMITS['imports'])
+        builder.add_section("Fonksiyonlar", code['functions'], 4, PROMPT_SECTION_LIMITS['functions'])
+        builder.add_section("Class/Struct'lar", code['classes'], 3, PROMPT_SECTION_LIMITS['classes'])
+        builder.add_section("Önemli Değişkenler", code['variables'], 7, PROMPT_SECTION_LIMITS['variables'])
+        builder.add_section("Kod Yorumları", code['comments'], 8, PROMPT_SECTION_LIMITS['comments'])
+        builder.add_text("\n" + (instructions or README_PROMPT_INSTRUCTIONS))
+        
+        prompt = builder.build()
+        trimmed = ", ".join(f"{label} {sent}/{total}" for label, (sent, total)
+                            in builder.section_counts.items() if sent < total)
+        self.log_message(f"🧮 İstem: ~{builder.token_estimate} token (bütçe {builder.budget})"
+                         + (f" - kırpılan: {trimmed}" if trimmed else ""))
+        return prompt
 
-Bu DETAYLI kod analizi sonucunda, proje için PROFESYONEL ve KAPSAMLI bir README.md oluştur.
+    def get_gemini_client(self, api_key):
+        """Havuzlu Gemini istemcisini döndür (API key değişirse yeniden oluştur)"""
+        client = self.gemini_client
+        if client is None or client.api_key != api_key:
+            if client is not None:
+                client.close()
+            try:
+                client = GeminiClient(api_key, base_url=self.gemini_base_url, log=self.log_message)
+            except ImportError:
+                raise Exception("requests kütüphanesi gerekli! 'pip install requests' komutu ile yükleyin.")
+            self.gemini_client = client
+        return client
 
-README şunları içersin:
-1. 🎯 Proje başlığı ve detaylı açıklaması (proje amacına ve kod analizinden çıkan bilgileri göre)
-2. 🛠️ Teknoloji stack'i ve kullanılan kütüphaneler (import'lardan çıkar)
-3. 📋 Özellikler listesi (fonksiyon ve class'lardan çıkar)
-4. 🚀 Kurulum talimatları (dependencies'e göre)
-5. 💡 Kullanım örnekleri (ana fonksiyonlardan)
-6. 📁 Klasör yapısı ve dosya organizasyonu
-7. 🔧 Konfigürasyon seçenekleri
+    def get_response_cache(self):
+        """README yanıt önbelleğini döndür (kapalıysa veya açılamazsa None)"""
+        if not self.response_cache_enabled:
+            return None
+        if self.response_cache is None:
+            try:
+                self.response_cache = ResponseCache(ttl=self.response_cache_ttl)
+            except OSError as e:
+                self.log_message(f"⚠️ Yanıt önbelleği açılamadı: {e}")
+                return None
+        return self.response_cache
 
-README'yi sadece markdown formatında döndür, ek açıklama ekleme.
-README profesyonel, açık ve anlaşılır olsun.
-Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
-"""
-            
-            # API isteği
-            headers = {
-                "Content-Type": "application/json"
-            }
-            
-            data = {
-                "contents": [{
-                    "parts": [{
-                        "text": analysis_text
-                    }]
-                }]
-            }
-            
-            params = {
-                "key": api_key
-            }
-            
-            response = requests.post(url, headers=headers, json=data, params=params)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'candidates' in result and len(result['candidates']) > 0:
-                    content = result['candidates'][0]['content']['parts'][0]['text']
-                    return content
-                else:
-                    raise Exception("API yanıtında içerik bulunamadı")
+    def cancel_ai_readme(self):
+        """Süren AI README isteğini iptal et"""
+        # Henüz başlamamışsa kuyruktan da çıkar
+        self.scheduler.cancel(key=("ai-readme",))
+        cancel_event = self.ai_readme_cancel
+        if cancel_event is not None and not cancel_event.is_set():
+            # Yalnızca bu işin istekleri kapatılır; istemci sonraki işler için kullanılabilir kalır
+            if self.gemini_client is not None:
+                self.gemini_client.cancel(cancel_event)
             else:
-                raise Exception(f"API hatası: {response.status_code} - {response.text}")
-                
-        except ImportError:
-            raise Exception("requests kütüphanesi gerekli! 'pip install requests' komutu ile yükleyin.")
-        except Exception as e:
-            raise Exception(f"Gemini API hatası: {e}")
+                cancel_event.set()
+            self.log_message("⛔ AI README isteği iptal ediliyor...")
 
     def finish_application(self):
         """Uygulamayı bitir ve çık"""
@@ -1374,25 +4616,65 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 with open(readme_path, "r", encoding="utf-8") as f:
                     content = f.read()
                 
-                # Önizleme penceresi
-                preview_window = tk.Toplevel(self.root)
-                preview_window.title("README.md Önizleme")
-                preview_window.geometry("600x400")
-                preview_window.configure(bg="#ffffff")
-                
-                # İçerik
-                text_widget = scrolledtext.ScrolledText(preview_window, 
-                                                      font=("Consolas", 10),
-                                                      bg="#f8fafc", fg="#1e293b")
-                text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
-                text_widget.insert(tk.END, content)
-                text_widget.config(state=tk.DISABLED)
+                self.open_readme_preview("README.md Önizleme", content)
                 
             except Exception as e:
                 messagebox.showerror("Hata", f"README.md okunamadı:\n{e}")
         else:
             messagebox.showinfo("Bilgi", "README.md dosyası bulunamadı.")
 
+    def open_readme_preview(self, title, content="", editable=False):
+        """README önizleme penceresi aç ve metin alanını döndür"""
+        preview_window = tk.Toplevel(self.root)
+        preview_window.title(title)
+        preview_window.geometry("600x400")
+        preview_window.configure(bg="#ffffff")
+        
+        # İçerik
+        text_widget = scrolledtext.ScrolledText(preview_window, 
+                                              font=("Consolas", 10),
+                                              bg="#f8fafc", fg="#1e293b")
+        text_widget.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+        text_widget.insert(tk.END, content)
+        if not editable:
+            text_widget.config(state=tk.DISABLED)
+        return text_widget
+
+    def is_current_readme_job(self, cancel_event):
+        """Çıktı geçerli AI README işine mi ait (eski, iptal edilmiş işler önizlemeye yazmaz)"""
+        return cancel_event is None or cancel_event is self.ai_readme_cancel
+
+    def start_stream_preview(self, cancel_event=None):
+        """Akış sırasında gelen README metni için canlı önizleme aç"""
+        if self.is_current_readme_job(cancel_event):
+            self.stream_preview = self.open_readme_preview("🤖 README oluşturuluyor...")
+
+    def append_stream_preview(self, text, cancel_event=None):
+        """Canlı önizlemeye yeni gelen metni ekle (ana thread)"""
+        if not self.is_current_readme_job(cancel_event):
+            return
+        widget = getattr(self, 'stream_preview', None)
+        try:
+            if widget is None or not widget.winfo_exists():
+                return
+            widget.config(state=tk.NORMAL)
+            widget.insert(tk.END, text)
+            widget.see(tk.END)
+            widget.config(state=tk.DISABLED)
+        except tk.TclError:
+            pass  # Pencere kapatıldıysa akış arka planda sürer
+
+    def finish_stream_preview(self, title, cancel_event=None):
+        """Canlı önizleme başlığını sonuçla güncelle"""
+        if not self.is_current_readme_job(cancel_event):
+            return
+        widget = getattr(self, 'stream_preview', None)
+        try:
+            if widget is not None and widget.winfo_exists():
+                widget.winfo_toplevel().title(title)
+        except tk.TclError:
+            pass
+
     def go_to_ai_readme(self):
         """AI README oluşturma adımına git"""
         try:
@@ -1411,12 +4693,24 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         except Exception as e:
             messagebox.showerror("Hata", f"AI README adımına gidilemedi:\n{e}")
 
-    def check_git_status(self):
-        """Git durumunu kontrol et - gerçek zamanlı"""
+    def check_git_status(self, force=False):
+        """Git durumunu arka planda kontrol et, sonucu arayüze uygula
+        
+        force: önbelleği atla (kullanıcının açık kontrol isteği)
+        """
+        self.run_in_background(self.probe_git_status, self.current_directory, force,
+                               key=("git-status", self.current_directory, force),
+                               priority=JobScheduler.PRIORITY_UI,
+                               on_done=lambda result: self.apply_git_status(*result))
+
+    def apply_git_status(self, git_installed, snapshot):
+        """Git durumu sonucunu arayüze uygula (ana thread)"""
         try:
-            # Git kurulum kontrolü
-            result = subprocess.run("git --version", shell=True, capture_output=True, text=True)
-            self.git_installed = result.returncode == 0
+            if not self.is_current_snapshot(snapshot):
+                return
+            
+            # Git kurulum kontrolü (sürüm bir kez sorgulanır)
+            self.git_installed = git_installed
             
             # Git durumu etiketini güncelle (eğer varsa)
             if hasattr(self, 'git_status_label'):
@@ -1429,31 +4723,21 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 except tk.TclError:
                     pass  # Widget referans hatası durumunda sessizce devam et
             
-            # Repository kontrolü - gerçek zamanlı
-            git_dir = os.path.join(self.current_directory, ".git")
-            self.git_repo_exists = os.path.exists(git_dir) and os.path.isdir(git_dir)
+            # Repository kontrolü - ortak anlık görüntüden
+            self.git_repo_exists = snapshot.valid
             
             # Eğer .git klasörü varsa ama boşsa (bozuk repository)
-            if os.path.exists(git_dir) and os.path.isdir(git_dir):
-                try:
-                    # Git status komutu ile repository sağlığını kontrol et
-                    result = subprocess.run("git status", shell=True, capture_output=True, 
-                                          text=True, cwd=self.current_directory, timeout=5)
-                    if result.returncode != 0:
-                        self.git_repo_exists = False
-                        self.log_message("⚠️ Git repository bozuk veya geçersiz")
-                except:
-                    self.git_repo_exists = False
-                    self.log_message("⚠️ Git repository erişilemez durumda")
+            if snapshot.state == "invalid":
+                self.log_message("⚠️ Git repository bozuk veya geçersiz")
+            elif snapshot.state == "unreachable":
+                self.log_message("⚠️ Git repository erişilemez durumda")
             
             # Repository durumu etiketini güncelle (eğer varsa)
             if hasattr(self, 'repo_status_label'):
                 try:
                     if self.repo_status_label.winfo_exists():
-                        if self.git_repo_exists:
-                            self.repo_status_label.config(text="✅ Git repository mevcut", foreground="green")
-                        else:
-                            self.repo_status_label.config(text="❌ Git repository bulunamadı", foreground="red")
+                        self.repo_status_label.config(text=self.repo_status_text(snapshot),
+                                                      foreground="green" if self.git_repo_exists else "red")
                 except tk.TclError:
                     pass  # Widget referans hatası durumunda sessizce devam et
             
@@ -1463,7 +4747,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 if hasattr(self, 'main_button'):
                     try:
                         if self.main_button.winfo_exists():
-                            self.root.after(0, lambda: self.main_button.config(state="normal"))
+                            self.main_button.config(state="normal")
                     except tk.TclError:
                         pass  # Widget referans hatası durumunda sessizce devam et
                         
@@ -1473,19 +4757,21 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 if hasattr(self, 'main_button'):
                     try:
                         if self.main_button.winfo_exists():
-                            self.root.after(0, lambda: self.main_button.config(state="disabled"))
+                            self.main_button.config(state="disabled")
                     except tk.TclError:
                         pass  # Widget referans hatası durumunda sessizce devam et
                         
                 self.log_message("❌ Repository bulunamadı - Yayınlama devre dışı")
             
             # README adımındaki repository durumunu güncelle (eğer varsa)
-            if hasattr(self, 'update_readme_repo_status'):
-                try:
-                    self.update_readme_repo_status()
-                except Exception as e:
-                    # Hata durumunda sadece log'a yaz, uygulamayı durdurma
-                    self.log_message(f"⚠️ README repository durumu güncellenirken hata: {e}")
+            try:
+                self.apply_readme_repo_status(snapshot)
+            except Exception as e:
+                # Hata durumunda sadece log'a yaz, uygulamayı durdurma
+                self.log_message(f"⚠️ README repository durumu güncellenirken hata: {e}")
+            
+            # Sonraki değişiklikler watcher ile canlı yansıtılır
+            self.update_repo_watcher(snapshot)
                     
         except Exception as e:
             self.log_message(f"❌ Git durum kontrolü hatası: {e}")
@@ -1495,14 +4781,16 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         self.log_queue.put(message)
 
     def update_log(self):
-        """Log mesajlarını güncelle"""
+        """Log mesajlarını güncelle (kuyrukta biriken satırlar tek seferde eklenir)"""
+        lines = []
         try:
-            while True:
-                message = self.log_queue.get_nowait()
-                self.log_text.insert(tk.END, f"{message}\n")
-                self.log_text.see(tk.END)
+            while len(lines) < self.log_batch_lines:
+                lines.append(self.log_queue.get_nowait())
         except queue.Empty:
             pass
+        if lines:
+            self.log_text.insert(tk.END, "\n".join(lines) + "\n")
+            self.log_text.see(tk.END)
         
         # Her 100ms'de bir kontrol et
         self.root.after(100, self.update_log)
@@ -1511,6 +4799,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         """Kullanıcının klasör seçmesini sağlar"""
         folder_selected = filedialog.askdirectory()
         if folder_selected:
+            previous_directory = self.current_directory
             self.project_path_var.set(folder_selected)
             self.current_directory = folder_selected
             
@@ -1521,73 +4810,76 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             
             self.log_message(f"📁 Proje klasörü seçildi: {folder_selected}")
             
-            # Repository durumunu kontrol et
-            self.check_repository_status()
+            # Önceki klasör için kuyrukta bekleyen arayüz sorgularına gerek kalmadı
+            self.scheduler.cancel(repo=previous_directory, mutating=False,
+                                  priority=JobScheduler.PRIORITY_UI)
+            self.stop_repo_watcher()
             
-            # Git durumunu yeni klasör için güncelle
-            self.check_git_status()
-            
-            # UI'ı repository durumuna göre güncelle
-            self.refresh_ui_after_folder_change()
-            
-            # README adımındaki repository durumunu güncelle (eğer o adımdaysak)
-            if hasattr(self, 'update_readme_repo_status'):
-                try:
-                    self.update_readme_repo_status()
-                except Exception as e:
-                    # Hata durumunda sadece log'a yaz, uygulamayı durdurma
-                    self.log_message(f"⚠️ README repository durumu güncellenirken hata: {e}")
-            
-            # Klasördeki dosyaları listele
-            self.list_folder_contents()
+            # Repository durumu ve klasör içeriği arka planda okunur, UI sonra güncellenir
+            self.run_in_background(self.probe_folder, folder_selected,
+                                   key=("folder", folder_selected), repo=folder_selected,
+                                   priority=JobScheduler.PRIORITY_UI,
+                                   on_done=lambda result: self.apply_folder_status(*result))
+
+    def probe_folder(self, directory):
+        """Arka planda: seçilen klasörün git durumunu ve içeriğini oku, log'a yaz"""
+        git_installed, snapshot = self.probe_git_status(directory)
+        
+        # Repository durumunu kontrol et
+        self.check_repository_status(snapshot)
+        
+        # Klasördeki dosyaları listele
+        has_readme = self.list_folder_contents(directory)
+        return git_installed, snapshot, has_readme
+
+    def apply_folder_status(self, git_installed, snapshot, has_readme):
+        """Klasör seçimi sonucunu arayüze uygula (ana thread)"""
+        if not self.is_current_snapshot(snapshot):
+            return
+        
+        # Git durumunu yeni klasör için güncelle (README adımı dahil)
+        self.apply_git_status(git_installed, snapshot)
+        
+        # UI'ı repository durumuna göre güncelle
+        self.refresh_ui_after_folder_change(snapshot)
+        
+        # README seçeneğini klasör içeriğine göre öner
+        if has_readme is not None:
+            self.readme_var.set("keep" if has_readme else "create")
 
-    def check_repository_status(self):
-        """Repository durumunu kontrol et ve log'a yaz"""
+    def check_repository_status(self, snapshot=None):
+        """Repository durumunu kontrol et ve log'a yaz (yalnızca log; worker thread'den çağrılabilir)"""
         try:
             if not self.current_directory:
                 return
                 
-            git_dir = os.path.join(self.current_directory, ".git")
-            if os.path.exists(git_dir):
+            if snapshot is None:
+                snapshot = self.get_repo_snapshot()
+            if snapshot.state != "missing":
                 # Git repository mevcut
                 self.log_message("🔍 Repository durumu kontrol ediliyor...")
                 
-                # Git status kontrol et
-                try:
-                    result = subprocess.run("git status --porcelain", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    if result.returncode == 0:
-                        if result.stdout.strip():
-                            self.log_message("📝 Repository'de değişiklikler mevcut")
-                        else:
-                            self.log_message("✅ Repository temiz (değişiklik yok)")
-                    else:
-                        self.log_message("⚠️ Git status kontrol edilemedi")
-                except Exception as e:
-                    self.log_message(f"⚠️ Git status hatası: {e}")
+                if not snapshot.valid:
+                    self.log_message(f"⚠️ Git status kontrol edilemedi: {snapshot.error}")
+                    return
                 
-                # Remote origin kontrol et
-                try:
-                    result = subprocess.run("git remote -v", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    if result.returncode == 0 and result.stdout.strip():
-                        self.log_message("🔗 Remote origin bağlı")
-                    else:
-                        self.log_message("⚠️ Remote origin bulunamadı")
-                except Exception as e:
-                    self.log_message(f"⚠️ Remote kontrol hatası: {e}")
+                # Git status
+                if snapshot.clean:
+                    self.log_message("✅ Repository temiz (değişiklik yok)")
+                else:
+                    self.log_message(f"📝 Repository'de değişiklikler mevcut ({len(snapshot.changes)} dosya)")
                 
-                # Branch bilgisi
-                try:
-                    result = subprocess.run("git branch --show-current", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    if result.returncode == 0:
-                        current_branch = result.stdout.strip()
-                        self.log_message(f"🌿 Aktif branch: {current_branch}")
-                    else:
-                        self.log_message("⚠️ Aktif branch bilgisi alınamadı")
-                except Exception as e:
-                    self.log_message(f"⚠️ Branch kontrol hatası: {e}")
+                # Remote origin
+                if snapshot.has_remote:
+                    self.log_message("🔗 Remote origin bağlı")
+                else:
+                    self.log_message("⚠️ Remote origin bulunamadı")
+                
+                # Branch bilgisi
+                if snapshot.branch:
+                    self.log_message(f"🌿 Aktif branch: {snapshot.branch}")
+                else:
+                    self.log_message("⚠️ Aktif branch bilgisi alınamadı")
                     
             else:
                 # Git repository yok
@@ -1597,62 +4889,33 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         except Exception as e:
             self.log_message(f"⚠️ Repository durumu kontrol edilirken hata: {e}")
 
-    def refresh_ui_after_repo_check(self):
+    def refresh_ui_after_repo_check(self, snapshot=None):
         """Repository kontrolünden sonra UI'ı güncelle"""
         try:
             if not self.current_directory:
                 return
                 
-            git_dir = os.path.join(self.current_directory, ".git")
-            repo_exists = os.path.exists(git_dir)
+            if snapshot is None:
+                snapshot = self.get_repo_snapshot()
             
-            if repo_exists:
-                # Repository bilgilerini al (sessizce)
-                try:
-                    # Aktif branch
-                    result = subprocess.run("git branch --show-current", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    current_branch = result.stdout.strip() if result.returncode == 0 else "main"
-                    
-                    # Remote origin
-                    result = subprocess.run("git remote get-url origin", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    remote_url = result.stdout.strip() if result.returncode == 0 else "Bilinmiyor"
-                    
-                    # Commit sayısı
-                    result = subprocess.run("git rev-list --count HEAD", shell=True, 
-                                          capture_output=True, text=True, cwd=self.current_directory, timeout=10)
-                    commit_count = result.stdout.strip() if result.returncode == 0 else "0"
-                    
-                except Exception as e:
-                    pass  # Sessizce devam et
-                
-            else:
+            if snapshot.state == "missing":
                 self.log_message("💡 Repository bulunamadı - README adımında 'Repository Bağla' butonunu kullanın")
                 
         except Exception as e:
             self.log_message(f"⚠️ UI güncellenirken hata: {e}")
 
-    def refresh_ui_after_folder_change(self):
-        """Klasör değişikliği sonrası UI'ı güncelle"""
+    def refresh_ui_after_folder_change(self, snapshot):
+        """Klasör değişikliği sonrası UI'ı anlık görüntüye göre güncelle (ana thread)"""
         try:
             self.log_message("🔄 Klasör değişikliği - UI güncelleniyor...")
             
-            # Repository durumunu kontrol et
-            git_dir = os.path.join(self.current_directory, ".git")
-            repo_exists = os.path.exists(git_dir) and os.path.isdir(git_dir)
+            # Repository durumu ve sağlığı ortak anlık görüntüden
+            repo_exists = snapshot.valid
             
-            # Repository sağlığını kontrol et
-            if repo_exists:
-                try:
-                    result = subprocess.run("git status", shell=True, capture_output=True, 
-                                          text=True, cwd=self.current_directory, timeout=5)
-                    if result.returncode != 0:
-                        repo_exists = False
-                        self.log_message("⚠️ Repository bozuk - UI güncelleniyor")
-                except:
-                    repo_exists = False
-                    self.log_message("⚠️ Repository erişilemez - UI güncelleniyor")
+            if snapshot.state == "invalid":
+                self.log_message("⚠️ Repository bozuk - UI güncelleniyor")
+            elif snapshot.state == "unreachable":
+                self.log_message("⚠️ Repository erişilemez - UI güncelleniyor")
             
             # Tüm UI bileşenlerini güncelle
             if repo_exists:
@@ -1667,7 +4930,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                         pass
                 
                 # README durumunu güncelle
-                self.update_readme_repo_status()
+                self.apply_readme_repo_status(snapshot)
                 
             else:
                 self.log_message("❌ Repository bulunamadı - UI devre dışı bırakılıyor")
@@ -1681,7 +4944,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                         pass
                 
                 # README durumunu güncelle
-                self.update_readme_repo_status()
+                self.apply_readme_repo_status(snapshot)
             
             self.log_message("✅ UI güncelleme tamamlandı")
             
@@ -1753,28 +5016,32 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             
             self.progress.start()
             
-            # Repository bağlama işlemini thread'de çalıştır
-            threading.Thread(target=self.connect_repository_worker, daemon=True).start()
+            # Repository bağlama işlemini arka planda çalıştır (aynı repository'deki yazan işlerle sıralı)
+            repo_dir = self.current_directory
+            settings = self.collect_repo_settings()
+            self.run_in_background(self.connect_repository_worker, repo_dir, settings,
+                                   key=self.repo_job_key("connect", repo_dir, settings),
+                                   repo=repo_dir, mutating=True)
     
-    def connect_repository_worker(self):
+    def connect_repository_worker(self, repo_dir, settings):
         """Repository bağlama işlemi - arka planda çalışır"""
         try:
-            original_dir = os.getcwd()
-            os.chdir(self.current_directory)
+            project_name = settings["project_name"]
+            github_username = settings["github_username"]
             
             # 1. Git init
             self.log_message("🔧 Git repository başlatılıyor...")
-            result = subprocess.run("git init", shell=True, capture_output=True, text=True, timeout=10)
+            result = self.git.run(["init"], cwd=repo_dir, timeout=10)
             if result.returncode != 0:
                 raise Exception(f"Git init hatası: {result.stderr}")
             self.log_message("✅ Git repository başlatıldı")
             
             # 2. README.md oluştur (eğer yoksa)
-            if self.readme_var.get() == "create":
-                readme_path = os.path.join(self.current_directory, "README.md")
+            if settings["readme_choice"] == "create":
+                readme_path = os.path.join(repo_dir, "README.md")
                 if not os.path.exists(readme_path):
                     self.log_message("📝 README.md oluşturuluyor...")
-                    readme_content = f"# {self.project_name.get()}\n\nBu proje GitAuto ile otomatik olarak oluşturuldu.\n"
+                    readme_content = f"# {project_name}\n\nBu proje GitAuto ile otomatik olarak oluşturuldu.\n"
                     with open(readme_path, "w", encoding="utf-8") as f:
                         f.write(readme_content)
                     self.log_message("✅ README.md oluşturuldu")
@@ -1783,21 +5050,21 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             self.log_message("📁 Sadece README.md ve .gitignore ekleniyor...")
             
             # .gitignore'ı güncelle
-            self.update_gitignore_for_large_files()
+            self.update_gitignore_for_large_files(repo_dir)
             
             # Önce .gitignore'ı ekle
-            subprocess.run("git add .gitignore", shell=True, capture_output=True, text=True, timeout=10)
+            self.git.run(["add", ".gitignore"], cwd=repo_dir, timeout=10)
             
             # Sadece README.md ekle (eğer varsa)
-            readme_path = os.path.join(self.current_directory, "README.md")
+            readme_path = os.path.join(repo_dir, "README.md")
             if os.path.exists(readme_path):
-                result = subprocess.run("git add README.md", shell=True, capture_output=True, text=True, timeout=10)
+                result = self.git.run(["add", "README.md"], cwd=repo_dir, timeout=10)
                 if result.returncode != 0:
                     raise Exception(f"README.md ekleme hatası: {result.stderr}")
                 self.log_message("✅ README.md eklendi")
             else:
                 self.log_message("⚠️ README.md bulunamadı")
-                result = subprocess.run("git add .", shell=True, capture_output=True, text=True, timeout=10)
+                result = self.git.run(["add", "."], cwd=repo_dir, timeout=10)
                 if result.returncode != 0:
                     raise Exception(f"Git add hatası: {result.stderr}")
                 self.log_message("✅ Dosyalar eklendi")
@@ -1805,92 +5072,259 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             self.log_message("✅ Sadece gerekli dosyalar eklendi (tüm dosyalar değil)")
             
             # 4. Git commit (konfigürasyon kontrolü ile)
-            commit_msg = self.commit_message.get().strip() or "first commit"
+            self.scheduler.check_cancelled()
+            commit_msg = settings["commit_message"] or "first commit"
             self.log_message(f"💾 İlk commit yapılıyor: {commit_msg}")
             
             # Git konfigürasyonunu kontrol et ve ayarla
             self.log_message("⚙️ Git konfigürasyonu kontrol ediliyor...")
             
-            # User name kontrol et
-            user_result = subprocess.run("git config user.name", shell=True, capture_output=True, text=True, timeout=5)
-            if user_result.returncode != 0 or not user_result.stdout.strip():
-                self.log_message("👤 Git user.name ayarlanıyor...")
-                subprocess.run(f'git config user.name "{self.github_username.get()}"', shell=True, capture_output=True, text=True, timeout=5)
-            
-            # User email kontrol et
-            email_result = subprocess.run("git config user.email", shell=True, capture_output=True, text=True, timeout=5)
-            if email_result.returncode != 0 or not email_result.stdout.strip():
-                self.log_message("📧 Git user.email ayarlanıyor...")
-                subprocess.run(f'git config user.email "{self.github_username.get()}@users.noreply.github.com"', shell=True, capture_output=True, text=True, timeout=5)
+            # User name / email kontrol et ve eksikse ayarla
+            configured = self.ensure_git_identity(repo_dir, github_username,
+                                                  f"{github_username}@users.noreply.github.com")
+            if "user.name" in configured:
+                self.log_message("👤 Git user.name ayarlandı")
+            if "user.email" in configured:
+                self.log_message("📧 Git user.email ayarlandı")
             
             # Commit yap
-            result = subprocess.run(f'git commit -m "{commit_msg}"', shell=True, capture_output=True, text=True, timeout=15)
+            result = self.git.run(["commit", "-m", commit_msg], cwd=repo_dir, timeout=15)
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else "Bilinmeyen commit hatası"
                 self.log_message(f"⚠️ Commit hatası: {error_msg}")
                 
                 # Alternatif commit yöntemi dene
                 self.log_message("🔄 Alternatif commit yöntemi deneniyor...")
-                result = subprocess.run(f'git commit -m "{commit_msg}" --allow-empty', shell=True, capture_output=True, text=True, timeout=15)
+                result = self.git.run(["commit", "-m", commit_msg, "--allow-empty"], cwd=repo_dir, timeout=15)
                 if result.returncode != 0:
                     raise Exception(f"Git commit hatası: {result.stderr}")
             
             self.log_message("✅ İlk commit tamamlandı")
             
             # 5. Branch ayarla
-            target_branch = self.selected_branch.get() or "main"
+            target_branch = settings["target_branch"]
             self.log_message(f"🌿 Branch '{target_branch}' ayarlanıyor...")
-            result = subprocess.run(f"git branch -M {target_branch}", shell=True, capture_output=True, text=True, timeout=10)
+            result = self.git.run(["branch", "-M", target_branch], cwd=repo_dir, timeout=10)
             if result.returncode != 0:
                 self.log_message(f"⚠️ Branch ayarlama uyarısı: {result.stderr}")
             else:
                 self.log_message(f"✅ Branch '{target_branch}' ayarlandı")
             
             # 6. Remote ekle
-            repo_url = f"https://github.com/{self.github_username.get()}/{self.project_name.get()}.git"
+            repo_url = f"https://github.com/{github_username}/{project_name}.git"
             self.log_message(f"🔗 Remote repository bağlanıyor: {repo_url}")
-            result = subprocess.run(f'git remote add origin "{repo_url}"', shell=True, capture_output=True, text=True, timeout=10)
+            result = self.git.run(["remote", "add", "origin", repo_url], cwd=repo_dir, timeout=10)
             if result.returncode != 0 and "already exists" not in result.stderr:
                 raise Exception(f"Remote add hatası: {result.stderr}")
             self.log_message("✅ Remote repository bağlandı")
             
             # 7. Push
-            self.log_message(f"🚀 GitHub'a yayınlanıyor...")
+            self.scheduler.check_cancelled()
+            self.log_message("🚀 GitHub'a yayınlanıyor...")
             self.log_message("⏳ Bu işlem büyük projelerde biraz zaman alabilir...")
-            result = subprocess.run(f"git push -u origin {target_branch}", shell=True, capture_output=True, text=True, timeout=120)
+            result = self.run_git_streaming(["push", "--progress", "-u", "origin", target_branch],
+                                            repo_dir, timeout=120)
+            self.scheduler.check_cancelled()
             if result.returncode != 0:
                 raise Exception(f"Push hatası: {result.stderr}")
             self.log_message("✅ Repository GitHub'a yayınlandı!")
             
-            os.chdir(original_dir)
-            
             # Başarı mesajı
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.post_to_ui(lambda: messagebox.showinfo(
                 "Başarılı! 🎉",
                 f"🔗 Repository başarıyla bağlandı!\n\n"
-                f"📍 URL: https://github.com/{self.github_username.get()}/{self.project_name.get()}\n"
+                f"📍 URL: https://github.com/{github_username}/{project_name}\n"
                 f"🌿 Branch: {target_branch}\n\n"
                 "Artık branch işlemleri yapabilir ve yayınlama yapabilirsiniz!"
             ))
             
             # Yayın butonunu aktif hale getir
-            self.root.after(0, lambda: self.main_button.config(state="normal"))
+            self.post_to_ui(lambda: self.main_button.config(state="normal"))
              
             # README adımındaki repository durumunu güncelle
-            self.root.after(0, self.update_readme_repo_status)
+            self.post_to_ui(self.update_readme_repo_status)
             
             # Branch listesini güncelle
-            self.root.after(100, self.refresh_branches)
+            self.post_to_ui(self.refresh_branches)
             
+        except JobCancelled:
+            self.log_message("⛔ Repository bağlama iptal edildi")
+        
         except Exception as e:
-            os.chdir(original_dir)
             error_msg = str(e)  # Hata mesajını string olarak sakla
             self.log_message(f"❌ Repository bağlama hatası: {error_msg}")
-            self.root.after(0, lambda: messagebox.showerror("Hata", f"Repository bağlama hatası:\n{error_msg}"))
+            self.post_to_ui(lambda: messagebox.showerror("Hata", f"Repository bağlama hatası:\n{error_msg}"))
         
         finally:
-            self.root.after(0, self.repository_connect_finished)
+            self.invalidate_repo_snapshot(repo_dir)
+            self.post_to_ui(self.repository_connect_finished)
     
+    def run_in_background(self, func, *args, key=None, repo=None, mutating=False,
+                          priority=JobScheduler.PRIORITY_USER, on_done=None, on_error=None):
+        """func'ı zamanlayıcıda çalıştır; on_done/on_error ana thread'de çağrılır
+        
+        key verilirse aynı anahtarlı süren iş tekrar başlatılmaz. mutating işler
+        repository başına (varsayılan: seçili klasör) sırayla çalışır.
+        """
+        return self.scheduler.submit(func, *args, key=key, repo=repo or self.current_directory,
+                                     mutating=mutating, priority=priority,
+                                     on_done=on_done, on_error=on_error)
+
+    def post_to_ui(self, callback, *args):
+        """Worker thread'den ana thread'e arayüz güncellemesi gönder"""
+        self.dispatcher.post(callback, *args)
+
+    def run_git_streaming(self, args, repo_dir, timeout=None):
+        """Uzun süren git komutunu akışla çalıştır: satırlar log'a, ilerleme çubuğa (worker thread)
+        
+        Çalışan iş iptal edilirse git süreci sonlandırılır; çağıran ardından
+        scheduler.check_cancelled() ile durmalıdır.
+        """
+        last = {"at": 0.0, "phase": None}
+        
+        def on_progress(progress):
+            # Aşama değişimi ve bitiş hemen, ara değerler en fazla 100 ms'de bir iletilir
+            now = time.monotonic()
+            if progress.phase == last["phase"] and not progress.finished and now - last["at"] < 0.1:
+                return
+            last.update(at=now, phase=progress.phase)
+            self.post_to_ui(self.apply_git_progress, progress)
+        
+        job = self.scheduler.current_job()
+        return self.git.stream(args, cwd=repo_dir, timeout=timeout,
+                               on_line=lambda line: self.log_message(f"   {line}"),
+                               on_progress=on_progress,
+                               should_stop=(lambda: job.cancelled) if job is not None else None)
+
+    def apply_git_progress(self, progress):
+        """git ilerlemesini çubuğa ve durum satırına uygula (ana thread)"""
+        try:
+            if progress.percent is not None:
+                if str(self.progress.cget("mode")) != "determinate":
+                    self.progress.stop()
+                    self.progress.config(mode="determinate", maximum=100)
+                self.progress["value"] = progress.percent
+            self.status_bar.config(text=progress.describe())
+        except tk.TclError:
+            pass  # Widget referans hatası durumunda sessizce devam et
+
+    def reset_git_progress(self):
+        """İlerleme çubuğunu durdur ve belirsiz moda döndür (ana thread)"""
+        try:
+            self.progress.stop()
+            self.progress.config(mode="indeterminate", value=0)
+            self.status_bar.config(text="Hazır")
+        except tk.TclError:
+            pass  # Widget referans hatası durumunda sessizce devam et
+
+    def collect_repo_settings(self):
+        """Arka plan işine verilecek form değerlerinin kopyası (ana thread'de alınır)
+        
+        Worker'lar Tk değişkenlerini okumaz; kullanıcı iş sürerken formu veya
+        klasörü değiştirse de iş başladığı andaki değerlerle devam eder.
+        """
+        return {
+            "project_name": self.project_name.get().strip(),
+            "github_username": self.github_username.get().strip(),
+            "commit_message": self.commit_message.get().strip(),
+            "target_branch": self.selected_branch.get() or "main",
+            "readme_choice": self.readme_var.get(),
+        }
+
+    def repo_job_key(self, kind, repo_dir, settings=None):
+        """İş anahtarı: tür, repository ve işin kullanacağı ayarlar
+        
+        Yalnızca her şeyi aynı olan istekler tek işte birleşir; farklı branch,
+        commit mesajı veya remote ile yapılan ikinci istek ayrı iş olarak
+        aynı repository'nin sırasına girer.
+        """
+        return (kind, repo_dir) + tuple(sorted((settings or {}).items()))
+
+    def get_snapshot_cache(self):
+        """Paylaşılan RepoSnapshotCache"""
+        if self.repo_snapshots is None:
+            self.repo_snapshots = RepoSnapshotCache(self.git)
+        return self.repo_snapshots
+
+    def get_repo_snapshot(self, force=False, directory=None):
+        """Klasörün (varsayılan: seçili klasör) repository anlık görüntüsü (değişmediyse önbellekten)"""
+        return self.get_snapshot_cache().get(directory or self.current_directory, force=force)
+
+    def update_repo_watcher(self, snapshot):
+        """Geçerli repository için canlı izlemeyi başlat; klasör değiştiyse veya repository yoksa durdur"""
+        watcher = self.repo_watcher
+        if (watcher is not None and watcher.running and watcher.repo_dir == snapshot.repo_dir
+                and snapshot.valid):
+            return
+        self.stop_repo_watcher()
+        if not (self.live_status_enabled and snapshot.valid):
+            return
+        directory = snapshot.repo_dir
+        self.repo_watcher = RepoWatcher(
+            directory, self.get_snapshot_cache(),
+            on_change=lambda changed: self.post_to_ui(self.apply_live_status, changed),
+            is_busy=lambda: self.scheduler.is_busy(directory),
+            log=self.log_message).start()
+
+    def stop_repo_watcher(self):
+        if self.repo_watcher is not None:
+            self.repo_watcher.stop()
+            self.repo_watcher = None
+
+    def repo_status_text(self, snapshot):
+        """Git durumu adımındaki repository etiketi metni"""
+        if not snapshot.valid:
+            return "❌ Git repository bulunamadı"
+        branch = snapshot.branch or "detached HEAD"
+        if snapshot.clean:
+            return f"✅ Git repository mevcut ({branch}, değişiklik yok)"
+        return f"✅ Git repository mevcut ({branch}, {len(snapshot.changes)} değişiklik)"
+
+    def apply_live_status(self, snapshot):
+        """Watcher'dan gelen görüntüyü etiketlere uygula (ana thread, log yazmadan)"""
+        watcher = self.repo_watcher
+        if watcher is None or watcher.repo_dir != snapshot.repo_dir or not self.is_current_snapshot(snapshot):
+            return
+        if snapshot.valid != self.git_repo_exists:
+            # Repository oluştu veya kayboldu: butonlar ve README adımıyla birlikte tam güncelleme
+            self.apply_git_status(self.git_installed, snapshot)
+            return
+        if hasattr(self, 'repo_status_label'):
+            try:
+                if self.repo_status_label.winfo_exists():
+                    self.repo_status_label.config(text=self.repo_status_text(snapshot),
+                                                  foreground="green" if snapshot.valid else "red")
+            except tk.TclError:
+                pass  # Widget referans hatası durumunda sessizce devam et
+
+    def probe_git_status(self, directory, force=False):
+        """Arka planda: git kurulumu ve repository anlık görüntüsü"""
+        return self.git.version() is not None, self.get_repo_snapshot(force=force, directory=directory)
+
+    def is_current_snapshot(self, snapshot):
+        """Sonuç hâlâ seçili klasöre mi ait (kullanıcı bu arada klasör değiştirmiş olabilir)"""
+        return snapshot.repo_dir == self.current_directory
+
+    def get_ref_reader(self):
+        """Branch listeleri için paylaşılan RefReader"""
+        if self.ref_reader is None:
+            self.ref_reader = RefReader(self.git)
+        return self.ref_reader
+
+    def invalidate_repo_snapshot(self, repo_dir=None):
+        """Repository'yi değiştiren işlemlerden sonra anlık görüntüyü geçersiz kıl"""
+        if self.repo_snapshots is not None:
+            self.repo_snapshots.invalidate(repo_dir or self.current_directory)
+
+    def ensure_git_identity(self, repo_dir, name, email):
+        """user.name / user.email tanımlı değilse repository için ayarla; ayarlananları döndür"""
+        configured = []
+        for key, value in (("user.name", name), ("user.email", email)):
+            if not self.git.output(["config", key], cwd=repo_dir, timeout=5):
+                self.git.run(["config", key, value], cwd=repo_dir, timeout=5)
+                configured.append(key)
+        return configured
+
     def repository_connect_finished(self):
         """Repository bağlama işlemi tamamlandı"""
         # README adımındaki butonu aktif hale getir (eğer varsa)
@@ -1909,7 +5343,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             except tk.TclError:
                 pass  # Widget referans hatası durumunda sessizce devam et
         
-        self.progress.stop()
+        self.reset_git_progress()
         self.check_git_status()
 
     def refresh_branches(self):
@@ -1924,30 +5358,34 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 self.log_message("ℹ️ Git repository henüz başlatılmamış - varsayılan branch'ler gösteriliyor")
                 return
             
-            original_dir = os.getcwd()
-            os.chdir(self.current_directory)
-            
-            # Local branch'leri al
-            result = subprocess.run("git branch", shell=True, capture_output=True, text=True, timeout=10)
-            local_branches = []
+            # Branch'leri .git içinden arka planda oku (reftable'da git çalışabilir)
+            directory = self.current_directory
+            self.run_in_background(self.get_ref_reader().read, directory,
+                                   key=("branches", directory),
+                                   priority=JobScheduler.PRIORITY_UI,
+                                   on_done=lambda refs: self.apply_branches(directory, refs),
+                                   on_error=lambda e: self.apply_branches(directory, None, e))
             
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        branch = line.strip().replace('*', '').strip()
-                        if branch and not branch.startswith('('):
-                            local_branches.append(branch)
-            
-            # Remote branch'leri al
-            result = subprocess.run("git branch -r", shell=True, capture_output=True, text=True, timeout=10)
-            remote_branches = []
-            
-            if result.returncode == 0 and result.stdout:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip() and 'origin/' in line:
-                        branch = line.strip().replace('origin/', '').strip()
-                        if branch and branch != 'HEAD' and not branch.startswith('('):
-                            remote_branches.append(branch)
+        except Exception as e:
+            self.log_message(f"⚠️ Branch listesi güncellenirken hata: {e}")
+            self.branch_combo['values'] = ["main", "master", "develop"]
+
+    def apply_branches(self, directory, refs, error=None):
+        """Okunan branch'leri combo box'a uygula (ana thread)"""
+        try:
+            if directory != self.current_directory:
+                return
+            try:
+                if not self.branch_combo.winfo_exists():
+                    return
+            except tk.TclError:
+                return
+            if error is not None:
+                raise error
+            if refs is None:
+                raise Exception("Branch bilgileri okunamadı")
+            local_branches = refs.local
+            remote_branches = refs.remote_branches("origin")
             
             # Tüm branch'leri birleştir ve tekrarları kaldır
             all_branches = list(set(local_branches + remote_branches))
@@ -1965,17 +5403,14 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             self.branch_combo['values'] = all_branches
             
             # Mevcut branch'ı seç
-            current_result = subprocess.run("git branch --show-current", shell=True, capture_output=True, text=True, timeout=5)
-            if current_result.returncode == 0 and current_result.stdout.strip():
-                current_branch = current_result.stdout.strip()
+            if refs.current:
+                current_branch = refs.current
                 if current_branch in all_branches:
                     self.selected_branch.set(current_branch)
                     self.log_message(f"🌿 Aktif branch: {current_branch}")
             
             self.log_message(f"🔄 Branch listesi güncellendi: {len(all_branches)} branch bulundu")
             
-            os.chdir(original_dir)
-            
         except Exception as e:
             self.log_message(f"⚠️ Branch listesi güncellenirken hata: {e}")
             self.branch_combo['values'] = ["main", "master", "develop"]
@@ -2000,123 +5435,135 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             if result:
                 self.log_message("🧹 Repository temizleme başlatılıyor...")
                 
-                original_dir = os.getcwd()
-                os.chdir(self.current_directory)
-                
-                # Git cache temizle
-                self.log_message("🗑️ Git cache temizleniyor...")
-                subprocess.run("git gc", shell=True, capture_output=True, text=True, timeout=30)
-                
-                # Git ignore güncelle
-                gitignore_path = os.path.join(self.current_directory, ".gitignore")
-                if not os.path.exists(gitignore_path):
-                    self.log_message("📝 .gitignore oluşturuluyor...")
-                    with open(gitignore_path, "w", encoding="utf-8") as f:
-                        f.write("# GitAuto tarafından oluşturuldu\n")
-                        f.write("# Dependencies\n")
-                        f.write("node_modules/\n")
-                        f.write("npm-debug.log*\n")
-                        f.write("yarn-debug.log*\n")
-                        f.write("yarn-error.log*\n")
-                        f.write("package-lock.json\n")
-                        f.write("yarn.lock\n")
-                        f.write("\n# Build outputs\n")
-                        f.write("build/\n")
-                        f.write("dist/\n")
-                        f.write("out/\n")
-                        f.write("target/\n")
-                        f.write("*.exe\n")
-                        f.write("*.msi\n")
-                        f.write("*.dmg\n")
-                        f.write("*.app\n")
-                        f.write("\n# Large files\n")
-                        f.write("*.zip\n")
-                        f.write("*.tar.gz\n")
-                        f.write("*.rar\n")
-                        f.write("*.7z\n")
-                        f.write("*.iso\n")
-                        f.write("*.dmg\n")
-                        f.write("*.pkg\n")
-                        f.write("\n# Python\n")
-                        f.write("__pycache__/\n")
-                        f.write("*.pyc\n")
-                        f.write("*.pyo\n")
-                        f.write("*.pyd\n")
-                        f.write("*.so\n")
-                        f.write("\n# IDE\n")
-                        f.write(".vscode/\n")
-                        f.write(".idea/\n")
-                        f.write("*.swp\n")
-                        f.write("*.swo\n")
-                        f.write("\n# Logs\n")
-                        f.write("*.log\n")
-                        f.write("logs/\n")
-                        f.write("*.pid\n")
-                        f.write("*.seed\n")
-                        f.write("\n# OS\n")
-                        f.write(".DS_Store\n")
-                        f.write("Thumbs.db\n")
-                        f.write("desktop.ini\n")
-                        f.write("\n# Cache\n")
-                        f.write(".cache/\n")
-                        f.write("*.cache\n")
-                        f.write("tmp/\n")
-                        f.write("temp/\n")
-                
-                # Büyük dosyaları tespit et ve filtrele
-                self.log_message("🔍 Büyük dosyalar tespit ediliyor...")
-                self.detect_and_filter_large_files()
-                
-                # Gereksiz dosyaları kaldır
-                self.log_message("📁 Gereksiz dosyalar kaldırılıyor...")
-                
-                # Önce büyük dosyaları Git cache'inden kaldır
-                self.log_message("🗑️ Büyük dosyalar Git cache'inden kaldırılıyor...")
-                self.remove_large_files_from_git()
-                
-                # Tüm dosyaları cache'den kaldır
-                subprocess.run("git rm -r --cached .", shell=True, capture_output=True, text=True, timeout=30)
-                
-                # .gitignore'ı güncelle ve tekrar ekle
-                subprocess.run("git add .gitignore", shell=True, capture_output=True, text=True, timeout=10)
-                
-                # Temizlenmiş dosyaları ekle
-                subprocess.run("git add .", shell=True, capture_output=True, text=True, timeout=60)
-                
-                # Commit (konfigürasyon kontrolü ile)
-                self.log_message("💾 Temizlik commit'i yapılıyor...")
-                
-                # Git konfigürasyonunu kontrol et
-                user_result = subprocess.run("git config user.name", shell=True, capture_output=True, text=True, timeout=5)
-                if user_result.returncode != 0 or not user_result.stdout.strip():
-                    subprocess.run('git config user.name "GitAuto"', shell=True, capture_output=True, text=True, timeout=5)
-                
-                email_result = subprocess.run("git config user.email", shell=True, capture_output=True, text=True, timeout=5)
-                if email_result.returncode != 0 or not email_result.stdout.strip():
-                    subprocess.run('git config user.email "gitauto@users.noreply.github.com"', shell=True, capture_output=True, text=True, timeout=5)
-                
-                commit_result = subprocess.run('git commit -m "Repository temizlendi - GitAuto"', 
-                             shell=True, capture_output=True, text=True, timeout=30)
-                
-                if commit_result.returncode != 0:
-                    self.log_message("⚠️ Commit hatası, alternatif yöntem deneniyor...")
-                    subprocess.run('git commit -m "Repository temizlendi - GitAuto" --allow-empty', 
-                                 shell=True, capture_output=True, text=True, timeout=30)
-                
-                os.chdir(original_dir)
-                
-                self.log_message("✅ Repository başarıyla temizlendi!")
-                messagebox.showinfo("Başarılı! 🎉", "Repository temizlendi!\n\nArtık daha hızlı çalışacak.")
+                # gc ve add uzun sürebilir; arayüzü kilitlememek için arka planda çalıştır
+                repo_dir = self.current_directory
+                self.run_in_background(self.clean_repository_worker, repo_dir, repo=repo_dir,
+                                       key=self.repo_job_key("clean", repo_dir), mutating=True,
+                                       priority=JobScheduler.PRIORITY_MAINTENANCE)
                 
         except Exception as e:
             self.log_message(f"❌ Repository temizleme hatası: {e}")
             messagebox.showerror("Hata", f"Repository temizleme hatası:\n{e}")
 
-    def detect_and_filter_large_files(self):
-        """Büyük dosyaları tespit et ve .gitignore'a ekle"""
+    def clean_repository_worker(self, repo_dir):
+        """Repository temizleme işlemi - arka planda çalışır"""
+        try:
+            # Git cache temizle
+            self.log_message("🗑️ Git cache temizleniyor...")
+            self.run_git_streaming(["gc"], repo_dir, timeout=60)
+            
+            # Git ignore güncelle
+            gitignore_path = os.path.join(repo_dir, ".gitignore")
+            if not os.path.exists(gitignore_path):
+                self.log_message("📝 .gitignore oluşturuluyor...")
+                with open(gitignore_path, "w", encoding="utf-8") as f:
+                    f.write("# GitAuto tarafından oluşturuldu\n")
+                    f.write("# Dependencies\n")
+                    f.write("node_modules/\n")
+                    f.write("npm-debug.log*\n")
+                    f.write("yarn-debug.log*\n")
+                    f.write("yarn-error.log*\n")
+                    f.write("package-lock.json\n")
+                    f.write("yarn.lock\n")
+                    f.write("\n# Build outputs\n")
+                    f.write("build/\n")
+                    f.write("dist/\n")
+                    f.write("out/\n")
+                    f.write("target/\n")
+                    f.write("*.exe\n")
+                    f.write("*.msi\n")
+                    f.write("*.dmg\n")
+                    f.write("*.app\n")
+                    f.write("\n# Large files\n")
+                    f.write("*.zip\n")
+                    f.write("*.tar.gz\n")
+                    f.write("*.rar\n")
+                    f.write("*.7z\n")
+                    f.write("*.iso\n")
+                    f.write("*.dmg\n")
+                    f.write("*.pkg\n")
+                    f.write("\n# Python\n")
+                    f.write("__pycache__/\n")
+                    f.write("*.pyc\n")
+                    f.write("*.pyo\n")
+                    f.write("*.pyd\n")
+                    f.write("*.so\n")
+                    f.write("\n# IDE\n")
+                    f.write(".vscode/\n")
+                    f.write(".idea/\n")
+                    f.write("*.swp\n")
+                    f.write("*.swo\n")
+                    f.write("\n# Logs\n")
+                    f.write("*.log\n")
+                    f.write("logs/\n")
+                    f.write("*.pid\n")
+                    f.write("*.seed\n")
+                    f.write("\n# OS\n")
+                    f.write(".DS_Store\n")
+                    f.write("Thumbs.db\n")
+                    f.write("desktop.ini\n")
+                    f.write("\n# Cache\n")
+                    f.write(".cache/\n")
+                    f.write("*.cache\n")
+                    f.write("tmp/\n")
+                    f.write("temp/\n")
+            
+            # Büyük dosyaları tespit et ve filtrele
+            self.log_message("🔍 Büyük dosyalar tespit ediliyor...")
+            self.detect_and_filter_large_files(repo_dir)
+            
+            # Gereksiz dosyaları kaldır
+            self.log_message("📁 Gereksiz dosyalar kaldırılıyor...")
+            
+            # Önce büyük dosyaları Git cache'inden kaldır
+            self.log_message("🗑️ Büyük dosyalar Git cache'inden kaldırılıyor...")
+            self.remove_large_files_from_git(repo_dir)
+            
+            # Tüm dosyaları cache'den kaldır
+            self.scheduler.check_cancelled()
+            self.run_git_streaming(["rm", "-r", "--cached", "-q", "."], repo_dir, timeout=120)
+            self.scheduler.check_cancelled()
+            
+            # .gitignore'ı güncelle ve tekrar ekle
+            self.run_git_streaming(["add", ".gitignore"], repo_dir, timeout=30)
+            
+            # Temizlenmiş dosyaları ekle
+            self.log_message("📁 Temizlenmiş dosyalar ekleniyor...")
+            self.run_git_streaming(["add", "."], repo_dir, timeout=120)
+            self.scheduler.check_cancelled()
+            
+            # Commit (konfigürasyon kontrolü ile)
+            self.log_message("💾 Temizlik commit'i yapılıyor...")
+            
+            # Git konfigürasyonunu kontrol et
+            self.ensure_git_identity(repo_dir, "GitAuto", "gitauto@users.noreply.github.com")
+            
+            commit_result = self.run_git_streaming(["commit", "-m", "Repository temizlendi - GitAuto"],
+                                                   repo_dir, timeout=60)
+            self.scheduler.check_cancelled()
+            
+            if commit_result.returncode != 0:
+                self.log_message("⚠️ Commit hatası, alternatif yöntem deneniyor...")
+                self.run_git_streaming(["commit", "-m", "Repository temizlendi - GitAuto", "--allow-empty"],
+                                       repo_dir, timeout=60)
+                self.scheduler.check_cancelled()
+            
+            self.invalidate_repo_snapshot(repo_dir)
+            self.log_message("✅ Repository başarıyla temizlendi!")
+            self.post_to_ui(lambda: messagebox.showinfo("Başarılı! 🎉", "Repository temizlendi!\n\nArtık daha hızlı çalışacak."))
+            
+        except JobCancelled:
+            self.log_message("⛔ Repository temizleme iptal edildi")
+            
+        except Exception as e:
+            self.log_message(f"❌ Repository temizleme hatası: {e}")
+            self.post_to_ui(lambda msg=str(e): messagebox.showerror("Hata", f"Repository temizleme hatası:\n{msg}"))
+
+    def detect_and_filter_large_files(self, repo_dir):
+        """Büyük dosyaları tespit et ve repo_dir'deki .gitignore'a ekle"""
         try:
             self.log_message("🔍 Büyük dosyalar taranıyor...")
-            gitignore_path = os.path.join(self.current_directory, ".gitignore")
+            gitignore_path = os.path.join(repo_dir, ".gitignore")
             
             # .gitignore yoksa oluştur
             if not os.path.exists(gitignore_path):
@@ -2124,7 +5571,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                     f.write("# GitAuto tarafından oluşturuldu\n")
             
             # Önce node_modules klasörünü tamamen yoksay
-            node_modules_path = os.path.join(self.current_directory, "node_modules")
+            node_modules_path = os.path.join(repo_dir, "node_modules")
             if os.path.exists(node_modules_path):
                 self.log_message("🚫 node_modules klasörü tespit edildi - tamamen yoksayılıyor")
                 
@@ -2138,8 +5585,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                 
                 # Git cache'den de kaldır
                 try:
-                    subprocess.run("git rm -r --cached node_modules", shell=True, 
-                                 capture_output=True, text=True, cwd=self.current_directory, timeout=30)
+                    self.git.run(["rm", "-r", "--cached", "node_modules"], cwd=repo_dir, timeout=30)
                     self.log_message("✅ node_modules Git cache'den kaldırıldı")
                 except:
                     pass
@@ -2147,36 +5593,35 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
             large_file_threshold = 50 * 1024 * 1024  # 50MB
             large_files = []
             
-            # Proje klasöründeki tüm dosyaları tara
-            for root, dirs, files in os.walk(self.current_directory):
-                # .git ve node_modules klasörlerini atla
-                if '.git' in dirs:
-                    dirs.remove('.git')
+            # Eklenecek dosyaları tara: git deposunda git index'i, değilse budayan tarayıcı.
+            # Yerleşik liste uygulanmaz; git add'in göreceği her dosya kontrol edilmeli
+            for rel_dir, dirs, files in iter_project_files(repo_dir, include_builtin=False):
+                # node_modules her durumda atlanır
                 if 'node_modules' in dirs:
                     dirs.remove('node_modules')
                 
-                for file in files:
-                    file_path = os.path.join(root, file)
+                directory = record_directory(rel_dir)
+                for entry in files:
                     try:
-                        file_size = os.path.getsize(file_path)
+                        file_size = entry.stat().st_size
                         if file_size > large_file_threshold:
-                            # Dosya yolını proje klasörüne göre relatif yap
-                            rel_path = os.path.relpath(file_path, self.current_directory)
-                            large_files.append((rel_path, file_size))
+                            # Dosya yolu proje klasörüne göre relatif tutulur
+                            large_files.append(FileRecord(directory, entry.name, file_size))
                     except (OSError, PermissionError):
                         continue
             
             if large_files:
                 self.log_message(f"🚨 {len(large_files)} büyük dosya tespit edildi:")
-                for file_path, file_size in sorted(large_files, key=lambda x: x[1], reverse=True):
-                    size_mb = file_size / (1024 * 1024)
-                    self.log_message(f"  📁 {file_path} ({size_mb:.1f} MB)")
+                for record in sorted(large_files, key=lambda r: r.size, reverse=True):
+                    size_mb = record.size / (1024 * 1024)
+                    self.log_message(f"  📁 {record.path} ({size_mb:.1f} MB)")
                 
                 # .gitignore dosyasını güncelle
                 if os.path.exists(gitignore_path):
                     with open(gitignore_path, "a", encoding="utf-8") as f:
                         f.write("\n# Large files detected by GitAuto\n")
-                        for file_path, _ in large_files:
+                        for record in large_files:
+                            file_path = record.path
                             # Dosya yolını .gitignore formatına çevir
                             if os.path.sep == '\\':  # Windows
                                 file_path = file_path.replace('\\', '/')
@@ -2191,28 +5636,24 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         except Exception as e:
             self.log_message(f"⚠️ Büyük dosya tespiti sırasında hata: {e}")
 
-    def remove_large_files_from_git(self):
-        """Git cache'inden büyük dosyaları kaldır"""
+    def remove_large_files_from_git(self, repo_dir):
+        """repo_dir'in Git cache'inden büyük dosyaları kaldır"""
         try:
             # Git cache'deki büyük dosyaları bul
             self.log_message("🔍 Git cache'deki büyük dosyalar aranıyor...")
             
-            # Git ls-files ile cache'deki dosyaları listele
-            result = subprocess.run("git ls-files", shell=True, capture_output=True, 
-                                  text=True, cwd=self.current_directory, timeout=30)
+            # Git ls-files ile cache'deki dosyaları listele (-z: özel karakterli yollar tırnaklanmaz)
+            tracked = self.git.run_z(["ls-files", "-z"], cwd=repo_dir, timeout=30)
             
-            if result.returncode != 0:
+            if tracked is None:
                 self.log_message("⚠️ Git cache listesi alınamadı")
                 return
             
             large_files_in_git = []
             large_file_threshold = 50 * 1024 * 1024  # 50MB
             
-            for line in result.stdout.strip().split('\n'):
-                if not line.strip():
-                    continue
-                
-                file_path = os.path.join(self.current_directory, line)
+            for line in tracked:
+                file_path = os.path.join(repo_dir, line)
                 if os.path.exists(file_path):
                     try:
                         file_size = os.path.getsize(file_path)
@@ -2230,14 +5671,13 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                     
                     # Büyük dosyayı Git cache'inden kaldır
                     try:
-                        subprocess.run(f'git rm --cached "{file_path}"', shell=True, 
-                                     capture_output=True, text=True, cwd=self.current_directory, timeout=10)
+                        self.git.run(["rm", "--cached", "--", file_path], cwd=repo_dir, timeout=10)
                         self.log_message(f"  ✅ {file_path} Git cache'den kaldırıldı")
                     except Exception as e:
                         self.log_message(f"  ❌ {file_path} kaldırılamadı: {e}")
                 
                 # .gitignore'a ekle
-                gitignore_path = os.path.join(self.current_directory, ".gitignore")
+                gitignore_path = os.path.join(repo_dir, ".gitignore")
                 if os.path.exists(gitignore_path):
                     with open(gitignore_path, "a", encoding="utf-8") as f:
                         f.write("\n# Large files removed from Git cache\n")
@@ -2254,16 +5694,17 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                     self.log_message("🚫 node_modules klasörü Git cache'den kaldırılıyor...")
                     try:
                         # Önce tüm node_modules dosyalarını tek tek kaldır
-                        subprocess.run("git rm -r --cached node_modules", shell=True, 
-                                     capture_output=True, text=True, cwd=self.current_directory, timeout=30)
+                        self.git.run(["rm", "-r", "--cached", "node_modules"], cwd=repo_dir, timeout=30)
                         
-                        # Git history'den de temizle (daha agresif)
-                        subprocess.run("git filter-branch --force --index-filter 'git rm -r --cached --ignore-unmatch node_modules' --prune-empty --tag-name-filter cat -- --all", 
-                                     shell=True, capture_output=True, text=True, cwd=self.current_directory, timeout=60)
+                        # Git history'den de temizle (daha agresif); index-filter git'in kendi kabuğunda çalışır
+                        self.git.run(["filter-branch", "--force",
+                                      "--index-filter", "git rm -r --cached --ignore-unmatch node_modules",
+                                      "--prune-empty", "--tag-name-filter", "cat", "--", "--all"],
+                                     cwd=repo_dir, timeout=60,
+                                     env={"FILTER_BRANCH_SQUELCH_WARNING": "1"})
                         
                         # Git garbage collection yap
-                        subprocess.run("git gc --prune=now", shell=True, 
-                                     capture_output=True, text=True, cwd=self.current_directory, timeout=30)
+                        self.run_git_streaming(["gc", "--prune=now"], repo_dir, timeout=60)
                         
                         self.log_message("✅ node_modules klasörü Git history'den tamamen temizlendi")
                     except Exception as e:
@@ -2272,10 +5713,8 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                         # Alternatif yöntem: Force clean
                         self.log_message("🔄 Alternatif temizlik yöntemi deneniyor...")
                         try:
-                            subprocess.run("git clean -fdx", shell=True, 
-                                         capture_output=True, text=True, cwd=self.current_directory, timeout=30)
-                            subprocess.run("git reset --hard HEAD", shell=True, 
-                                         capture_output=True, text=True, cwd=self.current_directory, timeout=30)
+                            self.git.run(["clean", "-fdx"], cwd=repo_dir, timeout=30)
+                            self.git.run(["reset", "--hard", "HEAD"], cwd=repo_dir, timeout=30)
                             self.log_message("✅ Alternatif temizlik tamamlandı")
                         except Exception as e2:
                             self.log_message(f"❌ Alternatif temizlik de başarısız: {e2}")
@@ -2284,18 +5723,17 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                             self.log_message("🚨 Son çare: Repository tamamen yeniden başlatılıyor...")
                             try:
                                 # .git klasörünü yedekle
-                                git_backup = os.path.join(self.current_directory, ".git_backup")
-                                if os.path.exists(os.path.join(self.current_directory, ".git")):
+                                git_backup = os.path.join(repo_dir, ".git_backup")
+                                if os.path.exists(os.path.join(repo_dir, ".git")):
                                     import shutil
-                                    shutil.move(os.path.join(self.current_directory, ".git"), git_backup)
+                                    shutil.move(os.path.join(repo_dir, ".git"), git_backup)
                                     self.log_message("✅ .git klasörü yedeklendi")
                                 
                                 # Yeni repository başlat
-                                subprocess.run("git init", shell=True, 
-                                             capture_output=True, text=True, cwd=self.current_directory, timeout=10)
+                                self.git.run(["init"], cwd=repo_dir, timeout=10)
                                 
                                 # .gitignore'ı güncelle
-                                self.update_gitignore_for_large_files()
+                                self.update_gitignore_for_large_files(repo_dir)
                                 
                                 self.log_message("✅ Repository yeniden başlatıldı")
                                 self.log_message("💡 Artık büyük dosyalar olmadan commit yapabilirsiniz")
@@ -2305,7 +5743,7 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
                                 # Yedekten geri yükle
                                 if os.path.exists(git_backup):
                                     import shutil
-                                    shutil.move(git_backup, os.path.join(self.current_directory, ".git"))
+                                    shutil.move(git_backup, os.path.join(repo_dir, ".git"))
                                     self.log_message("✅ .git klasörü yedekten geri yüklendi")
             else:
                 self.log_message("✅ Git cache'de büyük dosya bulunamadı")
@@ -2313,139 +5751,13 @@ Kod analizinden çıkan bilgileri kullanarak gerçek proje yapısını yansıt.
         except Exception as e:
             self.log_message(f"⚠️ Git cache temizliği sırasında hata: {e}")
 
-    def update_gitignore_for_large_files(self):
-        """Büyük dosyalar için kapsamlı .gitignore oluştur"""
+    def update_gitignore_for_large_files(self, repo_dir):
+        """repo_dir için kapsamlı .gitignore oluştur"""
         try:
-            gitignore_path = os.path.join(self.current_directory, ".gitignore")
+            gitignore_path = os.path.join(repo_dir, ".gitignore")
             
             # Kapsamlı .gitignore içeriği
-            gitignore_content = """# GitAuto tarafından oluşturuldu - Büyük dosyalar için optimize edildi
-
-# Dependencies
-node_modules/
-npm-debug.log*
-yarn-debug.log*
-yarn-error.log*
-package-lock.json
-yarn.lock
-pnpm-lock.yaml
-
-# Build outputs
-build/
-dist/
-out/
-target/
-*.exe
-*.msi
-*.dmg
-*.app
-*.deb
-*.rpm
-*.pkg
-
-# Large files
-*.zip
-*.tar.gz
-*.rar
-*.7z
-*.iso
-*.dmg
-*.pkg
-*.bin
-*.dat
-*.db
-*.sqlite
-*.sqlite3
-
-# Python
-__pycache__/
-*.pyc
-*.pyo
-*.pyd
-*.so
-*.egg
-*.egg-info/
-*.whl
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
-*~
-
-# Logs
-*.log
-logs/
-*.pid
-*.seed
-*.out
-
-# OS
-.DS_Store
-Thumbs.db
-desktop.ini
-*.tmp
-*.temp
-
-# Cache
-.cache/
-*.cache
-tmp/
-temp/
-.tmp/
-
-# Electron specific
-node_modules/electron/
-node_modules/electron-builder/
-node_modules/electron-packager/
-
-# Large media files
-*.mp4
-*.avi
-*.mov
-*.wmv
-*.flv
-*.mkv
-*.webm
-*.mp3
-*.wav
-*.flac
-*.aac
-*.ogg
-
-# Archives
-*.zip
-*.tar
-*.gz
-*.bz2
-*.xz
-*.rar
-*.7z
-*.lzma
-*.lz4
-
-# Database files
-*.db
-*.sqlite
-*.sqlite3
-*.mdb
-*.accdb
-
-# Virtual environments
-venv/
-env/
-.venv/
-.env/
-ENV/
-
-# Backup files
-*.bak
-*.backup
-*.old
-*.orig
-*.save
-"""
+            gitignore_content = GITAUTO_GITIGNORE_TEMPLATE
             
             with open(gitignore_path, "w", encoding="utf-8") as f:
                 f.write(gitignore_content)
@@ -2468,62 +5780,69 @@ ENV/
             messagebox.showerror("Hata", f"Branch adında geçersiz karakterler var!\nGeçersiz karakterler: {' '.join(invalid_chars)}")
             return
         
+        def branch_created():
+            # Yeni branch'i hedef branch listesine ekle (ana thread)
+            current_values = list(self.branch_combo['values'])
+            if branch_name not in current_values:
+                current_values.append(branch_name)
+                current_values.sort()
+                self.branch_combo['values'] = current_values
+            
+            # Yeni branch'i otomatik seç
+            self.selected_branch.set(branch_name)
+            self.log_message(f"🎯 Hedef branch otomatik '{branch_name}' olarak seçildi")
+            
+            self.new_branch_var.set("")
+            
+            # Başarı mesajı
+            messagebox.showinfo(
+                "Başarılı! 🎉",
+                f"🌱 Branch '{branch_name}' başarıyla oluşturuldu!\n\n"
+                f"✅ Otomatik olarak hedef branch seçildi\n"
+                f"🚀 Artık yayınlama yapabilirsiniz"
+            )
+        
+        repo_dir = self.current_directory
+        
         def create_branch():
             try:
                 self.log_message(f"🌱 Yeni branch oluşturuluyor: {branch_name}")
                 
-                if not os.path.exists(os.path.join(self.current_directory, ".git")):
+                if not os.path.exists(os.path.join(repo_dir, ".git")):
                     self.log_message("❌ Git repository henüz başlatılmamış!")
-                    self.root.after(0, lambda: messagebox.showerror("Hata", "Git repository henüz başlatılmamış!\nÖnce 'Repository Bağla' butonunu kullanın."))
+                    self.post_to_ui(lambda: messagebox.showerror("Hata", "Git repository henüz başlatılmamış!\nÖnce 'Repository Bağla' butonunu kullanın."))
                     return
                 
-                result = subprocess.run(f"git checkout -b {branch_name}", shell=True, 
-                                     capture_output=True, text=True, cwd=self.current_directory, timeout=15)
+                result = self.git.run(["checkout", "-b", branch_name], cwd=repo_dir, timeout=15)
                 
+                self.invalidate_repo_snapshot(repo_dir)
                 if result.returncode == 0:
                     self.log_message(f"✅ Branch '{branch_name}' başarıyla oluşturuldu!")
-                    
-                    # Yeni branch'i hedef branch listesine ekle
-                    current_values = list(self.branch_combo['values'])
-                    if branch_name not in current_values:
-                        current_values.append(branch_name)
-                        current_values.sort()
-                        self.branch_combo['values'] = current_values
-                    
-                    # Yeni branch'i otomatik seç
-                    self.selected_branch.set(branch_name)
-                    self.log_message(f"🎯 Hedef branch otomatik '{branch_name}' olarak seçildi")
-                    
-                    self.new_branch_var.set("")
-                    
-                    # Başarı mesajı
-                    self.root.after(0, lambda: messagebox.showinfo(
-                        "Başarılı! 🎉",
-                        f"🌱 Branch '{branch_name}' başarıyla oluşturuldu!\n\n"
-                        f"✅ Otomatik olarak hedef branch seçildi\n"
-                        f"🚀 Artık yayınlama yapabilirsiniz"
-                    ))
+                    self.post_to_ui(branch_created)
                     
                 else:
                     error_msg = result.stderr or "Bilinmeyen hata"
                     if "already exists" in error_msg:
                         self.log_message(f"⚠️ Branch '{branch_name}' zaten mevcut!")
-                        self.selected_branch.set(branch_name)
+                        self.post_to_ui(self.selected_branch.set, branch_name)
                         self.log_message(f"🎯 Mevcut branch '{branch_name}' hedef olarak seçildi")
                     else:
                         self.log_message(f"❌ Branch oluşturma hatası: {error_msg}")
-                        self.root.after(0, lambda: messagebox.showerror("Hata", f"Branch oluşturma hatası:\n{error_msg}"))
+                        self.post_to_ui(lambda: messagebox.showerror("Hata", f"Branch oluşturma hatası:\n{error_msg}"))
                         
             except Exception as e:
                 error_msg = str(e)  # Hata mesajını string olarak sakla
                 self.log_message(f"❌ Branch oluşturma hatası: {error_msg}")
-                self.root.after(0, lambda: messagebox.showerror("Hata", f"Branch oluşturma hatası:\n{error_msg}"))
+                self.post_to_ui(lambda: messagebox.showerror("Hata", f"Branch oluşturma hatası:\n{error_msg}"))
         
-        # Thread'de çalıştır
-        threading.Thread(target=create_branch, daemon=True).start()
+        # Arka planda çalıştır (aynı repository'deki yazan işlerle sıralı)
+        self.run_in_background(create_branch, key=("create-branch", repo_dir, branch_name),
+                               repo=repo_dir, mutating=True)
 
     def list_branches(self):
         """Mevcut branch'leri listele"""
+        repo_dir = self.current_directory
+        
         def list_branches_thread():
             try:
                 self.log_message("📋 Mevcut branch'ler listeleniyor...")
@@ -2532,26 +5851,23 @@ ENV/
                     self.log_message("ℹ️  Git repository henüz başlatılmamış")
                     return
                 
-                result = subprocess.run("git branch", shell=True, capture_output=True, 
-                                     text=True, cwd=self.current_directory)
+                refs = self.get_ref_reader().read(repo_dir)
                 
-                if result.returncode == 0 and result.stdout:
+                if refs is not None and refs.local:
                     self.log_message("🌿 Mevcut Branch'ler:")
                     self.log_message("-" * 30)
-                    branches = result.stdout.strip().split('\n')
-                    for branch in branches:
-                        if branch.strip():
-                            if branch.startswith('*'):
-                                self.log_message(f"  🌟 {branch.strip()} (aktif)")
-                            else:
-                                self.log_message(f"     {branch.strip()}")
+                    for branch in refs.local:
+                        if branch == refs.current:
+                            self.log_message(f"  🌟 * {branch} (aktif)")
+                        else:
+                            self.log_message(f"     {branch}")
                 else:
                     self.log_message("ℹ️  Henüz branch bulunamadı")
                     
             except Exception as e:
                 self.log_message(f"❌ Branch listeleme hatası: {e}")
         
-        threading.Thread(target=list_branches_thread, daemon=True).start()
+        self.run_in_background(list_branches_thread, key=("list-branches", repo_dir), repo=repo_dir)
 
     def start_publication(self):
         """Repository yayınlama işlemini başlat - Tüm dosyalar"""
@@ -2598,23 +5914,27 @@ ENV/
         self.main_button.config(state="disabled")
         self.progress.start()
         
-        # Thread'de çalıştır - Tüm dosyalar için
-        threading.Thread(target=self.publish_repository, daemon=True).start()
+        # Arka planda çalıştır - Tüm dosyalar için (aynı repository'deki yazan işlerle sıralı)
+        repo_dir = self.current_directory
+        settings = self.collect_repo_settings()
+        self.run_in_background(self.publish_repository, repo_dir, settings,
+                               key=self.repo_job_key("publish", repo_dir, settings),
+                               repo=repo_dir, mutating=True)
 
-    def publish_repository(self):
+    def publish_repository(self, repo_dir, settings):
         """Tüm dosyaları yayınla - Son adım"""
         try:
-            project_name = self.project_name.get().strip()
-            github_username = self.github_username.get().strip()
-            commit_message = self.commit_message.get().strip() or "Final commit - Tüm dosyalar yayınlandı"
-            target_branch = self.selected_branch.get() or "main"
+            project_name = settings["project_name"]
+            github_username = settings["github_username"]
+            commit_message = settings["commit_message"] or "Final commit - Tüm dosyalar yayınlandı"
+            target_branch = settings["target_branch"]
             
             repo_url = f"https://github.com/{github_username}/{project_name}.git"
             
             self.log_message("🚀 Tüm dosyalar yayınlanıyor...")
             
             # Git repository kontrolü
-            git_dir = os.path.join(self.current_directory, ".git")
+            git_dir = os.path.join(repo_dir, ".git")
             if not os.path.exists(git_dir):
                 self.log_message("❌ Git repository bulunamadı! Önce 'Repository Bağla' kullanın.")
                 raise Exception("Git repository bulunamadı! Önce 'Repository Bağla' kullanın.")
@@ -2622,28 +5942,22 @@ ENV/
             # Git konfigürasyonunu kontrol et
             self.log_message("⚙️ Git konfigürasyonu kontrol ediliyor...")
             
-            user_result = subprocess.run("git config user.name", shell=True, capture_output=True, 
-                                       text=True, cwd=self.current_directory, timeout=5)
-            if user_result.returncode != 0 or not user_result.stdout.strip():
-                subprocess.run(f'git config user.name "{github_username}"', shell=True, 
-                             capture_output=True, text=True, cwd=self.current_directory, timeout=5)
+            configured = self.ensure_git_identity(repo_dir, github_username,
+                                                  f"{github_username}@users.noreply.github.com")
+            if "user.name" in configured:
                 self.log_message("👤 Git user.name ayarlandı")
-            
-            email_result = subprocess.run("git config user.email", shell=True, capture_output=True, 
-                                        text=True, cwd=self.current_directory, timeout=5)
-            if email_result.returncode != 0 or not email_result.stdout.strip():
-                subprocess.run(f'git config user.email "{github_username}@users.noreply.github.com"', 
-                             shell=True, capture_output=True, text=True, cwd=self.current_directory, timeout=5)
+            if "user.email" in configured:
                 self.log_message("📧 Git user.email ayarlandı")
             
             # Büyük dosyaları kontrol et ve filtrele
             self.log_message("🔍 Büyük dosyalar kontrol ediliyor...")
-            self.detect_and_filter_large_files()
+            self.detect_and_filter_large_files(repo_dir)
             
             # Tüm dosyaları ekle (büyük dosyalar hariç)
+            self.scheduler.check_cancelled()
             self.log_message("📁 Tüm dosyalar ekleniyor...")
-            result = subprocess.run("git add .", shell=True, capture_output=True, 
-                                 text=True, cwd=self.current_directory, timeout=120)
+            result = self.run_git_streaming(["add", "."], repo_dir, timeout=120)
+            self.scheduler.check_cancelled()
             
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else "Bilinmeyen git add hatası"
@@ -2654,20 +5968,22 @@ ENV/
             
             # Commit yap
             self.log_message(f"💾 Final commit atılıyor: {commit_message}")
-            result = subprocess.run(f'git commit -m "{commit_message}"', shell=True, 
-                                 capture_output=True, text=True, cwd=self.current_directory, timeout=15)
+            result = self.run_git_streaming(["commit", "-m", commit_message], repo_dir, timeout=60)
+            self.scheduler.check_cancelled()
             
             if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "Bilinmeyen commit hatası"
+                error_msg = result.stderr.strip() or result.stdout.strip() or "Bilinmeyen commit hatası"
                 self.log_message(f"⚠️ Commit hatası: {error_msg}")
                 raise Exception(f"Commit hatası: {error_msg}")
             
             self.log_message("✅ Final commit başarıyla atıldı")
             
             # Push işlemi
+            self.scheduler.check_cancelled()
             self.log_message(f"🚀 '{target_branch}' branch'i GitHub'a push ediliyor...")
-            result = subprocess.run(f"git push origin {target_branch}", shell=True, capture_output=True, 
-                                 text=True, cwd=self.current_directory, timeout=180)
+            result = self.run_git_streaming(["push", "--progress", "origin", target_branch],
+                                            repo_dir, timeout=180)
+            self.scheduler.check_cancelled()
             
             if result.returncode != 0:
                 error_msg = result.stderr.strip() if result.stderr else "Bilinmeyen push hatası"
@@ -2678,7 +5994,7 @@ ENV/
             self.log_message("🎉 Proje tamamen yayınlandı!")
             
             # Başarı mesajı göster
-            self.root.after(0, lambda: messagebox.showinfo(
+            self.post_to_ui(lambda: messagebox.showinfo(
                 "Başarılı! 🎉",
                 f"✅ Tüm dosyalar başarıyla yayınlandı!\n\n"
                 f"📍 Repository: {repo_url}\n"
@@ -2687,13 +6003,17 @@ ENV/
                 "🚀 Proje tamamen yayınlandı!"
             ))
             
+        except JobCancelled:
+            self.log_message("⛔ Yayınlama iptal edildi")
+        
         except Exception as e:
             self.log_message(f"❌ Dosya yayınlama hatası: {e}")
-            self.root.after(0, lambda: messagebox.showerror("Hata", f"Dosya yayınlama hatası:\n{e}"))
+            self.post_to_ui(lambda msg=str(e): messagebox.showerror("Hata", f"Dosya yayınlama hatası:\n{msg}"))
         
         finally:
             # UI'ı güncelle
-            self.root.after(0, self.publication_finished)
+            self.invalidate_repo_snapshot(repo_dir)
+            self.post_to_ui(self.publication_finished)
 
 
 
@@ -2715,29 +6035,32 @@ ENV/
             except tk.TclError:
                 pass  # Widget referans hatası durumunda sessizce devam et
         
-        self.progress.stop()
+        self.reset_git_progress()
         self.check_git_status()
 
-    def list_folder_contents(self):
-        """Seçilen klasördeki dosyaları listele"""
+    def list_folder_contents(self, directory=None):
+        """Seçilen klasördeki dosyaları log'a listele; README.md var mı döndür (hata/klasör yoksa None)"""
+        directory = directory or self.current_directory
         try:
-            if not os.path.exists(self.current_directory):
-                return
+            if not os.path.exists(directory):
+                return None
             
-            self.log_message(f"📋 Klasör içeriği ({self.current_directory}):")
+            self.log_message(f"📋 Klasör içeriği ({directory}):")
             self.log_message("-" * 50)
             
-            # Dosya ve klasörleri listele
-            items = os.listdir(self.current_directory)
+            # Dosya ve klasörleri tek scandir ile listele
             files = []
             folders = []
             
-            for item in items:
-                item_path = os.path.join(self.current_directory, item)
-                if os.path.isfile(item_path):
-                    files.append(item)
-                elif os.path.isdir(item_path):
-                    folders.append(item)
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir():
+                            folders.append(entry.name)
+                        elif entry.is_file():
+                            files.append(FileRecord('', entry.name, entry.stat().st_size))
+                    except OSError:
+                        continue
             
             # Klasörleri göster
             if folders:
@@ -2748,24 +6071,24 @@ ENV/
             # Dosyaları göster
             if files:
                 self.log_message("📄 Dosyalar:")
-                for file in sorted(files):
+                for record in sorted(files, key=lambda r: r.name):
                     # Git, sistem ve gereksiz dosyaları gizle
-                    if not file.startswith('.') and file not in ['__pycache__', 'node_modules', 'build', 'dist', 'out', 'target']:
-                        self.log_message(f"  📄 {file}")
+                    if not record.name.startswith('.') and record.name not in ['__pycache__', 'node_modules', 'build', 'dist', 'out', 'target']:
+                        self.log_message(f"  📄 {record.name}")
             
-            # README.md kontrolü
-            readme_path = os.path.join(self.current_directory, "README.md")
-            if os.path.exists(readme_path):
+            # README.md kontrolü (seçenek ana thread'de buna göre ayarlanır)
+            has_readme = os.path.exists(os.path.join(directory, "README.md"))
+            if has_readme:
                 self.log_message("✅ README.md dosyası bulundu")
-                self.readme_var.set("keep")  # Otomatik olarak koru seçeneğini seç
             else:
                 self.log_message("ℹ️  README.md dosyası bulunamadı")
-                self.readme_var.set("create")  # Otomatik olarak oluştur seçeneğini seç
             
             self.log_message("-" * 50)
+            return has_readme
             
         except Exception as e:
             self.log_message(f"❌ Klasör içeriği listelenirken hata: {e}")
+            return None
 
 def main():
     """Ana uygulama - modern tasarım"""
@@ -2793,6 +6116,9 @@ def main():
         if messagebox.askokcancel("🚪 Çıkış", 
                                  "GitAuto'dan çıkmak istediğinizden emin misiniz?\n\n"
                                  "Kaydedilmemiş değişiklikler kaybolabilir."):
+            # Bekleyen işler başlamasın, sürenler ilk güvenli noktada dursun
+            app.scheduler.cancel_all()
+            app.stop_repo_watcher()
             root.destroy()
     
     root.protocol("WM_DELETE_WINDOW", on_closing)
@@ -2811,5 +6137,7 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # PyInstaller ile paketlenmiş exe'de süreç havuzu işçileri için gerekli
+    multiprocessing.freeze_support()
     main()
 